@@ -3,14 +3,35 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+import pandas as pd
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
 from .. import schemas
-from ..deps import get_parquet_store
-from ..models import StrategyContext, StrategyEngine, compute_dtw_alignment
+from ..cache import session_key
+from ..config import Settings
+from ..dataio import SESSION_METRICS_COLUMNS
+from ..deps import (
+    get_broadcaster,
+    get_coalescer,
+    get_executor,
+    get_parquet_store,
+    get_redis,
+    get_settings_dependency,
+)
+from ..etags import etag_headers, etag_matches, make_etag, not_modified
+from ..models import (
+    DTW_METRICS,
+    StrategyContext,
+    StrategyEngine,
+    compute_dtw_alignment,
+    dtw_columns,
+)
 
 router = APIRouter(prefix="/api", tags=["events"])
 
+EVENT_ANALYTICS_COLUMNS = ["track", *SESSION_METRICS_COLUMNS]
+
 
 @router.get("/health", tags=["health"])
 async def health() -> dict[str, str]:
@@ -18,16 +39,80 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/cache/stats", tags=["health"])
+async def cache_stats(store=Depends(get_parquet_store)) -> dict[str, Any]:
+    """Return hit/miss/eviction counters of the decoded table cache."""
+
+    if store.table_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **store.table_cache.stats()}
+
+
+@router.get("/redis/stats", tags=["health"])
+async def redis_stats(redis=Depends(get_redis)) -> dict[str, Any]:
+    """Return Redis cache counters and connection pool occupancy."""
+
+    return redis.stats()
+
+
+@router.get("/coalescer/stats", tags=["health"])
+async def coalescer_stats(coalescer=Depends(get_coalescer)) -> dict[str, Any]:
+    """Return how many computations were shared between concurrent requests."""
+
+    return coalescer.stats()
+
+
+@router.get("/ws/stats", tags=["health"])
+async def ws_stats(broadcaster=Depends(get_broadcaster)) -> dict[str, Any]:
+    """Return live stream, viewer and slow-consumer counters of the WebSocket fan-out."""
+
+    return broadcaster.stats()
+
+
+@router.get("/execution/stats", tags=["health"])
+async def execution_stats(executor=Depends(get_executor)) -> dict[str, Any]:
+    """Return occupancy and rejection counters of the worker pools."""
+
+    return executor.stats()
+
+
 @router.get("/events/{event_id}/analytics")
-async def event_analytics(event_id: str, store=Depends(get_parquet_store)) -> dict[str, Any]:
+async def event_analytics(
+    event_id: str,
+    store=Depends(get_parquet_store),
+    redis=Depends(get_redis),
+    settings: Settings = Depends(get_settings_dependency),
+    executor=Depends(get_executor),
+    coalescer=Depends(get_coalescer),
+    if_none_match: str | None = Header(None),
+) -> Response:
     """Return aggregate analytics for a given event/session."""
 
-    df = store.read_session(event_id)
-    if df.empty:
+    generation = store.session_generation(event_id)
+    if not generation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
+    cache_key = session_key(event_id, generation, "analytics")
+    etag = make_etag(cache_key)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    async def compute() -> bytes:
+        df = await executor.io(store.read_session, event_id, columns=EVENT_ANALYTICS_COLUMNS)
+        if df.empty:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+            )
+        return orjson.dumps(await executor.io(_summarize_event, event_id, df))
+
+    body = await coalescer.get_or_compute(
+        redis, cache_key, compute, ttl_s=settings.redis_cache_ttl_seconds
+    )
+    return Response(content=body, media_type="application/json", headers=etag_headers(etag))
 
+
+def _summarize_event(event_id: str, df: pd.DataFrame) -> dict[str, Any]:
     track = None
     if "track" in df.columns and not df["track"].isna().all():
         track = str(df["track"].iloc[0])
@@ -35,14 +120,14 @@ async def event_analytics(event_id: str, store=Depends(get_parquet_store)) -> di
     # Filter laps with a reasonable lap time to avoid outliers from pits or invalid data.
     valid_laps = df[df["lap_time_s"].between(20, 300, inclusive="both")]
     fastest = (
-        valid_laps.groupby("car_id")["lap_time_s"].min().dropna().to_dict()
+        valid_laps.groupby("car_id", observed=True)["lap_time_s"].min().dropna().to_dict()
         if not valid_laps.empty
         else {}
     )
 
     stint_summary: list[dict[str, Any]] = []
     if {"car_id", "tire_set"}.issubset(df.columns):
-        grouped = df.groupby(["car_id", "tire_set"])
+        grouped = df.groupby(["car_id", "tire_set"], observed=True)
         for (car_id, tire_set), stint_df in grouped:
             if stint_df.empty:
                 continue
@@ -77,39 +162,62 @@ async def compare_driver_lap(
     metric: str = Query(
         "speed_kph", description="Telemetry metric column to align using DTW"
     ),
+    response: Response,
     store=Depends(get_parquet_store),
-) -> dict[str, Any]:
+    executor=Depends(get_executor),
+    if_none_match: str | None = Header(None),
+) -> Any:
     """Compare two drivers on a specific lap using Dynamic Time Warping."""
 
-    df = store.read_session(event_id)
-    if df.empty:
+    generation = store.session_generation(event_id)
+    if not generation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
 
-    required_columns = {"car_id", "lap", metric}
-    missing = required_columns.difference(df.columns)
-    if missing:
+    if metric not in DTW_METRICS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Missing telemetry columns: {', '.join(sorted(missing))}",
+            detail=f"Metric {metric!r} cannot be aligned; use one of {sorted(DTW_METRICS)}",
+        )
+
+    etag = make_etag(
+        session_key(
+            event_id, generation, "lap-comparison", driver_id, reference_driver_id, lap, metric
         )
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
 
-    driver_lap = df[(df["car_id"] == driver_id) & (df["lap"] == lap)]
+    # Only the two laps being compared, and only what the alignment reads.
+    df = await executor.io(
+        store.read_session,
+        event_id,
+        columns=list(dict.fromkeys(["car_id", *dtw_columns(metric)])),
+        filters=[
+            ("car_id", "isin", [driver_id, reference_driver_id]),
+            ("lap", "eq", lap),
+        ],
+    )
+
+    driver_lap = df[df["car_id"] == driver_id]
     if driver_lap.empty:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Driver lap not found",
         )
 
-    reference_lap = df[(df["car_id"] == reference_driver_id) & (df["lap"] == lap)]
+    reference_lap = df[df["car_id"] == reference_driver_id]
     if reference_lap.empty:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reference driver lap not found",
         )
 
-    comparison = compute_dtw_alignment(driver_lap, reference_lap, value_column=metric)
+    comparison = await executor.cpu(
+        compute_dtw_alignment, driver_lap, reference_lap, value_column=metric
+    )
 
     return {
         "event_id": event_id,
@@ -126,7 +234,11 @@ async def event_strategy(
     event_id: str,
     payload: schemas.StrategyRequest,
     store=Depends(get_parquet_store),
-) -> schemas.StrategyResponse:
+    redis=Depends(get_redis),
+    settings: Settings = Depends(get_settings_dependency),
+    executor=Depends(get_executor),
+    coalescer=Depends(get_coalescer),
+) -> Response:
     """Simulate a pit strategy for an event/session."""
 
     session_id = payload.session_id
@@ -136,20 +248,35 @@ async def event_strategy(
             detail="Body session_id must match the requested event",
         )
 
-    df = store.read_session(session_id)
-    if df.empty:
+    generation = store.session_generation(session_id)
+    if not generation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
         )
 
-    engine = StrategyEngine()
-    context = StrategyContext(
-        session_id=session_id,
-        target_position=payload.target_position,
-        data=df,
-    )
-    result = engine.simulate(context)
-    result["expected_gain_s"] = float(
-        max(min(result["expected_gain_s"], 60.0), -60.0)
+    async def compute() -> bytes:
+        engine = StrategyEngine()
+        df = await executor.io(store.read_session, session_id, columns=engine.required_columns)
+        if df.empty:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
+            )
+        context = StrategyContext(
+            session_id=session_id,
+            target_position=payload.target_position,
+            data=df,
+        )
+        result = await executor.cpu(engine.simulate, context)
+        result["expected_gain_s"] = float(
+            max(min(result["expected_gain_s"], 60.0), -60.0)
+        )
+        return orjson.dumps(schemas.StrategyResponse(**result).dict())
+
+    # Same key as /api/strategy/simulate, which runs the same simulation.
+    body = await coalescer.get_or_compute(
+        redis,
+        session_key(session_id, generation, "strategy", payload.target_position),
+        compute,
+        ttl_s=settings.redis_cache_ttl_seconds,
     )
-    return schemas.StrategyResponse(**result)
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,176 @@
+"""Fan-out of session replays to WebSocket viewers.
+
+Viewers of the same session and replay position share one :class:`_Stream`:
+its producer task loads the frames once, encoded a chunk at a time, and paces
+them out to every subscriber. A stream only takes new viewers until it sends
+its first frame, so every viewer receives the replay from the position it asked
+for; later viewers start a stream of their own. Each subscriber has a bounded
+buffer that its connection drains; when a viewer falls ``buffer_size`` frames
+behind, the broadcaster either drops its oldest buffered frame (``"drop"``) or
+disconnects it (``"disconnect"``), so one slow client never holds back the
+others. A stream is cancelled and forgotten when its last subscriber leaves.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass, field
+from typing import AsyncIterator, Callable
+
+import structlog
+from starlette import status
+
+logger = structlog.get_logger(__name__)
+
+DROP = "drop"
+DISCONNECT = "disconnect"
+
+StreamKey = tuple[str, int]
+# Yields the stream's frames in chunks; encoding should happen off the event loop.
+FrameLoader = Callable[[], AsyncIterator[list[str]]]
+
+
+class StreamError(Exception):
+    """Raised by a frame loader to end a stream with a message for every viewer."""
+
+    def __init__(self, message: str, close_code: int, **details: object) -> None:
+        super().__init__(message)
+        self.close_code = close_code
+        self.payload = {"error": message, **details}
+
+
+@dataclass
+class BroadcastStats:
+    streams_started: int = 0
+    frames_queued: int = 0
+    frames_dropped: int = 0
+    slow_disconnects: int = 0
+
+
+@dataclass(eq=False)
+class Subscriber:
+    """One viewer's buffer; ``None`` marks the end of its stream."""
+
+    queue: asyncio.Queue[str | None]
+    error: dict[str, object] | None = None
+    close_code: int | None = None
+    dropped: int = 0
+    stream: _Stream | None = field(default=None, repr=False)
+
+
+@dataclass(eq=False)
+class _Stream:
+    key: StreamKey
+    subscribers: set[Subscriber] = field(default_factory=set)
+    producer: asyncio.Task[None] | None = None
+
+
+class SessionBroadcaster:
+    """One producer per (session, replay position), shared by all viewers of a worker."""
+
+    def __init__(
+        self,
+        buffer_size: int = 256,
+        slow_consumer: str = DROP,
+        frame_interval_s: float = 0.01,
+    ) -> None:
+        if slow_consumer not in (DROP, DISCONNECT):
+            raise ValueError(f"slow_consumer must be {DROP!r} or {DISCONNECT!r}")
+        self.buffer_size = buffer_size
+        self.slow_consumer = slow_consumer
+        self.frame_interval_s = frame_interval_s
+        self._streams: set[_Stream] = set()
+        # Streams that have not sent a frame yet, which new viewers may still join.
+        self._joinable: dict[StreamKey, _Stream] = {}
+        self._stats = BroadcastStats()
+
+    def subscribe(self, key: StreamKey, load: FrameLoader) -> Subscriber:
+        """Join the stream for ``key``, starting it with ``load`` unless one is about to start.
+
+        ``load`` yields the frames in chunks; it may raise :class:`StreamError`.
+        """
+
+        stream = self._joinable.get(key)
+        if stream is None:
+            stream = self._joinable[key] = _Stream(key)
+            self._streams.add(stream)
+            stream.producer = asyncio.create_task(self._produce(stream, load))
+            self._stats.streams_started += 1
+        subscriber = Subscriber(asyncio.Queue(maxsize=self.buffer_size), stream=stream)
+        stream.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        stream = subscriber.stream
+        if stream is None:
+            return
+        stream.subscribers.discard(subscriber)
+        if not stream.subscribers:
+            self._release(stream)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **asdict(self._stats),
+            "streams": len(self._streams),
+            "subscribers": sum(len(stream.subscribers) for stream in self._streams),
+        }
+
+    def _close_to_viewers(self, stream: _Stream) -> None:
+        if self._joinable.get(stream.key) is stream:
+            del self._joinable[stream.key]
+
+    def _release(self, stream: _Stream) -> None:
+        self._close_to_viewers(stream)
+        self._streams.discard(stream)
+        if stream.producer is not None and not stream.producer.done():
+            stream.producer.cancel()
+
+    async def _produce(self, stream: _Stream, load: FrameLoader) -> None:
+        try:
+            async for chunk in load():
+                # Past the requested position now: later viewers need their own replay.
+                self._close_to_viewers(stream)
+                for frame in chunk:
+                    for subscriber in list(stream.subscribers):
+                        self._offer(stream, subscriber, frame)
+                    if not stream.subscribers:
+                        return
+                    await asyncio.sleep(self.frame_interval_s)
+        except StreamError as exc:
+            for subscriber in stream.subscribers:
+                subscriber.error = exc.payload
+                subscriber.close_code = exc.close_code
+        except Exception:  # noqa: BLE001
+            logger.exception("broadcast.producer_failed", session_id=stream.key[0])
+            for subscriber in stream.subscribers:
+                subscriber.error = {"error": "stream failed"}
+                subscriber.close_code = status.WS_1011_INTERNAL_ERROR
+        finally:
+            # Later viewers start a fresh replay; current ones are told the stream ended.
+            self._close_to_viewers(stream)
+            self._streams.discard(stream)
+            for subscriber in stream.subscribers:
+                self._end(subscriber)
+
+    def _offer(self, stream: _Stream, subscriber: Subscriber, frame: str) -> None:
+        if subscriber.queue.full():
+            if self.slow_consumer == DISCONNECT:
+                stream.subscribers.discard(subscriber)
+                subscriber.error = {"error": "client too slow", "buffered": self.buffer_size}
+                subscriber.close_code = status.WS_1008_POLICY_VIOLATION
+                self._stats.slow_disconnects += 1
+                self._end(subscriber)
+                logger.info("broadcast.slow_disconnect", session_id=stream.key[0])
+                return
+            subscriber.queue.get_nowait()
+            subscriber.dropped += 1
+            self._stats.frames_dropped += 1
+        subscriber.queue.put_nowait(frame)
+        self._stats.frames_queued += 1
+
+    @staticmethod
+    def _end(subscriber: Subscriber) -> None:
+        """Queue the end marker, discarding buffered frames if there is no room."""
+
+        if subscriber.queue.full():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(None)
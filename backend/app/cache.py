@@ -0,0 +1,171 @@
+"""Application-wide Redis cache on a shared connection pool.
+
+One :class:`RedisCache` is created when the API starts and closed when it stops,
+so requests borrow pooled connections instead of connecting per lookup. The
+cache is strictly best effort: when Redis is unreachable, reads miss and writes
+are dropped, and Redis is left alone for ``retry_interval_s`` before the next
+attempt so an outage does not add a connect timeout to every request.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+import redis.asyncio as aioredis
+import structlog
+from redis.exceptions import RedisError, WatchError
+
+from .config import Settings
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class RedisCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+    skipped: int = 0
+    pool_waits: int = 0
+    pool_timeouts: int = 0
+
+
+def session_key(session_id: str, generation: int, *parts: object) -> str:
+    """Cache key for data derived from one generation of a session.
+
+    Rewriting a session moves its generation forward, so entries written for
+    older data are never read again and simply expire.
+    """
+
+    return ":".join(["session", session_id, f"g{generation}", *map(str, parts)])
+
+
+class RedisCache:
+    """Best-effort ``get``/``set``/``delete`` over a blocking connection pool.
+
+    Values are returned as the raw bytes stored, so encoded responses (including
+    binary ones) can be served without decoding.
+
+    ``pool_waits`` counts calls that found every connection checked out and had
+    to queue for one; ``pool_timeouts`` those that gave up waiting. Both mean
+    ``max_connections`` is too small for the load. A pool timeout is treated as a
+    miss but does not mark Redis as down.
+    """
+
+    def __init__(
+        self, pool: aioredis.BlockingConnectionPool, retry_interval_s: float = 5.0
+    ) -> None:
+        self.pool = pool
+        self.client = aioredis.Redis(connection_pool=pool)
+        self.retry_interval_s = retry_interval_s
+        self._stats = RedisCacheStats()
+        self._down_until = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RedisCache":
+        pool = aioredis.BlockingConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout_seconds,
+            socket_timeout=settings.redis_socket_timeout_seconds,
+            socket_connect_timeout=settings.redis_socket_timeout_seconds,
+        )
+        return cls(pool)
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    async def get(self, key: str) -> Any:
+        value = await self._call("get", key)
+        if value is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> bool:
+        stored = await self._call("set", key, value, ex=ex)
+        if stored:
+            self._stats.writes += 1
+        return bool(stored)
+
+    async def delete(self, *keys: str) -> int:
+        return await self._call("delete", *keys) or 0
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self._call("exists", key))
+
+    async def acquire_lock(self, name: str, ttl_s: float) -> str | None:
+        """Take the lock ``name`` for ``ttl_s``; return its token, or ``None`` if held.
+
+        ``None`` is also returned when Redis is unreachable; check
+        :attr:`available` to tell the two apart.
+        """
+
+        token = uuid.uuid4().hex
+        acquired = await self._call("set", name, token, nx=True, px=max(1, int(ttl_s * 1000)))
+        return token if acquired else None
+
+    async def release_lock(self, name: str, token: str) -> None:
+        """Release ``name`` if it is still held with ``token``."""
+
+        async def compare_and_delete() -> None:
+            async with self.client.pipeline(transaction=True) as pipe:
+                await pipe.watch(name)
+                if await pipe.get(name) == token.encode():
+                    pipe.multi()
+                    pipe.delete(name)
+                    try:
+                        await pipe.execute()
+                    except WatchError:
+                        pass  # Expired and taken over meanwhile; not ours to delete.
+
+        await self._run("release_lock", compare_and_delete)
+
+    async def _call(self, command: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(
+            command, lambda: getattr(self.client, command)(*args, **kwargs)
+        )
+
+    async def _run(self, command: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.available:
+            self._stats.skipped += 1
+            return None
+        if not self.pool.can_get_connection():
+            self._stats.pool_waits += 1
+        try:
+            return await operation()
+        except (RedisError, OSError) as exc:
+            if isinstance(exc.__cause__, asyncio.TimeoutError):
+                self._stats.pool_timeouts += 1
+                logger.warning("redis.pool_timeout", command=command)
+                return None
+            self._stats.errors += 1
+            self._down_until = time.monotonic() + self.retry_interval_s
+            logger.warning(
+                "redis.unavailable",
+                command=command,
+                error=str(exc),
+                retry_in_s=self.retry_interval_s,
+            )
+            return None
+
+    def stats(self) -> dict[str, Any]:
+        pool = self.pool
+        return {
+            **asdict(self._stats),
+            "available": self.available,
+            "max_connections": pool.max_connections,
+            # redis-py keeps these as private attributes; read-only use.
+            "connections_in_use": len(pool._in_use_connections),
+            "connections_idle": len(pool._available_connections),
+        }
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        await self.pool.disconnect()
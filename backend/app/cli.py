@@ -5,22 +5,45 @@ import argparse
 from pathlib import Path
 
 from .config import get_settings
-from .dataio import compute_session_metrics, extract_zip, normalize_files
+from .dataio import ingest_archive
 from .deps import get_parquet_store
+from .profiling import IngestProfiler
 
 
-def ingest(zip_path: Path, session_id: str) -> None:
+def ingest(
+    zip_path: Path,
+    session_id: str,
+    batch_rows: int | None = None,
+    workers: int | None = None,
+) -> None:
     settings = get_settings()
     store = get_parquet_store()
-    staging = settings.data_dir / "staging" / session_id
-    files = extract_zip(zip_path, staging)
     track = zip_path.stem.replace('-', ' ').replace('_', ' ').title()
-    normalized = normalize_files(files, session_id=session_id, track=track)
-    store.write_session(normalized)
-    metrics = compute_session_metrics(normalized)
+    if batch_rows is None:
+        batch_rows = settings.ingest_batch_rows
+    if workers is None:
+        workers = settings.normalize_workers
+    with IngestProfiler(session_id=session_id) as profiler:
+        metrics = ingest_archive(
+            zip_path,
+            session_id,
+            track,
+            store,
+            batch_rows=batch_rows,
+            workers=workers,
+            spill_dir=settings.data_dir / "staging",
+        )
     print(f"Ingested session {session_id} ({track})")
     print(f"Fastest lap: {metrics['fastest_lap']}")
     print(f"Valid laps: {metrics['valid_laps']}")
+    print()
+    print(profiler.format_table())
+
+
+def compact() -> None:
+    store = get_parquet_store()
+    compacted = store.compact()
+    print(f"Compacted {compacted} partition(s) under {store.root}")
 
 
 def main() -> None:
@@ -29,10 +52,25 @@ def main() -> None:
     ingest_parser = sub.add_parser("ingest", help="Ingest a telemetry archive")
     ingest_parser.add_argument("session_id", help="Normalized session identifier")
     ingest_parser.add_argument("zip_path", type=Path, help="Path to telemetry ZIP archive")
+    ingest_parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=None,
+        help="Normalize out-of-core in batches of this many rows (default: INGEST_BATCH_ROWS)",
+    )
+    ingest_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to parse archive members (default: NORMALIZE_WORKERS)",
+    )
+    sub.add_parser("compact", help="Merge small Parquet files and row groups per partition")
 
     args = parser.parse_args()
     if args.command == "ingest":
-        ingest(args.zip_path, args.session_id)
+        ingest(args.zip_path, args.session_id, batch_rows=args.batch_rows, workers=args.workers)
+    elif args.command == "compact":
+        compact()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""Collapse concurrent identical requests into one computation.
+
+Expensive responses are cached in Redis under keys that include the session's
+data generation (see :func:`~backend.app.cache.session_key`). On a miss,
+:meth:`RequestCoalescer.get_or_compute` makes sure the body is computed once:
+
+- within a worker, callers asking for a key that is already being computed
+  await the same task;
+- across workers, the computing worker holds a Redis lock on the key and the
+  others poll for the cached result until the lock is released.
+
+When Redis is unreachable each worker still computes a key only once at a time.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable
+
+import structlog
+
+from .cache import RedisCache
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class CoalescerStats:
+    computed: int = 0
+    joined: int = 0
+    remote_hits: int = 0
+    remote_timeouts: int = 0
+
+
+class RequestCoalescer:
+    """In-flight deduplication of cached computations, shared by all requests of a worker."""
+
+    def __init__(self, lock_ttl_s: float = 30.0, poll_interval_s: float = 0.05) -> None:
+        self.lock_ttl_s = lock_ttl_s
+        self.poll_interval_s = poll_interval_s
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+        self._stats = CoalescerStats()
+
+    async def get_or_compute(
+        self,
+        cache: RedisCache,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        ttl_s: int,
+    ) -> bytes:
+        """The cached body for ``key``, computing and caching it at most once.
+
+        Exceptions raised by ``compute`` reach every caller waiting on it.
+        """
+
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._lead(cache, key, compute, ttl_s))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._stats.joined += 1
+        # A caller that goes away must not cancel the others' computation.
+        return await asyncio.shield(task)
+
+    async def _lead(
+        self,
+        cache: RedisCache,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        ttl_s: int,
+    ) -> bytes:
+        lock = f"lock:{key}"
+        token = await cache.acquire_lock(lock, self.lock_ttl_s)
+        if token is None and cache.available:
+            body = await self._await_remote(cache, key, lock)
+            if body is not None:
+                return body
+        try:
+            self._stats.computed += 1
+            body = await compute()
+            await cache.set(key, body, ex=ttl_s)
+            return body
+        finally:
+            if token is not None:
+                await cache.release_lock(lock, token)
+
+    async def _await_remote(self, cache: RedisCache, key: str, lock: str) -> bytes | None:
+        """Wait for another worker holding ``lock`` to cache ``key``.
+
+        Returns ``None`` once the lock is gone without a result (the other worker
+        failed) or after the lock TTL, leaving the caller to compute it.
+        """
+
+        deadline = time.monotonic() + self.lock_ttl_s
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval_s)
+            body = await cache.get(key)
+            if body is not None:
+                self._stats.remote_hits += 1
+                return body
+            if not await cache.exists(lock):
+                return None
+        self._stats.remote_timeouts += 1
+        logger.warning("coalesce.remote_timeout", key=key)
+        return None
+
+    def stats(self) -> dict[str, int]:
+        return {**asdict(self._stats), "in_flight": len(self._inflight)}
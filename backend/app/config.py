@@ -23,7 +23,85 @@ class Settings(BaseSettings):
     parquet_partition_cols: List[str] = Field(
         default_factory=lambda: ["session_id", "track"]
     )
-    redis_cache_ttl_seconds: int = Field(300, env="REDIS_CACHE_TTL")
+    redis_cache_ttl_seconds: int = Field(
+        24 * 60 * 60,
+        env="REDIS_CACHE_TTL",
+        description="Lifetime of cached responses; keys carry the session's data generation.",
+    )
+    redis_max_connections: int = Field(
+        32, env="REDIS_MAX_CONNECTIONS", description="Size of the shared Redis connection pool."
+    )
+    redis_pool_timeout_seconds: float = Field(
+        0.5,
+        env="REDIS_POOL_TIMEOUT",
+        description="How long a request waits for a pooled connection before skipping the cache.",
+    )
+    redis_socket_timeout_seconds: float = Field(
+        1.0, env="REDIS_SOCKET_TIMEOUT", description="Connect and read timeout for Redis calls."
+    )
+    normalize_workers: int = Field(
+        1,
+        env="NORMALIZE_WORKERS",
+        description="Processes used to parse archive members in parallel.",
+    )
+    ingest_batch_rows: int = Field(
+        0,
+        env="INGEST_BATCH_ROWS",
+        description="Rows per batch for out-of-core ingestion; 0 normalizes in memory.",
+    )
+    ingest_workers: int = Field(
+        1,
+        env="INGEST_WORKERS",
+        description="Ingest jobs allowed to run at the same time across all API workers.",
+    )
+    ingest_queue_limit: int = Field(
+        8, env="INGEST_QUEUE_LIMIT", description="Ingest jobs allowed to wait for a free worker."
+    )
+    ingest_max_attempts: int = Field(
+        3,
+        env="INGEST_MAX_ATTEMPTS",
+        description="Runs of an interrupted ingest job before it is marked failed.",
+    )
+    coalesce_lock_ttl_seconds: float = Field(
+        30.0,
+        env="COALESCE_LOCK_TTL",
+        description="How long a worker may hold the Redis lock while computing a shared result.",
+    )
+    table_cache_bytes: int = Field(
+        256 * 1024 * 1024,
+        env="TABLE_CACHE_BYTES",
+        description="Byte budget of the in-process decoded table cache; 0 disables it.",
+    )
+    compaction_interval_seconds: int = Field(
+        0,
+        env="COMPACTION_INTERVAL",
+        description="Seconds between background Parquet compaction runs; 0 disables it.",
+    )
+    ws_send_buffer: int = Field(
+        256, env="WS_SEND_BUFFER", description="Frames buffered per WebSocket viewer."
+    )
+    ws_slow_consumer: str = Field(
+        "drop",
+        env="WS_SLOW_CONSUMER",
+        description="What to do with a viewer whose buffer is full: drop frames or disconnect.",
+    )
+    io_workers: int = Field(
+        8, env="IO_WORKERS", description="Threads serving blocking store reads and writes."
+    )
+    cpu_workers: int = Field(
+        2,
+        env="CPU_WORKERS",
+        description="Processes running model fits and DTW; 0 runs them on the I/O threads.",
+    )
+    io_queue_limit: int = Field(
+        32, env="IO_QUEUE_LIMIT", description="Store calls allowed to wait for a free thread."
+    )
+    cpu_queue_limit: int = Field(
+        8, env="CPU_QUEUE_LIMIT", description="Model calls allowed to wait for a free process."
+    )
+    overload_retry_after_seconds: int = Field(
+        5, env="OVERLOAD_RETRY_AFTER", description="Retry-After sent with 503 responses."
+    )
 
     class Config:
         env_file = ".env"
@@ -1,12 +1,27 @@
 """Data ingestion utilities for GR-Experience."""
-from .extract import extract_zip
-from .normalize import NormalizationError, compute_session_metrics, normalize_files
+from .chunked import StreamingIngestResult, ingest_streaming
+from .extract import ArchiveMember, extract_zip, list_zip_members
+from .normalize import (
+    SESSION_METRICS_COLUMNS,
+    NormalizationError,
+    compute_session_metrics,
+    normalize_files,
+)
 from .parquet_store import ParquetStore
+from .pipeline import ingest_archive
+from .table_cache import TableCache
 
 __all__ = [
+    "ArchiveMember",
     "extract_zip",
+    "ingest_archive",
+    "ingest_streaming",
+    "list_zip_members",
     "NormalizationError",
     "compute_session_metrics",
+    "SESSION_METRICS_COLUMNS",
     "normalize_files",
     "ParquetStore",
+    "StreamingIngestResult",
+    "TableCache",
 ]
@@ -0,0 +1,240 @@
+"""Out-of-core ingestion for telemetry archives larger than memory.
+
+Raw files are parsed in bounded row batches and spilled to one Parquet file per
+car. Each car is then normalized on its own and streamed into the store as row
+groups. Interpolation and lap-time derivation only ever look within a car, so
+they see complete data no matter where the batch boundaries fell. Peak memory is
+bounded by the largest single car rather than the whole session.
+"""
+from __future__ import annotations
+
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import structlog
+
+from .normalize import (
+    _PANDAS_TYPES,
+    CANONICAL_COLUMNS,
+    CANONICAL_TYPES,
+    NormalizationError,
+    SORT_KEYS,
+    RawSource,
+    SessionMetricsAccumulator,
+    _check_mandatory,
+    _clean_types,
+    _coerce_columns,
+    _csv_convert_options,
+    _csv_error_column,
+    _derive_event_date,
+    _derive_missing_lap_times,
+    _enforce_bounds,
+    _interpolate_numeric,
+    _needs_lap_times,
+    _normalize_timestamp,
+    _open_source,
+    _read_csv_header,
+    _read_raw_file,
+    _table_to_frame,
+    apply_canonical_dtypes,
+)
+from ..profiling import profile_stage
+from .parquet_store import ParquetStore
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_BATCH_ROWS = 250_000
+
+# Rough size of a raw CSV row, used to turn the row budget into an Arrow block size.
+_APPROX_ROW_BYTES = 128
+
+_SPILL_SCHEMA = pa.schema([(column, CANONICAL_TYPES[column]) for column in CANONICAL_COLUMNS])
+
+
+@dataclass
+class StreamingIngestResult:
+    session_id: str
+    track: str
+    rows: int
+    cars: int
+    metrics: dict
+
+
+@dataclass
+class _SpillState:
+    """Per-car spill files plus the session-wide facts later stages depend on."""
+
+    directory: Path
+    car_paths: dict[str, Path] = field(default_factory=dict)
+    writers: dict[str, pq.ParquetWriter] = field(default_factory=dict)
+    rows: int = 0
+    needs_lap_time: bool = False
+    has_event_date: bool = False
+    t_min: int | None = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        for car_id, car_df in df.groupby("car_id", sort=False, observed=True):
+            writer = self.writers.get(car_id)
+            if writer is None:
+                path = self.directory / f"car-{len(self.car_paths):05d}.parquet"
+                writer = pq.ParquetWriter(path, _SPILL_SCHEMA)
+                self.car_paths[car_id] = path
+                self.writers[car_id] = writer
+            writer.write_table(
+                pa.Table.from_pandas(car_df, schema=_SPILL_SCHEMA, preserve_index=False)
+            )
+        self.rows += len(df)
+        self.needs_lap_time = self.needs_lap_time or _needs_lap_times(df)
+        self.has_event_date = self.has_event_date or bool(df["event_date"].notna().any())
+        batch_min = df["t_ms"].min()
+        if pd.notna(batch_min):
+            self.t_min = int(batch_min) if self.t_min is None else min(self.t_min, int(batch_min))
+
+    def close(self) -> None:
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+
+def _slices(df: pd.DataFrame, batch_rows: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(df), batch_rows):
+        yield df.iloc[start : start + batch_rows].reset_index(drop=True)
+
+
+def _iter_raw_batches(source: RawSource, batch_rows: int) -> Iterator[pd.DataFrame]:
+    if source.suffix.lower() not in {".csv", ".txt"}:
+        # pyarrow has no incremental JSON reader; JSON members are parsed whole and
+        # only the downstream stages are batched.
+        yield from _slices(_read_raw_file(source), batch_rows)
+        return
+    block_size = max(batch_rows * _APPROX_ROW_BYTES, 1 << 16)
+    header = _read_csv_header(source)
+    text_columns: set[str] = set()
+    emitted = 0
+    while True:
+        read_options = pa_csv.ReadOptions(
+            use_threads=True, block_size=block_size, skip_rows_after_names=emitted
+        )
+        try:
+            with _open_source(source) as stream:
+                reader = pa_csv.open_csv(
+                    stream,
+                    read_options=read_options,
+                    convert_options=_csv_convert_options(header, text_columns),
+                )
+                for batch in reader:
+                    df = _table_to_frame(pa.Table.from_batches([batch]))
+                    emitted += batch.num_rows
+                    yield from _slices(df, batch_rows)
+            return
+        except pa.ArrowInvalid as exc:
+            # Continue after the rows already yielded, reading the offending column as text.
+            text_columns.add(_csv_error_column(exc, header, text_columns))
+
+
+def _spill_by_car(
+    sources: Iterable[RawSource],
+    session_id: str,
+    track: str,
+    batch_rows: int,
+    state: _SpillState,
+) -> None:
+    for source in sources:
+        source_rows = 0
+        lap_time_offset_s = 0.0
+        for raw in _iter_raw_batches(source, batch_rows):
+            raw_lap_time = raw["lap_time_s"] if "lap_time_s" in raw.columns else None
+            raw = _normalize_timestamp(raw, lap_time_offset_s=lap_time_offset_s)
+            if raw_lap_time is not None:
+                lap_time_offset_s += float(pd.to_numeric(raw_lap_time, errors="coerce").sum())
+            raw = _coerce_columns(raw)
+            raw["session_id"] = session_id
+            raw["track"] = track
+            raw = _clean_types(raw)
+            raw["event_date"] = raw["event_date"].astype("string")
+            state.write(raw)
+            source_rows += len(raw)
+        if source_rows == 0:
+            raise NormalizationError(f"File {source} is empty")
+        logger.debug("normalize.file", path=str(source), rows=source_rows)
+
+
+def _normalize_car(path: Path, state: _SpillState) -> pd.DataFrame:
+    with profile_stage("stream.read_spill") as stage:
+        df = pq.read_table(path).to_pandas(types_mapper=_PANDAS_TYPES.get)
+        stage.rows_out = len(df)
+    with profile_stage("normalize.sort", rows_in=len(df)) as stage:
+        df = df.sort_values(SORT_KEYS, ignore_index=True)
+        stage.rows_out = len(df)
+    df = _derive_missing_lap_times(df, force=state.needs_lap_time)
+    df = _interpolate_numeric(df, presorted=True)
+    df = _enforce_bounds(df)
+    df = _derive_event_date(df, has_event_date=state.has_event_date, fallback_t_ms=state.t_min)
+    _check_mandatory(df)
+    return apply_canonical_dtypes(df)
+
+
+def ingest_streaming(
+    sources: Iterable[RawSource],
+    session_id: str,
+    track: str,
+    store: ParquetStore,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    spill_dir: Path | None = None,
+) -> StreamingIngestResult:
+    """Normalize ``sources`` and write them to ``store`` in bounded memory.
+
+    Produces the same rows as :func:`normalize_files` followed by
+    :meth:`ParquetStore.write_session`, written in car order as row groups of at
+    most ``batch_rows`` rows.
+    """
+
+    if batch_rows < 1:
+        raise ValueError("batch_rows must be at least 1")
+    if spill_dir is not None:
+        spill_dir.mkdir(parents=True, exist_ok=True)
+
+    metrics = SessionMetricsAccumulator()
+    with tempfile.TemporaryDirectory(prefix="ingest-", dir=spill_dir) as tmp:
+        state = _SpillState(directory=Path(tmp))
+        with profile_stage("stream.spill") as stage:
+            try:
+                _spill_by_car(sources, session_id, track, batch_rows, state)
+            finally:
+                state.close()
+            stage.rows_out = state.rows
+        if not state.car_paths:
+            raise NormalizationError("No telemetry data found in archive")
+
+        partition = {"session_id": session_id, "track": track}
+        with store.partition_writer(partition) as writer:
+            for car_id in sorted(state.car_paths):
+                car_df = _normalize_car(state.car_paths[car_id], state)
+                with profile_stage("metrics", rows_in=len(car_df)):
+                    metrics.add(car_df)
+                with profile_stage("parquet.write", rows_in=len(car_df)):
+                    for batch in _slices(car_df, batch_rows):
+                        writer.write(batch)
+
+    logger.info(
+        "normalize.complete",
+        session_id=session_id,
+        track=track,
+        rows=state.rows,
+        cars=len(state.car_paths),
+        mode="streaming",
+        batch_rows=batch_rows,
+    )
+    return StreamingIngestResult(
+        session_id=session_id,
+        track=track,
+        rows=state.rows,
+        cars=len(state.car_paths),
+        metrics=metrics.result(),
+    )
@@ -2,74 +2,177 @@
 from __future__ import annotations
 
 import shutil
+import time
 import zipfile
-from pathlib import Path
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterator
 
 import structlog
 
+from ..profiling import profiled_stage
+
 logger = structlog.get_logger(__name__)
 
+# Members are copied in fixed-size chunks so memory stays flat regardless of member size.
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """A telemetry file inside a ZIP archive, read in place without extraction."""
+
+    archive: Path
+    name: str
+    size: int
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.name).suffix
+
+    @contextmanager
+    def open(self) -> Iterator[IO[bytes]]:
+        """Yield a decompressing stream over the member.
+
+        zipfile validates the CRC once the stream has been read to the end, so
+        consumers that parse the whole member get the same integrity guarantee as
+        :func:`extract_zip`.
+        """
+
+        with zipfile.ZipFile(self.archive) as zf, zf.open(self.name) as stream:
+            try:
+                yield stream
+            except zipfile.BadZipFile as exc:
+                raise ValueError(f"CRC mismatch for {self.name}: {exc}") from exc
+
+    def __str__(self) -> str:
+        return f"{self.archive}!{self.name}"
+
+
+def _validate_archive_path(input_zip: Path) -> Path:
+    input_zip = input_zip.expanduser().resolve()
+    if not input_zip.exists():
+        raise FileNotFoundError(f"Telemetry archive not found: {input_zip}")
+    if input_zip.suffix.lower() != ".zip":
+        raise ValueError("Only .zip archives are supported")
+    return input_zip
+
+
+def _archive_members(zf: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    members: list[zipfile.ZipInfo] = []
+    for info in zf.infolist():
+        if info.is_dir():
+            continue
+        if info.file_size <= 0:
+            raise ValueError(f"Archive member {info.filename} is empty")
+        members.append(info)
+    return members
 
-def _verify_zip_integrity(zip_path: Path) -> None:
-    with zipfile.ZipFile(zip_path) as zf:
-        for info in zf.infolist():
-            if info.is_dir():
-                continue
-            if info.file_size <= 0:
-                raise ValueError(f"Archive member {info.filename} is empty")
-            # ZipFile will raise a BadZipFile on CRC mismatch when read. We proactively check.
-            with zf.open(info.filename) as member:
-                data = member.read()
-            computed = zipfile.crc32(data) & 0xFFFFFFFF
-            if computed != info.CRC:
-                raise ValueError(
-                    f"CRC mismatch for {info.filename}: expected {info.CRC}, got {computed}"
-                )
 
+def _extract_member(input_zip: Path, info: zipfile.ZipInfo, out_dir: Path) -> Path:
+    """Copy a single member to ``out_dir`` verifying its CRC while streaming."""
 
-def extract_zip(input_zip: Path, out_dir: Path) -> list[Path]:
+    target_path = out_dir / info.filename
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    crc = 0
+    started = time.perf_counter()
+    # Each call opens its own handle so members can be extracted from worker threads.
+    try:
+        with zipfile.ZipFile(input_zip) as zf, zf.open(info) as source, open(
+            target_path, "wb"
+        ) as dest:
+            while chunk := source.read(CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+                dest.write(chunk)
+    except zipfile.BadZipFile as exc:
+        # zipfile validates the CRC on the final read; surface it like our own check.
+        target_path.unlink(missing_ok=True)
+        raise ValueError(f"CRC mismatch for {info.filename}: {exc}") from exc
+    elapsed = time.perf_counter() - started
+
+    if crc != info.CRC:
+        target_path.unlink(missing_ok=True)
+        raise ValueError(f"CRC mismatch for {info.filename}: expected {info.CRC}, got {crc}")
+
+    logger.info(
+        "extract.member",
+        filename=info.filename,
+        size=info.file_size,
+        dest=str(target_path),
+        elapsed_s=round(elapsed, 6),
+        bytes_per_s=round(info.file_size / elapsed) if elapsed > 0 else None,
+    )
+    return target_path
+
+
+@profiled_stage("extract")
+def extract_zip(input_zip: Path, out_dir: Path, workers: int = 1) -> list[Path]:
     """Extract a telemetry archive ensuring integrity.
 
+    Members are streamed to disk in :data:`CHUNK_SIZE` chunks and their CRC is
+    verified during the copy, so each member is decompressed exactly once.
+
     Parameters
     ----------
     input_zip:
         Path to the telemetry archive. Must end with ``.zip``.
     out_dir:
         Destination directory for extracted files. It will be created if missing.
+    workers:
+        Number of threads used to extract members concurrently. ``1`` extracts
+        sequentially.
 
     Returns
     -------
     list[Path]
-        List of extracted file paths.
+        List of extracted file paths, in archive order.
     """
 
-    input_zip = input_zip.expanduser().resolve()
-    if not input_zip.exists():
-        raise FileNotFoundError(f"Telemetry archive not found: {input_zip}")
-    if input_zip.suffix.lower() != ".zip":
-        raise ValueError("Only .zip archives are supported")
+    input_zip = _validate_archive_path(input_zip)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
 
-    logger.info("extract.start", archive=str(input_zip))
+    logger.info("extract.start", archive=str(input_zip), workers=workers)
     out_dir = out_dir.expanduser().resolve()
     if out_dir.exists():
         shutil.rmtree(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    _verify_zip_integrity(input_zip)
-
-    extracted: list[Path] = []
     with zipfile.ZipFile(input_zip) as zf:
-        for info in zf.infolist():
-            if info.is_dir():
-                continue
-            target_path = out_dir / info.filename
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            with zf.open(info.filename) as source, open(target_path, "wb") as dest:
-                shutil.copyfileobj(source, dest)
-            extracted.append(target_path)
-            logger.debug(
-                "extract.member", filename=info.filename, size=info.file_size, dest=str(target_path)
-            )
+        members = _archive_members(zf)
+
+    try:
+        if workers == 1 or len(members) <= 1:
+            extracted = [_extract_member(input_zip, info, out_dir) for info in members]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                extracted = list(
+                    pool.map(lambda info: _extract_member(input_zip, info, out_dir), members)
+                )
+    except Exception:
+        shutil.rmtree(out_dir, ignore_errors=True)
+        raise
 
     logger.info("extract.complete", archive=str(input_zip), files=len(extracted))
     return extracted
+
+
+@profiled_stage("extract.list")
+def list_zip_members(input_zip: Path) -> list[ArchiveMember]:
+    """Return the members of a telemetry archive for in-place parsing.
+
+    Unlike :func:`extract_zip` nothing is written to disk; callers stream each
+    member straight out of the archive via :meth:`ArchiveMember.open`.
+    """
+
+    input_zip = _validate_archive_path(input_zip)
+    with zipfile.ZipFile(input_zip) as zf:
+        members = [
+            ArchiveMember(archive=input_zip, name=info.filename, size=info.file_size)
+            for info in _archive_members(zf)
+        ]
+    logger.info("extract.members", archive=str(input_zip), files=len(members))
+    return members
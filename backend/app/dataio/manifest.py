@@ -0,0 +1,241 @@
+"""Persistent index of the partitions and files held by a :class:`ParquetStore`.
+
+The manifest mirrors the hive directory tree: for every directory it keeps the
+modification time seen when it was last listed and its children (partition
+directories, or Parquet files at the leaves). Looking up a session only stats
+the directories on the path to that session's partitions and re-lists the ones
+whose mtime moved, so files written by other processes are picked up without
+walking the rest of the store. A missing or incompatible manifest costs a
+single full scan.
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Mapping
+from urllib.parse import unquote
+
+import orjson
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Underscore-prefixed entries are skipped by pyarrow dataset discovery.
+MANIFEST_DIR = "_meta"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_FORMAT = 1
+
+# Published files are named ``g<generation>-<id>.parquet``; the newest generation
+# of a partition supersedes older ones. Files without the prefix count as 0.
+_GENERATION = re.compile(r"^g(\d+)-")
+
+
+def file_generation(name: str) -> int:
+    match = _GENERATION.match(name)
+    return int(match.group(1)) if match else 0
+
+
+def current_generation(names: list[str]) -> list[str]:
+    """The files of a partition directory that belong to its newest generation."""
+
+    if not names:
+        return []
+    newest = max(file_generation(name) for name in names)
+    return [name for name in names if file_generation(name) == newest]
+
+
+@dataclass
+class _DirEntry:
+    mtime_ns: int
+    children: list[str] = field(default_factory=list)
+    _by_value: dict[str, list[str]] | None = field(default=None, init=False, repr=False)
+
+    def matching(self, value: str | None) -> list[str]:
+        """Children of a partition directory, restricted to ``value`` if given."""
+
+        if value is None:
+            return self.children
+        if self._by_value is None:
+            by_value: dict[str, list[str]] = {}
+            for name in self.children:
+                by_value.setdefault(unquote(name.split("=", 1)[1]), []).append(name)
+            self._by_value = by_value
+        return self._by_value.get(value, [])
+
+
+class DatasetManifest:
+    """Directory listing cache for a hive-partitioned Parquet tree."""
+
+    def __init__(self, root: Path, partition_cols: list[str]) -> None:
+        self.root = root
+        self.partition_cols = list(partition_cols)
+        self.path = root / MANIFEST_DIR / MANIFEST_FILE
+        self.version = 0
+        self._dirs: dict[str, _DirEntry] = {}
+        self._lock = threading.RLock()
+        # Create the manifest directory up front so it does not bump the root mtime
+        # right after the initial scan.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._load():
+            self._refresh("", 0)
+            self._save()
+            logger.info("parquet.manifest_scan", root=str(root), partitions=self.partition_count)
+
+    @property
+    def partition_count(self) -> int:
+        depth = len(self.partition_cols)
+        return sum(1 for rel in self._dirs if rel and rel.count("/") == depth - 1)
+
+    def files(self, **partition: str) -> list[Path]:
+        """Return the current-generation files of all partitions matching ``partition``.
+
+        Only the directories leading to matching partitions are checked for
+        external changes.
+        """
+
+        with self._lock:
+            if self._check("", 0, partition):
+                self._commit()
+            return [self.root / rel for rel in self._iter_files("", 0, partition)]
+
+    def all_files(self) -> list[Path]:
+        """Every current file indexed, without checking for external changes."""
+
+        with self._lock:
+            return [self.root / rel for rel in self._iter_files("", 0, {})]
+
+    def partitions(self) -> list[dict[str, str]]:
+        """Every partition in the store, after checking the whole tree for changes."""
+
+        with self._lock:
+            if self._check("", 0, {}):
+                self._commit()
+            depth = len(self.partition_cols)
+            return [
+                {
+                    column: unquote(segment.split("=", 1)[1])
+                    for column, segment in zip(self.partition_cols, rel.split("/"))
+                }
+                for rel in self._dirs
+                if rel and rel.count("/") == depth - 1
+            ]
+
+    def record(self, partition: Mapping[str, object]) -> None:
+        """Pick up files just written to ``partition`` and persist the manifest."""
+
+        values = {column: str(partition[column]) for column in self.partition_cols}
+        with self._lock:
+            if self._check("", 0, values):
+                self._commit()
+
+    def _commit(self) -> None:
+        self.version += 1
+        self._save()
+
+    def _list(self, rel: str, depth: int) -> _DirEntry:
+        directory = self.root / rel if rel else self.root
+        mtime_ns = directory.stat().st_mtime_ns
+        children: list[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith((".", "_")):
+                    continue
+                if depth < len(self.partition_cols):
+                    prefix = f"{self.partition_cols[depth]}="
+                    if entry.is_dir() and entry.name.startswith(prefix):
+                        children.append(entry.name)
+                elif entry.is_file() and entry.name.endswith(".parquet"):
+                    children.append(entry.name)
+        children.sort()
+        return _DirEntry(mtime_ns=mtime_ns, children=children)
+
+    def _refresh(self, rel: str, depth: int) -> None:
+        """Re-list ``rel``; newly appeared subdirectories are scanned in full."""
+
+        previous = self._dirs.get(rel)
+        entry = self._list(rel, depth)
+        self._dirs[rel] = entry
+        if depth >= len(self.partition_cols):
+            return
+        known = set(previous.children) if previous else set()
+        for name in known - set(entry.children):
+            self._drop(_join(rel, name))
+        for name in entry.children:
+            if name not in known:
+                self._refresh(_join(rel, name), depth + 1)
+
+    def _drop(self, rel: str) -> None:
+        prefix = f"{rel}/"
+        for key in [key for key in self._dirs if key == rel or key.startswith(prefix)]:
+            del self._dirs[key]
+
+    def _check(self, rel: str, depth: int, partition: Mapping[str, str]) -> bool:
+        """Refresh stale directories on the way to ``partition``; return whether any changed."""
+
+        directory = self.root / rel if rel else self.root
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            changed = rel in self._dirs
+            self._drop(rel)
+            return changed
+        entry = self._dirs.get(rel)
+        changed = False
+        if entry is None or entry.mtime_ns != mtime_ns:
+            self._refresh(rel, depth)
+            entry = self._dirs[rel]
+            changed = True
+        if depth < len(self.partition_cols):
+            for name in entry.matching(partition.get(self.partition_cols[depth])):
+                changed = self._check(_join(rel, name), depth + 1, partition) or changed
+        return changed
+
+    def _iter_files(
+        self, rel: str, depth: int, partition: Mapping[str, str]
+    ) -> Iterator[str]:
+        entry = self._dirs.get(rel)
+        if entry is None:
+            return
+        if depth == len(self.partition_cols):
+            for name in current_generation(entry.children):
+                yield _join(rel, name)
+            return
+        for name in entry.matching(partition.get(self.partition_cols[depth])):
+            yield from self._iter_files(_join(rel, name), depth + 1, partition)
+
+    def _load(self) -> bool:
+        try:
+            payload = orjson.loads(self.path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return False
+        if (
+            payload.get("format") != MANIFEST_FORMAT
+            or payload.get("partition_cols") != self.partition_cols
+        ):
+            return False
+        self._dirs = {
+            rel: _DirEntry(mtime_ns=item["mtime_ns"], children=item["children"])
+            for rel, item in payload["dirs"].items()
+        }
+        return True
+
+    def _save(self) -> None:
+        payload = {
+            "format": MANIFEST_FORMAT,
+            "partition_cols": self.partition_cols,
+            "dirs": {
+                rel: {"mtime_ns": entry.mtime_ns, "children": entry.children}
+                for rel, entry in self._dirs.items()
+            },
+        }
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(payload))
+        os.replace(tmp_path, self.path)
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
@@ -1,12 +1,33 @@
 """Normalization utilities for raw telemetry data."""
 from __future__ import annotations
 
+import csv
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import IO, Collection, Iterable, Iterator, Mapping, Union
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.json as pa_json
 import structlog
 
+from ..profiling import (
+    IngestProfiler,
+    StageStats,
+    active_profiler,
+    profile_stage,
+    profiled_stage,
+)
+from .extract import ArchiveMember
+
 logger = structlog.get_logger(__name__)
 
 CANONICAL_COLUMNS = [
@@ -54,6 +75,51 @@ COLUMN_ALIASES: Mapping[str, str] = {
     "flag": "flag_state",
 }
 
+# Raw columns already holding epoch/session milliseconds.
+TIMESTAMP_MS_COLUMNS = ("t_ms", "time_ms", "timestamp_ms")
+
+# Aliases of ``lap_time_s`` whose raw values are expressed in milliseconds.
+MILLISECOND_DURATION_COLUMNS = frozenset({"delta_ms", "lap_time_ms"})
+
+# Arrow types of the canonical schema, applied while parsing raw files.
+CANONICAL_TYPES: Mapping[str, pa.DataType] = {
+    "session_id": pa.string(),
+    "track": pa.string(),
+    "event_date": pa.string(),
+    "car_id": pa.string(),
+    "lap": pa.int64(),
+    "sector": pa.int64(),
+    "t_ms": pa.int64(),
+    "lap_time_s": pa.float64(),
+    "speed_kph": pa.float64(),
+    "throttle": pa.float64(),
+    "brake": pa.float64(),
+    "gear": pa.int64(),
+    "tire_set": pa.string(),
+    "track_temp_c": pa.float64(),
+    "air_temp_c": pa.float64(),
+    "flag_state": pa.string(),
+}
+
+# Compact dtypes of normalized telemetry, used in memory and in the Parquet store.
+CANONICAL_DTYPES: Mapping[str, str] = {
+    "session_id": "category",
+    "track": "category",
+    "car_id": "category",
+    "tire_set": "category",
+    "flag_state": "category",
+    "lap": "Int32",
+    "sector": "Int16",
+    "gear": "Int8",
+    "t_ms": "Int64",
+    "lap_time_s": "float64",
+    "speed_kph": "float32",
+    "throttle": "float32",
+    "brake": "float32",
+    "track_temp_c": "float32",
+    "air_temp_c": "float32",
+}
+
 NUMERIC_BOUNDS: Mapping[str, tuple[float | int | None, float | int | None]] = {
     "lap_time_s": (20, 500),
     "speed_kph": (0, 360),
@@ -65,26 +131,268 @@ NUMERIC_BOUNDS: Mapping[str, tuple[float | int | None, float | int | None]] = {
 }
 
 
+RawSource = Union[Path, ArchiveMember]
+
+
 class NormalizationError(RuntimeError):
     pass
 
 
-def _read_raw_file(path: Path) -> pd.DataFrame:
-    if path.suffix.lower() in {".csv", ".txt"}:
-        df = pd.read_csv(path)
-    elif path.suffix.lower() == ".json":
-        df = pd.read_json(path)
+def _raw_column_types() -> dict[str, pa.DataType]:
+    """Map every accepted raw column name to the Arrow type of its canonical column."""
+
+    types = dict(CANONICAL_TYPES)
+    for alias, canonical in COLUMN_ALIASES.items():
+        types[alias] = CANONICAL_TYPES[canonical]
+    for column in MILLISECOND_DURATION_COLUMNS:
+        types[column] = pa.float64()
+    # ``timestamp`` may hold ISO datetimes that _normalize_timestamp parses itself.
+    types.pop("timestamp", None)
+    return types
+
+
+RAW_COLUMN_TYPES: Mapping[str, pa.DataType] = _raw_column_types()
+
+# Every known raw column, so NDJSON values are parsed straight into their types.
+_JSON_SCHEMA = pa.schema(list(RAW_COLUMN_TYPES.items()))
+
+# Keep nullable integers as pandas extension types instead of falling back to float64.
+_PANDAS_TYPES = {pa.int64(): pd.Int64Dtype()}
+
+# Tokens that parse as a number; anything else in a numeric column becomes null.
+_NUMBER_PATTERN = r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$"
+
+# Placeholders loggers write for a missing reading (neutral gear, dropped samples),
+# read as nulls on top of Arrow's defaults so they do not fail the typed parse.
+_CSV_NULL_VALUES = [*pa_csv.ConvertOptions().null_values, "N", "-", "--", "?"]
+
+# Locates the column in Arrow's CSV conversion errors.
+_CSV_ERROR_COLUMN = re.compile(r"In CSV column #(\d+)")
+
+
+@contextmanager
+def _open_source(source: RawSource) -> Iterator[IO[bytes]]:
+    if isinstance(source, ArchiveMember):
+        with source.open() as stream:
+            yield stream
     else:
-        raise NormalizationError(f"Unsupported file format: {path.suffix}")
+        with open(source, "rb") as stream:
+            yield stream
+
+
+def _is_numeric(dtype: pa.DataType) -> bool:
+    return pa.types.is_integer(dtype) or pa.types.is_floating(dtype)
+
+
+def _read_csv_header(source: RawSource) -> list[str]:
+    with _open_source(source) as stream:
+        first_line = stream.readline().decode("utf-8-sig")
+    return next(csv.reader([first_line]), [])
+
+
+def _csv_convert_options(
+    header: list[str], text_columns: Collection[str] = ()
+) -> pa_csv.ConvertOptions:
+    """Arrow types for the known columns of ``header``, matched after stripping whitespace.
+
+    Integer columns are parsed as floats, so fractional values are rounded by
+    :func:`_conform_types` instead of failing the file. ``text_columns`` are
+    numeric columns holding tokens Arrow cannot parse; they are read as strings
+    and converted by :func:`_conform_types`, nulling just those values.
+    """
+
+    column_types = {}
+    for raw_name in header:
+        dtype = RAW_COLUMN_TYPES.get(raw_name.strip())
+        if dtype is None:
+            continue
+        if raw_name in text_columns:
+            dtype = pa.string()
+        elif pa.types.is_integer(dtype):
+            dtype = pa.float64()
+        column_types[raw_name] = dtype
+    return pa_csv.ConvertOptions(
+        column_types=column_types, null_values=_CSV_NULL_VALUES, strings_can_be_null=True
+    )
+
+
+def _csv_error_column(exc: pa.ArrowInvalid, header: list[str], text_columns: set[str]) -> str:
+    """The column of ``header`` a conversion error names; re-raise if it cannot be read as text."""
+
+    match = _CSV_ERROR_COLUMN.search(str(exc))
+    if match is None or int(match.group(1)) >= len(header):
+        raise exc
+    column = header[int(match.group(1))]
+    if column in text_columns:
+        raise exc
+    return column
+
+
+def _to_number(column: pa.ChunkedArray, dtype: pa.DataType) -> pa.ChunkedArray:
+    """Cast ``column`` to numeric ``dtype``, nulling unparseable values.
+
+    Fractional values in integer columns are rounded to the nearest integer.
+    """
+
+    if column.type == dtype:
+        return column
+    try:
+        return pc.cast(column, dtype)
+    except pa.ArrowInvalid:
+        pass
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        column = pc.utf8_trim_whitespace(column)
+        numeric = pc.match_substring_regex(column, _NUMBER_PATTERN)
+        column = pc.if_else(numeric, column, pa.scalar(None, column.type))
+    column = pc.cast(column, pa.float64())
+    if pa.types.is_integer(dtype):
+        column = pc.cast(pc.round(column), dtype)
+    return column
+
+
+def _conform_types(table: pa.Table) -> pa.Table:
+    """Strip column names and convert known numeric columns to their canonical types."""
+
+    table = table.rename_columns([name.strip() for name in table.column_names])
+    for index, name in enumerate(table.column_names):
+        dtype = RAW_COLUMN_TYPES.get(name)
+        if dtype is not None and _is_numeric(dtype):
+            table = table.set_column(index, name, _to_number(table.column(index), dtype))
+    return table
+
+
+def _coerce_numeric_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """The pandas counterpart of :func:`_conform_types` for frames not read by Arrow."""
+
+    df.columns = [str(col).strip() for col in df.columns]
+    for column in df.columns:
+        dtype = RAW_COLUMN_TYPES.get(column)
+        if dtype is None or not _is_numeric(dtype):
+            continue
+        values = pd.to_numeric(df[column], errors="coerce")
+        df[column] = values.round().astype("Int64") if pa.types.is_integer(dtype) else values
+    return df
+
+
+def _table_to_frame(table: pa.Table) -> pd.DataFrame:
+    return _conform_types(table).to_pandas(types_mapper=_PANDAS_TYPES.get)
+
+
+def _read_csv_arrow(source: RawSource) -> pd.DataFrame:
+    header = _read_csv_header(source)
+    text_columns: set[str] = set()
+    while True:
+        try:
+            with _open_source(source) as stream:
+                table = pa_csv.read_csv(
+                    stream,
+                    read_options=pa_csv.ReadOptions(use_threads=True),
+                    convert_options=_csv_convert_options(header, text_columns),
+                )
+            return _table_to_frame(table)
+        except pa.ArrowInvalid as exc:
+            # A token that is neither a number nor a null placeholder: re-read
+            # only its column as text.
+            text_columns.add(_csv_error_column(exc, header, text_columns))
+
+
+def _first_ndjson_record(source: RawSource) -> dict | None:
+    """The first record of ``source`` if it holds one JSON record per line.
+
+    A single line only counts if its values are scalars; otherwise it is a
+    one-line document such as pandas' default column-oriented ``to_json``.
+    """
+
+    records = []
+    with _open_source(source) as stream:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                return None
+            if not isinstance(record, dict):
+                return None
+            records.append(record)
+            if len(records) == 2:
+                break
+    if not records:
+        return None
+    if len(records) == 1 and any(isinstance(value, (dict, list)) for value in records[0].values()):
+        return None
+    return records[0]
+
+
+def _present_columns(table: pa.Table, first_record: dict) -> pa.Table:
+    """Drop schema columns the file never had, in the order the file introduces them.
+
+    The reader adds every :data:`_JSON_SCHEMA` field, filled with nulls where the
+    file lacks it; an all-null known column is treated as absent.
+    """
+
+    present = [
+        name
+        for name in table.column_names
+        if name not in RAW_COLUMN_TYPES or table.column(name).null_count < table.num_rows
+    ]
+    ordered = [name for name in first_record if name in present]
+    ordered += [name for name in present if name not in first_record]
+    return table.select(ordered)
+
+
+def _read_json(source: RawSource) -> pd.DataFrame:
+    first_record = _first_ndjson_record(source)
+    if first_record is not None:
+        try:
+            with _open_source(source) as stream:
+                table = pa_json.read_json(
+                    stream,
+                    read_options=pa_json.ReadOptions(use_threads=True),
+                    parse_options=pa_json.ParseOptions(
+                        explicit_schema=_JSON_SCHEMA, unexpected_field_behavior="infer"
+                    ),
+                )
+            return _table_to_frame(_present_columns(table, first_record))
+        except pa.ArrowInvalid:
+            # A value that does not fit its column's type, or a field whose type
+            # changes between records; pandas copes with those.
+            pass
+    # Record arrays and other document layouts are not line-delimited.
+    with _open_source(source) as stream:
+        df = pd.read_json(stream, lines=first_record is not None)
+    return _coerce_numeric_frame(df)
+
+
+@profiled_stage("normalize.read_file")
+def _read_raw_file(source: RawSource) -> pd.DataFrame:
+    """Parse a raw telemetry file with Arrow's multithreaded readers.
+
+    Known columns are converted to the types in :data:`RAW_COLUMN_TYPES`; values
+    that do not parse as numbers become missing rather than failing the file.
+    """
+
+    suffix = source.suffix.lower()
+    try:
+        if suffix in {".csv", ".txt"}:
+            df = _read_csv_arrow(source)
+        elif suffix == ".json":
+            df = _read_json(source)
+        else:
+            raise NormalizationError(f"Unsupported file format: {source.suffix}")
+    except pa.ArrowInvalid as exc:
+        raise NormalizationError(f"Unable to parse {source}: {exc}") from exc
     if df.empty:
-        raise NormalizationError(f"File {path} is empty")
+        raise NormalizationError(f"File {source} is empty")
     df.columns = [col.strip() for col in df.columns]
     return df
 
 
-def _normalize_timestamp(df: pd.DataFrame) -> pd.DataFrame:
-    # Prefer ECU timestamp column over derived lap times when available.
-    if "t_ms" in df:
+@profiled_stage("normalize.timestamp")
+def _normalize_timestamp(df: pd.DataFrame, lap_time_offset_s: float = 0.0) -> pd.DataFrame:
+    # Prefer ECU timestamp column over derived lap times when available; a
+    # millisecond column is aliased onto t_ms unchanged by ``_coerce_columns``.
+    if any(column in df.columns for column in TIMESTAMP_MS_COLUMNS):
         return df
     if "timestamp" in df.columns:
         ts = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
@@ -99,21 +407,54 @@ def _normalize_timestamp(df: pd.DataFrame) -> pd.DataFrame:
     if "meta_time" in df.columns:
         df["t_ms"] = (df["meta_time"].astype(float) * 1000).round().astype("Int64")
     elif "lap_time_s" in df.columns:
-        df["t_ms"] = (df["lap_time_s"].cumsum() * 1000).round().astype("Int64")
+        # Batched readers pass the lap time accumulated by earlier batches of the file.
+        cumulative = df["lap_time_s"].cumsum() + lap_time_offset_s
+        df["t_ms"] = (cumulative * 1000).round().astype("Int64")
     else:
         raise NormalizationError("Unable to derive timestamp column")
     return df
 
 
+@profiled_stage("normalize.coerce")
 def _coerce_columns(df: pd.DataFrame) -> pd.DataFrame:
+    for column in MILLISECOND_DURATION_COLUMNS.intersection(df.columns):
+        df[column] = pd.to_numeric(df[column], errors="coerce") / 1000.0
     rename_map = {col: COLUMN_ALIASES.get(col, col) for col in df.columns}
     df = df.rename(columns=rename_map)
+    # Several raw columns may alias the same canonical one; the first wins.
+    df = df.loc[:, ~df.columns.duplicated()]
     for column in CANONICAL_COLUMNS:
         if column not in df.columns:
             df[column] = pd.NA
     return df[CANONICAL_COLUMNS]
 
 
+@profiled_stage("normalize.dtypes")
+def apply_canonical_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the canonical columns present in ``df`` to :data:`CANONICAL_DTYPES`.
+
+    Categories are kept in lexical order so sorting by a categorical column matches
+    sorting the underlying strings, whatever order Arrow dictionaries arrived in.
+    """
+
+    for column, dtype in CANONICAL_DTYPES.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        if dtype == "category":
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                categories = series.cat.categories
+                if not categories.is_monotonic_increasing:
+                    series = series.cat.reorder_categories(categories.sort_values())
+                df[column] = series
+            else:
+                df[column] = series.astype("category")
+        elif series.dtype != dtype:
+            df[column] = series.astype(dtype)
+    return df
+
+
+@profiled_stage("normalize.clean")
 def _clean_types(df: pd.DataFrame) -> pd.DataFrame:
     df["session_id"] = df["session_id"].astype(str)
     df["track"] = df["track"].astype(str)
@@ -130,28 +471,100 @@ def _clean_types(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _interpolate_numeric(df: pd.DataFrame) -> pd.DataFrame:
-    numeric_cols = [
-        "lap_time_s",
-        "speed_kph",
-        "throttle",
-        "brake",
-        "gear",
-        "track_temp_c",
-        "air_temp_c",
-    ]
-    df = df.sort_values(["car_id", "lap", "sector", "t_ms"])
-    for car_id, car_df in df.groupby("car_id", group_keys=False):
-        df.loc[car_df.index, numeric_cols] = (
-            car_df[numeric_cols]
-            .apply(pd.to_numeric, errors="coerce")
-            .interpolate(limit_direction="both")
-            .fillna(method="bfill")
-            .fillna(method="ffill")
-        )
+# Row order every stage after concatenation relies on; the frame is sorted once.
+SORT_KEYS = ["car_id", "lap", "sector", "t_ms"]
+
+INTERPOLATED_COLUMNS = [
+    "lap_time_s",
+    "speed_kph",
+    "throttle",
+    "brake",
+    "gear",
+    "track_temp_c",
+    "air_temp_c",
+]
+
+
+def _group_bounds(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the first and last row position of each row's group in sorted ``keys``."""
+
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts: np.ndarray = np.r_[0, boundaries]
+    ends: np.ndarray = np.r_[boundaries, keys.size] - 1
+    sizes = ends - starts + 1
+    return np.repeat(starts, sizes), np.repeat(ends, sizes)
+
+
+def _interpolate_grouped(
+    values: np.ndarray, group_start: np.ndarray, group_end: np.ndarray
+) -> np.ndarray:
+    """Linearly interpolate ``values`` by position within each contiguous group.
+
+    Equivalent to ``interpolate(limit_direction="both")`` followed by ``bfill``/``ffill``
+    per group: interior gaps are interpolated, leading/trailing gaps take the nearest
+    valid value and groups without any valid value stay NaN.
+    """
+
+    valid = ~np.isnan(values)
+    if valid.all() or not valid.any():
+        return values
+    size = values.size
+    positions = np.arange(size)
+    # Nearest valid position on either side, ignoring group boundaries for now.
+    prev_pos = np.maximum.accumulate(np.where(valid, positions, -1))
+    next_pos = np.minimum.accumulate(np.where(valid, positions, size)[::-1])[::-1]
+
+    missing = np.flatnonzero(~valid)
+    prev_m = prev_pos[missing]
+    next_m = next_pos[missing]
+    has_prev = prev_m >= group_start[missing]
+    has_next = next_m <= group_end[missing]
+    prev_vals = values[np.where(has_prev, prev_m, 0)]
+    next_vals = values[np.where(has_next, next_m, 0)]
+
+    filled = np.full(missing.size, np.nan)
+    both = has_prev & has_next
+    weight = (missing[both] - prev_m[both]) / (next_m[both] - prev_m[both])
+    filled[both] = prev_vals[both] + (next_vals[both] - prev_vals[both]) * weight
+    only_prev = has_prev & ~has_next
+    filled[only_prev] = prev_vals[only_prev]
+    only_next = has_next & ~has_prev
+    filled[only_next] = next_vals[only_next]
+
+    result = values.copy()
+    result[missing] = filled
+    return result
+
+
+def _car_keys(df: pd.DataFrame) -> np.ndarray:
+    car_ids = df["car_id"]
+    if isinstance(car_ids.dtype, pd.CategoricalDtype):
+        return car_ids.cat.codes.to_numpy()
+    return car_ids.astype(str).to_numpy()
+
+
+@profiled_stage("normalize.interpolate")
+def _interpolate_numeric(df: pd.DataFrame, presorted: bool = False) -> pd.DataFrame:
+    if not presorted:
+        df = df.sort_values(SORT_KEYS)
+    if df.empty:
+        return df
+    # Rows of a car are contiguous after the sort, so one vectorized pass per column
+    # over the car boundaries replaces the per-car loop and ``.loc`` write-back.
+    group_start, group_end = _group_bounds(_car_keys(df))
+    for column in INTERPOLATED_COLUMNS:
+        series = pd.to_numeric(df[column], errors="coerce")
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        result = _interpolate_grouped(values, group_start, group_end)
+        if pd.api.types.is_integer_dtype(series.dtype):
+            # Discrete channels such as gear snap to the nearest interpolated value.
+            df[column] = pd.array(np.round(result), dtype="Float64").astype(series.dtype)
+        else:
+            df[column] = result
     return df
 
 
+@profiled_stage("normalize.bounds")
 def _enforce_bounds(df: pd.DataFrame) -> pd.DataFrame:
     for column, (lower, upper) in NUMERIC_BOUNDS.items():
         if lower is not None:
@@ -161,62 +574,179 @@ def _enforce_bounds(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _derive_missing_lap_times(df: pd.DataFrame) -> pd.DataFrame:
-    needs_lap_time = df["lap_time_s"].isna() | (df["lap_time_s"] <= 0)
-    if needs_lap_time.any():
-        df = df.sort_values(["car_id", "lap", "sector", "t_ms"])
-        df["lap_time_s"] = df.groupby(["car_id", "lap"])["t_ms"].transform(
-            lambda s: (s - s.min()) / 1000.0
+def _needs_lap_times(df: pd.DataFrame) -> bool:
+    return bool((df["lap_time_s"].isna() | (df["lap_time_s"] <= 0)).any())
+
+
+def derive_lap_timing(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-row lap and sector timing for a frame sorted by :data:`SORT_KEYS`.
+
+    Returns a frame aligned with ``df`` holding ``lap_start_ms`` and ``lap_end_ms``
+    (first and last sample of the row's lap) and ``sector_time_ms`` (time since the
+    previous sample of the same lap, NaN on the first one). Laps are contiguous
+    runs of ``(car_id, lap)`` after the sort, so everything is computed in a
+    single vectorized pass over their boundaries.
+    """
+
+    size = len(df)
+    t_ms = pd.to_numeric(df["t_ms"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    if size == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return pd.DataFrame(
+            {"lap_start_ms": empty, "lap_end_ms": empty, "sector_time_ms": empty},
+            index=df.index,
+        )
+    car_keys = _car_keys(df)
+    laps = pd.to_numeric(df["lap"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    lap_start = np.ones(size, dtype=bool)
+    lap_start[1:] = (car_keys[1:] != car_keys[:-1]) | (laps[1:] != laps[:-1])
+    starts = np.flatnonzero(lap_start)
+    sizes = np.diff(np.append(starts, size))
+
+    # fmin/fmax skip NaN like groupby min/max; an all-NaN lap stays NaN.
+    sector_time = np.empty(size, dtype=np.float64)
+    sector_time[0] = np.nan
+    sector_time[1:] = t_ms[1:] - t_ms[:-1]
+    sector_time[lap_start] = np.nan
+    return pd.DataFrame(
+        {
+            "lap_start_ms": np.repeat(np.fmin.reduceat(t_ms, starts), sizes),
+            "lap_end_ms": np.repeat(np.fmax.reduceat(t_ms, starts), sizes),
+            "sector_time_ms": sector_time,
+        },
+        index=df.index,
+    )
+
+
+@profiled_stage("normalize.lap_times")
+def _derive_missing_lap_times(df: pd.DataFrame, force: bool = False) -> pd.DataFrame:
+    """Fill ``lap_time_s`` as time since lap start; ``df`` must be sorted by :data:`SORT_KEYS`."""
+
+    if force or _needs_lap_times(df):
+        timing = derive_lap_timing(df)
+        t_ms = pd.to_numeric(df["t_ms"], errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
         )
+        df["lap_time_s"] = (t_ms - timing["lap_start_ms"].to_numpy()) / 1000.0
     return df
 
 
-def _derive_event_date(df: pd.DataFrame) -> pd.DataFrame:
-    if df["event_date"].notna().any():
+@profiled_stage("normalize.event_date")
+def _derive_event_date(
+    df: pd.DataFrame,
+    has_event_date: bool | None = None,
+    fallback_t_ms: int | None = None,
+) -> pd.DataFrame:
+    """Parse ``event_date`` or fall back to the date of the earliest sample.
+
+    ``has_event_date`` and ``fallback_t_ms`` let batched callers apply the decision
+    taken over the whole session rather than the current batch.
+    """
+
+    if has_event_date is None:
+        has_event_date = bool(df["event_date"].notna().any())
+    if has_event_date:
         try:
             df["event_date"] = pd.to_datetime(df["event_date"], errors="coerce").dt.date
             return df
         except Exception as exc:  # noqa: BLE001
             logger.warning("normalize.event_date_parse_failed", error=str(exc))
     # fallback: use timestamp minimum
-    ts_min = pd.to_datetime(df["t_ms"], unit="ms", utc=True).min()
+    t_min = df["t_ms"].min() if fallback_t_ms is None else fallback_t_ms
+    ts_min = pd.to_datetime(t_min, unit="ms", utc=True)
     df["event_date"] = ts_min.tz_convert("UTC").date() if ts_min.tzinfo else ts_min.date()
     return df
 
 
+MANDATORY_COLUMNS = ["session_id", "track", "car_id", "lap", "sector", "t_ms", "lap_time_s"]
+
+
+@profiled_stage("normalize.validate")
+def _check_mandatory(df: pd.DataFrame) -> None:
+    if df[MANDATORY_COLUMNS].isnull().any().any():
+        missing_cols = [col for col in MANDATORY_COLUMNS if df[col].isnull().any()]
+        raise NormalizationError(f"Missing critical values after normalization: {missing_cols}")
+
+
+def _load_source(source: RawSource, session_id: str, track: str) -> pd.DataFrame:
+    """Read one raw file and bring it to the canonical columns."""
+
+    raw = _read_raw_file(source)
+    raw = _normalize_timestamp(raw)
+    raw = _coerce_columns(raw)
+    raw["session_id"] = session_id
+    raw["track"] = track
+    logger.debug("normalize.file", path=str(source), rows=len(raw))
+    return raw
+
+
+def _load_source_profiled(
+    source: RawSource, session_id: str, track: str
+) -> tuple[pd.DataFrame, list[StageStats]]:
+    """Run :func:`_load_source` in a worker process and return its stage costs too."""
+
+    with IngestProfiler() as profiler:
+        frame = _load_source(source, session_id, track)
+    return frame, list(profiler.stages.values())
+
+
+@profiled_stage("normalize.read")
+def _load_sources(
+    sources: list[RawSource], session_id: str, track: str, workers: int
+) -> list[pd.DataFrame]:
+    if workers <= 1 or len(sources) <= 1:
+        return [_load_source(source, session_id, track) for source in sources]
+    profiler = active_profiler()
+    # Spawned workers avoid inheriting locks held by the API server's threads.
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(sources)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        if profiler is None:
+            return list(pool.map(_load_source, sources, repeat(session_id), repeat(track)))
+        # Workers do not see this context's profiler; they profile themselves and
+        # their per-file stages are merged back here.
+        results = list(
+            pool.map(_load_source_profiled, sources, repeat(session_id), repeat(track))
+        )
+    for _, stages in results:
+        profiler.merge(stages)
+    return [frame for frame, _ in results]
+
+
 def normalize_files(
-    files: Iterable[Path],
+    files: Iterable[RawSource],
     session_id: str,
     track: str,
+    workers: int = 1,
 ) -> pd.DataFrame:
-    """Normalize raw telemetry files into the canonical schema."""
-
-    frames: list[pd.DataFrame] = []
-    for path in files:
-        raw = _read_raw_file(path)
-        raw = _normalize_timestamp(raw)
-        raw = _coerce_columns(raw)
-        raw["session_id"] = session_id
-        raw["track"] = track
-        frames.append(raw)
-        logger.debug("normalize.file", path=str(path), rows=len(raw))
+    """Normalize raw telemetry files into the canonical schema.
+
+    ``files`` may mix extracted paths and :class:`ArchiveMember` entries, which are
+    parsed straight out of their archive. With ``workers > 1`` files are read and
+    coerced on a process pool before being merged in their original order.
+    """
+
+    frames = _load_sources(list(files), session_id, track, workers)
 
     if not frames:
         raise NormalizationError("No telemetry data found in archive")
 
-    df = pd.concat(frames, ignore_index=True)
+    with profile_stage("normalize.concat", rows_in=sum(map(len, frames))) as stage:
+        df = pd.concat(frames, ignore_index=True)
+        stage.rows_out = len(df)
     df = _clean_types(df)
+    with profile_stage("normalize.sort", rows_in=len(df)) as stage:
+        df = df.sort_values(SORT_KEYS, ignore_index=True)
+        stage.rows_out = len(df)
     df = _derive_missing_lap_times(df)
-    df = _interpolate_numeric(df)
+    df = _interpolate_numeric(df, presorted=True)
     df = _enforce_bounds(df)
     df = _derive_event_date(df)
 
-    mandatory = ["session_id", "track", "car_id", "lap", "sector", "t_ms", "lap_time_s"]
-    if df[mandatory].isnull().any().any():
-        missing_cols = [col for col in mandatory if df[col].isnull().any()]
-        raise NormalizationError(f"Missing critical values after normalization: {missing_cols}")
+    _check_mandatory(df)
 
-    df = df.sort_values(["car_id", "lap", "sector", "t_ms"]).reset_index(drop=True)
+    df = apply_canonical_dtypes(df)
     logger.info(
         "normalize.complete",
         session_id=session_id,
@@ -228,29 +758,55 @@ def normalize_files(
     return df
 
 
+# Columns read by SessionMetricsAccumulator / compute_session_metrics.
+SESSION_METRICS_COLUMNS = ["car_id", "lap", "tire_set", "lap_time_s"]
+
+
+class SessionMetricsAccumulator:
+    """Build :func:`compute_session_metrics` output from per-car slices of a session.
+
+    Every metric is computed per car, so slices may be added one car at a time (as
+    the batched ingest does) as long as a car is never split across slices.
+    """
+
+    def __init__(self) -> None:
+        self._fastest: dict[str, float] = {}
+        self._valid_laps: set[int] = set()
+        self._stints: list[dict] = []
+
+    def add(self, df: pd.DataFrame) -> None:
+        valid_laps = df[df["lap_time_s"].between(20, 300)]
+        self._fastest.update(
+            valid_laps.groupby("car_id", observed=True)["lap_time_s"].min().to_dict()
+        )
+        self._valid_laps.update(int(lap) for lap in valid_laps["lap"].dropna().unique())
+        for car_id, car_df in df.groupby("car_id", observed=True):
+            for tire_set, stint_df in car_df.groupby("tire_set", observed=True):
+                if stint_df.empty:
+                    continue
+                self._stints.append(
+                    {
+                        "car_id": str(car_id),
+                        "tire_set": str(tire_set),
+                        "start_lap": int(stint_df["lap"].min()),
+                        "end_lap": int(stint_df["lap"].max()),
+                        "avg_pace_s": float(stint_df["lap_time_s"].mean()),
+                    }
+                )
+
+    def result(self) -> dict:
+        fastest = pd.Series(self._fastest, dtype=float).sort_values().head(1).to_dict()
+        return {
+            "fastest_lap": fastest,
+            "valid_laps": len(self._valid_laps),
+            "stints": list(self._stints),
+        }
+
+
+@profiled_stage("metrics")
 def compute_session_metrics(df: pd.DataFrame) -> dict:
     """Compute basic metrics for ingestion response."""
 
-    valid_laps = df[df["lap_time_s"].between(20, 300)]
-    fastest = (
-        valid_laps.groupby("car_id")["lap_time_s"].min().sort_values().head(1).to_dict()
-    )
-    stints: list[dict] = []
-    for car_id, car_df in df.groupby("car_id"):
-        for tire_set, stint_df in car_df.groupby("tire_set"):
-            if stint_df.empty:
-                continue
-            stints.append(
-                {
-                    "car_id": car_id,
-                    "tire_set": tire_set,
-                    "start_lap": int(stint_df["lap"].min()),
-                    "end_lap": int(stint_df["lap"].max()),
-                    "avg_pace_s": float(stint_df["lap_time_s"].mean()),
-                }
-            )
-    return {
-        "fastest_lap": fastest,
-        "valid_laps": int(valid_laps["lap"].nunique()),
-        "stints": stints,
-    }
+    accumulator = SessionMetricsAccumulator()
+    accumulator.add(df)
+    return accumulator.result()
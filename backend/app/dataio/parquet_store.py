@@ -1,44 +1,514 @@
 """Utility class for persisting normalized telemetry to Parquet."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import base64
+import functools
+import operator
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Collection, Iterator, Mapping, TypeVar
+from urllib.parse import quote, unquote
 
+import numpy as np
+import orjson
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import structlog
 
+from ..profiling import profiled_stage
+from .manifest import DatasetManifest, current_generation, file_generation
+from .normalize import SORT_KEYS, apply_canonical_dtypes
+from .table_cache import TableCache
+
 logger = structlog.get_logger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Per-session dataset objects kept around between requests.
+_DATASET_CACHE_SIZE = 128
+
+# Rows per Parquet row group; a page of laps reads at most a couple of groups.
+ROW_GROUP_SIZE = 65_536
+
+_FILTER_OPS: dict[str, Callable[[ds.Expression, Any], ds.Expression]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "isin": lambda field, value: field.isin(value),
+}
+
+
+def _filter_expression(column: str, op: str, value: object) -> ds.Expression:
+    try:
+        return _FILTER_OPS[op](ds.field(column), value)
+    except KeyError as exc:
+        raise ValueError(f"Unsupported filter operator: {op}") from exc
+
+
+@dataclass(frozen=True)
+class LapCursor:
+    """Position in a session's :data:`SORT_KEYS` order for keyset pagination.
+
+    ``seen`` counts rows already returned whose key equals ``key``, so pages stay
+    exact when several samples share the same ``(car_id, lap, sector, t_ms)``.
+    """
+
+    key: tuple[str, int, int, int]
+    seen: int = 1
+
+    def encode(self) -> str:
+        token = orjson.dumps([*self.key, self.seen])
+        return base64.urlsafe_b64encode(token).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "LapCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            car_id, lap, sector, t_ms, seen = orjson.loads(raw)
+            cursor = cls(key=(str(car_id), int(lap), int(sector), int(t_ms)), seen=int(seen))
+        except (ValueError, TypeError, orjson.JSONDecodeError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        if cursor.seen < 0:
+            raise ValueError("Invalid cursor")
+        return cursor
+
+    @classmethod
+    def after_page(cls, page: pd.DataFrame, previous: "LapCursor | None" = None) -> "LapCursor":
+        """Cursor pointing just past the last row of ``page``."""
+
+        last = page.iloc[-1]
+        key = (str(last["car_id"]), int(last["lap"]), int(last["sector"]), int(last["t_ms"]))
+        same = _compare_keys(page, key) == 0
+        # Trailing rows sharing the last key; the page is sorted so they are contiguous.
+        trailing = len(page) - int(np.flatnonzero(~same)[-1]) - 1 if not same.all() else len(page)
+        if previous is not None and previous.key == key and same.all():
+            trailing += previous.seen
+        return cls(key=key, seen=trailing)
+
+    def seek(self, df: pd.DataFrame) -> tuple[pd.DataFrame, "LapCursor | None"]:
+        """Drop the rows of sorted ``df`` up to and including this position.
+
+        Returns the remaining rows and the cursor still to apply to the next chunk,
+        or ``None`` once the position has been passed.
+        """
+
+        order = _compare_keys(df, self.key)
+        equal = np.flatnonzero(order == 0)
+        keep = order > 0
+        keep[equal[self.seen :]] = True
+        remaining = self.seen - min(self.seen, equal.size)
+        rest = df[keep].reset_index(drop=True)
+        if remaining and not (order > 0).any():
+            return rest, LapCursor(key=self.key, seen=remaining)
+        return rest, None
+
+
+def _compare_keys(df: pd.DataFrame, key: tuple) -> np.ndarray:
+    """Lexicographic comparison of each row's :data:`SORT_KEYS` with ``key`` (-1/0/1)."""
+
+    order = np.zeros(len(df), dtype=np.int8)
+    undecided = np.ones(len(df), dtype=bool)
+    for column, value in zip(SORT_KEYS, key):
+        values = df[column]
+        values = values.astype(str).to_numpy() if column == "car_id" else values.to_numpy()
+        less = undecided & (values < value)
+        greater = undecided & (values > value)
+        order[less] = -1
+        order[greater] = 1
+        undecided &= ~(less | greater)
+    return order
+
+
+def _entirely_before(stats: list, key: tuple) -> bool:
+    """Whether row-group statistics prove every row sorts strictly before ``key``."""
+
+    for column_stats, value in zip(stats, key):
+        if column_stats is None or not column_stats.has_min_max:
+            return False
+        if column_stats.max < value:
+            return True
+        if column_stats.min != column_stats.max or column_stats.min != value:
+            return False
+    return False
+
+
+def _distinct_car_ids(files: list[Path]) -> tuple[list[str], bool]:
+    """Sorted car ids across ``files`` and whether any row lacks one, read in batches."""
+
+    car_ids: set[str] = set()
+    has_null = False
+    for path in files:
+        for batch in pq.ParquetFile(path).iter_batches(columns=["car_id"]):
+            column = batch.column(0)
+            if pa.types.is_dictionary(column.type):
+                column = column.dictionary_decode()
+            has_null = has_null or column.null_count > 0
+            car_ids.update(value for value in pc.unique(column).to_pylist() if value is not None)
+    return sorted(car_ids), has_null
+
+
+def _sorted_parquet_file(path: Path) -> pq.ParquetFile | None:
+    """Open ``path`` if every row group declares :data:`SORT_KEYS` ordering."""
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    if any(column not in schema.names for column in SORT_KEYS):
+        return None
+    expected = pq.SortingColumn.from_ordering(
+        schema, [(column, "ascending") for column in SORT_KEYS]
+    )
+    if metadata.num_row_groups == 0 or any(
+        metadata.row_group(index).sorting_columns != expected
+        for index in range(metadata.num_row_groups)
+    ):
+        return None
+    return parquet_file
+
+
+class PartitionWriter:
+    """Write a new generation of one store partition.
+
+    Rows go to a hidden temporary file, which dataset discovery ignores, and
+    :meth:`close` publishes it with a single rename as ``g<generation>-<id>.parquet``.
+    Readers only consider the newest generation of a partition, so they see
+    either the previous data or the complete new data, never a mix. Superseded
+    files are deleted once the new generation is in place.
+
+    Rows must arrive in :data:`SORT_KEYS` order; the file declares that ordering
+    in its row-group metadata so readers can page through it without sorting.
+    """
+
+    def __init__(
+        self, directory: Path, drop_columns: list[str], row_group_size: int = ROW_GROUP_SIZE
+    ) -> None:
+        self.directory = directory
+        self.drop_columns = drop_columns
+        self.row_group_size = row_group_size
+        self._name = uuid.uuid4().hex
+        self._tmp_path = directory / f".{self._name}.parquet.tmp"
+        self._writer: pq.ParquetWriter | None = None
+        self.path: Path | None = None
+        self.superseded: list[Path] = []
+        self.rows = 0
+
+    def write(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        frame = df.drop(columns=self.drop_columns, errors="ignore")
+        schema = self._writer.schema if self._writer is not None else None
+        table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+        if self._writer is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            sorting = pq.SortingColumn.from_ordering(
+                table.schema, [(column, "ascending") for column in SORT_KEYS]
+            )
+            self._writer = pq.ParquetWriter(
+                self._tmp_path, table.schema, sorting_columns=sorting
+            )
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows += len(frame)
+
+    def close(self, replaces: Collection[str] | None = None) -> Path | None:
+        """Publish the file and drop the generations it supersedes.
+
+        With ``replaces`` the write is only published if the partition's current
+        files are still exactly those names; otherwise it is discarded and
+        ``None`` is returned.
+        """
+
+        if self._writer is None:
+            return None
+        self._writer.close()
+        self._writer = None
+        if replaces is not None and set(_current_files(self.directory)) != set(replaces):
+            logger.info("parquet.publish_skipped", directory=str(self.directory))
+            self.abort()
+            return None
+        generation = time.time_ns()
+        self.path = self.directory / f"g{generation:020d}-{self._name}.parquet"
+        self._tmp_path.rename(self.path)
+        for path in self.directory.glob("*.parquet"):
+            if path != self.path and file_generation(path.name) < generation:
+                path.unlink(missing_ok=True)
+                self.superseded.append(path)
+        return self.path
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def _retry_if_replaced(method: F) -> F:
+    """Retry a read once if a file vanished because its partition was replaced meanwhile."""
+
+    @functools.wraps(method)
+    def wrapper(self: "ParquetStore", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        except FileNotFoundError:
+            logger.info("parquet.read_retry", method=method.__name__)
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _project(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+    if columns is None or df.empty:
+        return df
+    return df[columns]
+
+
+def _encode_partition_columns(table: pa.Table, partition_cols: list[str]) -> pa.Table:
+    """Dictionary-encode partition columns, which the dataset returns as plain strings."""
+
+    for index, field_ in enumerate(table.schema):
+        if field_.name in partition_cols and pa.types.is_string(field_.type):
+            table = table.set_column(index, field_.name, pc.dictionary_encode(table[index]))
+    return table
+
+
+def _current_files(directory: Path) -> list[str]:
+    try:
+        names = [
+            entry.name
+            for entry in os.scandir(directory)
+            if entry.name.endswith(".parquet") and not entry.name.startswith((".", "_"))
+        ]
+    except FileNotFoundError:
+        return []
+    return current_generation(names)
+
 
 @dataclass
 class ParquetStore:
     root: Path
     partition_cols: list[str]
+    row_group_size: int = ROW_GROUP_SIZE
+    table_cache: TableCache | None = None
+    manifest: DatasetManifest = field(init=False, repr=False)
+    _locks: dict[Path, tuple[threading.Lock, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _locks_guard: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _datasets: OrderedDict[tuple[str, str | None], tuple[tuple[Path, ...], ds.Dataset]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         self.root = self.root.expanduser().resolve()
         self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest = DatasetManifest(self.root, self.partition_cols)
 
-    def write_session(self, df: pd.DataFrame) -> None:
-        if df.empty:
-            raise ValueError("Cannot write empty dataframe")
-        table = pa.Table.from_pandas(df, preserve_index=False)
-        pq.write_to_dataset(
-            table,
-            root_path=str(self.root),
-            partition_cols=self.partition_cols,
-            existing_data_behavior="overwrite_or_ignore",
+    def _session_dataset(
+        self, session_id: str, track: str | None
+    ) -> tuple[tuple[Path, ...], ds.Dataset] | None:
+        """The session's files and a dataset over them, or ``None`` if it has no data.
+
+        The file list comes from the manifest, so other sessions' directories are
+        never listed or opened. Without ``track`` every track of the session is
+        included. Datasets are reused until the session's files change.
+        """
+
+        partition = {"session_id": session_id}
+        if track:
+            partition["track"] = track
+        files = tuple(self.manifest.files(**partition))
+        if not files:
+            return None
+        key = (session_id, track)
+        cached = self._datasets.get(key)
+        if cached is not None and cached[0] == files:
+            self._datasets.move_to_end(key)
+            return cached
+        dataset = ds.dataset(
+            [str(path) for path in files],
+            format="parquet",
+            partitioning=self.partitioning,
+            partition_base_dir=str(self.root),
+        )
+        self._datasets[key] = (files, dataset)
+        self._datasets.move_to_end(key)
+        while len(self._datasets) > _DATASET_CACHE_SIZE:
+            self._datasets.popitem(last=False)
+        return files, dataset
+
+    def session_generation(self, session_id: str, track: str | None = None) -> int:
+        """Data generation of a session, or 0 if it has no data.
+
+        Every write of a session partition publishes files of a newer generation,
+        so the value moves forward whenever the session's data (or its file layout,
+        after compaction) changes, including writes made by other processes.
+
+        The lookup only stats the manifest's directories, so handlers call it on
+        the event loop: ETag revalidations and cache hits are never queued behind,
+        or shed with, the I/O lane's full reads.
+        """
+
+        partition = {"session_id": session_id}
+        if track:
+            partition["track"] = track
+        return max(
+            (file_generation(path.name) for path in self.manifest.files(**partition)),
+            default=0,
+        )
+
+    @property
+    def partitioning(self) -> ds.Partitioning:
+        """Hive partitioning matching the layout produced by :meth:`write_session`."""
+
+        schema = pa.schema([(column, pa.string()) for column in self.partition_cols])
+        return ds.partitioning(schema, flavor="hive")
+
+    def partition_dir(self, partition: Mapping[str, object]) -> Path:
+        """Directory holding ``partition``, using the hive layout of ``write_to_dataset``."""
+
+        missing = [column for column in self.partition_cols if column not in partition]
+        if missing:
+            raise ValueError(f"Missing partition values: {missing}")
+        segments = [
+            f"{column}={quote(str(partition[column]), safe='')}" for column in self.partition_cols
+        ]
+        return self.root.joinpath(*segments)
+
+    @contextmanager
+    def _partition_lock(self, directory: Path) -> Iterator[None]:
+        """Serialise publishes to ``directory``.
+
+        Locks are counted by their holders and waiters and dropped once unused, so
+        the table only holds partitions that are being written right now.
+        """
+
+        with self._locks_guard:
+            lock, users = self._locks.get(directory, (threading.Lock(), 0))
+            self._locks[directory] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._locks_guard:
+                lock, users = self._locks[directory]
+                if users == 1:
+                    del self._locks[directory]
+                else:
+                    self._locks[directory] = (lock, users - 1)
+
+    @contextmanager
+    def partition_writer(
+        self, partition: Mapping[str, object], replaces: Collection[str] | None = None
+    ) -> Iterator[PartitionWriter]:
+        """Stream row groups into a new generation of one partition.
+
+        The partition's previous contents are replaced when the block exits. See
+        :meth:`PartitionWriter.close` for ``replaces``.
+        """
+
+        directory = self.partition_dir(partition)
+        writer = PartitionWriter(
+            directory,
+            drop_columns=self.partition_cols,
+            row_group_size=self.row_group_size,
         )
+        try:
+            yield writer
+        except BaseException:
+            writer.abort()
+            raise
+        with self._partition_lock(directory):
+            path = writer.close(replaces=replaces)
+        if path is None:
+            return
+        self.manifest.record(partition)
+        if self.table_cache is not None and "session_id" in partition:
+            self.table_cache.invalidate(str(partition["session_id"]))
         logger.info(
             "parquet.write",
             partitions=self.partition_cols,
-            rows=len(df),
+            rows=writer.rows,
             root=str(self.root),
+            path=str(path),
+            superseded=len(writer.superseded),
+        )
+
+    @profiled_stage("parquet.write")
+    def write_session(self, df: pd.DataFrame) -> None:
+        """Atomically replace every partition present in ``df`` with its rows."""
+
+        if df.empty:
+            raise ValueError("Cannot write empty dataframe")
+        for values, partition_df in df.groupby(self.partition_cols, observed=True, sort=False):
+            partition = dict(zip(self.partition_cols, values))
+            with self.partition_writer(partition) as writer:
+                writer.write(partition_df.sort_values(SORT_KEYS))
+
+    def compact(self) -> int:
+        """Compact every partition that needs it; return how many were rewritten."""
+
+        partitions = self.manifest.partitions()
+        compacted = sum(self.compact_partition(partition) for partition in partitions)
+        logger.info("parquet.compact", root=str(self.root), compacted=compacted)
+        return compacted
+
+    def compact_partition(self, partition: Mapping[str, object]) -> bool:
+        """Merge a partition's files into one sorted file of full row groups.
+
+        The merge runs one car at a time, so memory is bounded by the largest car
+        rather than the whole partition. Partitions that already are a single
+        sorted file with full row groups are left alone. If the partition is
+        rewritten concurrently, the compacted copy is discarded rather than
+        published over the newer data.
+        """
+
+        values = {column: str(partition[column]) for column in self.partition_cols}
+        files = self.manifest.files(**values)
+        if not files or not self._needs_compaction(files):
+            return False
+        car_ids, has_null_car = _distinct_car_ids(files)
+        car_filters = [pc.field("car_id") == car_id for car_id in car_ids]
+        if has_null_car:
+            # sort_values puts missing keys last.
+            car_filters.append(pc.field("car_id").is_null())
+        pending = pd.DataFrame()
+        with self.partition_writer(partition, replaces=[path.name for path in files]) as writer:
+            for car_filter in car_filters:
+                frames = [pq.read_table(path, filters=car_filter).to_pandas() for path in files]
+                df = apply_canonical_dtypes(pd.concat(frames, ignore_index=True))
+                df = df.sort_values(SORT_KEYS, kind="stable", ignore_index=True)
+                pending = apply_canonical_dtypes(pd.concat([pending, df], ignore_index=True))
+                # Carry the tail over so small cars share full row groups.
+                full = len(pending) - len(pending) % self.row_group_size
+                writer.write(pending.iloc[:full])
+                pending = pending.iloc[full:]
+            writer.write(pending)
+        return writer.path is not None
+
+    def _needs_compaction(self, files: list[Path]) -> bool:
+        if len(files) > 1:
+            return True
+        parquet_file = _sorted_parquet_file(files[0])
+        if parquet_file is None:
+            return True
+        metadata = parquet_file.metadata
+        return (
+            metadata.num_row_groups > 1
+            and metadata.num_rows / metadata.num_row_groups < self.row_group_size / 2
         )
 
+    @_retry_if_replaced
     def read_session(
         self,
         session_id: str,
@@ -46,21 +516,50 @@ class ParquetStore:
         columns: list[str] | None = None,
         filters: list[tuple[str, str, object]] | None = None,
     ) -> pd.DataFrame:
-        if not any(self.root.glob("**/*.parquet")):
+        """Read a session, optionally projected to ``columns`` and filtered.
+
+        ``filters`` are ``(column, op, value)`` triples, see :data:`_FILTER_OPS`.
+        With a :class:`TableCache` the unfiltered projection is cached and
+        filters are applied in memory, so differently filtered reads of a hot
+        session share one decoded table.
+        """
+
+        session = self._session_dataset(session_id, track)
+        if session is None:
             return pd.DataFrame()
-        dataset = ds.dataset(self.root, format="parquet")
-        filter_exprs: list[ds.Expression] = [ds.field("session_id") == session_id]
-        if track:
-            filter_exprs.append(ds.field("track") == track)
-        if filters:
-            for column, op, value in filters:
-                filter_exprs.append(getattr(ds.field(column), op)(value))
-        combined = filter_exprs[0]
-        for expr in filter_exprs[1:]:
-            combined = combined & expr
-        table = dataset.to_table(filter=combined, columns=columns)
-        return table.to_pandas()
+        files, dataset = session
+        expr = None
+        for column, op, value in filters or []:
+            column_expr = _filter_expression(column, op, value)
+            expr = column_expr if expr is None else expr & column_expr
+
+        if self.table_cache is None:
+            table = dataset.to_table(filter=expr, columns=columns)
+            return apply_canonical_dtypes(table.to_pandas())
+
+        read_columns = columns
+        if columns is not None and filters:
+            extra = [column for column, _, _ in filters if column not in columns]
+            read_columns = [*columns, *dict.fromkeys(extra)]
+        key = (
+            session_id,
+            track,
+            None if read_columns is None else tuple(read_columns),
+            files,
+        )
+        table = self.table_cache.get(key)
+        if table is None:
+            table = _encode_partition_columns(
+                dataset.to_table(columns=read_columns), self.partition_cols
+            )
+            self.table_cache.put(key, table)
+        if expr is not None:
+            table = table.filter(expr)
+        if columns is not None:
+            table = table.select(columns)
+        return apply_canonical_dtypes(table.to_pandas())
 
+    @_retry_if_replaced
     def scan_laps(
         self,
         session_id: str,
@@ -68,22 +567,167 @@ class ParquetStore:
         offset: int = 0,
         limit: int = 500,
         track: str | None = None,
+        after: LapCursor | None = None,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
+        """Return up to ``limit`` rows of the session in :data:`SORT_KEYS` order.
+
+        The page starts ``offset`` rows in, or right after ``after`` when a cursor
+        is given (``offset`` is then ignored). Only ``columns`` are returned when
+        given; the sort keys are read regardless. A session stored as a single sorted
+        file is paged from row-group metadata and only the groups overlapping the
+        page are read. Sessions spread over several files (several tracks, or
+        repeated ingests) are read and sorted.
+        """
+
+        partition = {"session_id": session_id}
+        if track:
+            partition["track"] = track
+        read_columns = file_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys([*SORT_KEYS, *columns]))
+            file_columns = [column for column in read_columns if column not in self.partition_cols]
+        files = self.manifest.files(**partition)
+        if len(files) == 1:
+            parquet_file = _sorted_parquet_file(files[0])
+            if parquet_file is not None:
+                if after is None:
+                    page = self._scan_offset(parquet_file, car_id, offset, limit, file_columns)
+                else:
+                    page = self._scan_after(parquet_file, car_id, after, limit, file_columns)
+                return _project(self._with_partition_values(page, files[0]), columns)
+
         filters = [("session_id", "eq", session_id)]
         if car_id:
             filters.append(("car_id", "eq", car_id))
         if track:
             filters.append(("track", "eq", track))
-        if not any(self.root.glob("**/*.parquet")):
+        session = self._session_dataset(session_id, track)
+        if session is None:
             return pd.DataFrame()
-        dataset = ds.dataset(self.root, format="parquet")
+        _, dataset = session
         expr = None
         for column, op, value in filters:
-            column_expr = getattr(ds.field(column), op)(value)
+            column_expr = _filter_expression(column, op, value)
             expr = column_expr if expr is None else expr & column_expr
         if expr is None:
             raise ValueError("No filters applied")
-        table = dataset.scan(columns=None, filter=expr).to_table()
-        df = table.to_pandas()
-        df = df.sort_values(["car_id", "lap", "sector", "t_ms"])
-        return df.iloc[offset : offset + limit]
+        table = dataset.to_table(filter=expr, columns=read_columns)
+        df = apply_canonical_dtypes(table.to_pandas())
+        df = df.sort_values(SORT_KEYS, ignore_index=True, kind="stable")
+        logger.debug("parquet.scan_laps", session_id=session_id, mode="sort", rows=len(df))
+        if after is not None:
+            df, _ = after.seek(df)
+            return _project(df.iloc[:limit], columns)
+        return _project(df.iloc[offset : offset + limit], columns)
+
+    def _scan_offset(
+        self,
+        parquet_file: pq.ParquetFile,
+        car_id: str | None,
+        offset: int,
+        limit: int,
+        columns: list[str] | None = None,
+    ) -> pa.Table | None:
+        metadata = parquet_file.metadata
+        # Matching rows per row group. With a car filter only the groups whose
+        # statistics straddle the car boundary need their car_id column read.
+        car_index = parquet_file.schema_arrow.get_field_index("car_id")
+        counts: list[tuple[int, int]] = []
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            if car_id is None:
+                counts.append((index, row_group.num_rows))
+                continue
+            stats = row_group.column(car_index).statistics
+            if stats is not None and stats.has_min_max:
+                if not stats.min <= car_id <= stats.max:
+                    continue
+                if stats.min == stats.max:
+                    counts.append((index, row_group.num_rows))
+                    continue
+            cars = parquet_file.read_row_group(index, columns=["car_id"]).column(0)
+            matched = pc.sum(pc.equal(cars, car_id)).as_py() or 0
+            if matched:
+                counts.append((index, matched))
+
+        selected: list[int] = []
+        skip = 0
+        position = 0
+        for index, rows in counts:
+            if position >= offset + limit:
+                break
+            if position + rows > offset:
+                if not selected:
+                    skip = offset - position
+                selected.append(index)
+            position += rows
+        if not selected:
+            return None
+
+        table = parquet_file.read_row_groups(selected, columns=columns)
+        if car_id is not None:
+            table = table.filter(pc.equal(table["car_id"], car_id))
+        logger.debug("parquet.scan_laps", mode="row_groups", row_groups=len(selected))
+        return table.slice(skip, limit)
+
+    def _scan_after(
+        self,
+        parquet_file: pq.ParquetFile,
+        car_id: str | None,
+        after: LapCursor,
+        limit: int,
+        columns: list[str] | None = None,
+    ) -> pa.Table | None:
+        """Seek past ``after`` using row-group statistics, then read ``limit`` rows."""
+
+        metadata = parquet_file.metadata
+        schema = parquet_file.schema_arrow
+        key_indexes = [schema.get_field_index(column) for column in SORT_KEYS]
+        car_index = key_indexes[0]
+        pieces: list[pd.DataFrame] = []
+        rows = 0
+        read = 0
+        cursor: LapCursor | None = after
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            if cursor is not None:
+                key_stats = [row_group.column(column).statistics for column in key_indexes]
+                if _entirely_before(key_stats, after.key):
+                    continue
+            if car_id is not None:
+                car_stats = row_group.column(car_index).statistics
+                if car_stats is not None and car_stats.has_min_max:
+                    if car_stats.max < car_id:
+                        continue
+                    if car_stats.min > car_id:
+                        break
+            df = parquet_file.read_row_group(index, columns=columns).to_pandas()
+            read += 1
+            if car_id is not None:
+                df = df[df["car_id"].astype(str).to_numpy() == car_id]
+            if cursor is not None:
+                df, cursor = cursor.seek(df)
+            pieces.append(df)
+            rows += len(df)
+            if rows >= limit:
+                break
+        logger.debug("parquet.scan_laps", mode="seek", row_groups=read)
+        if not rows:
+            return None
+        page = pd.concat(pieces, ignore_index=True).iloc[:limit]
+        return pa.Table.from_pandas(page, preserve_index=False)
+
+    def _with_partition_values(self, table: pa.Table | None, path: Path) -> pd.DataFrame:
+        if table is None or table.num_rows == 0:
+            return pd.DataFrame()
+        for column, value in self._partition_values(path).items():
+            table = table.append_column(column, pa.array([value] * table.num_rows, pa.string()))
+        return apply_canonical_dtypes(table.to_pandas())
+
+    def _partition_values(self, path: Path) -> dict[str, str]:
+        segments = path.relative_to(self.root).parts[: len(self.partition_cols)]
+        return {
+            column: unquote(segment.split("=", 1)[1])
+            for column, segment in zip(self.partition_cols, segments)
+        }
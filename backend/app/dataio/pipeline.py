@@ -0,0 +1,43 @@
+"""End-to-end ingest of one telemetry archive into the Parquet store."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from .chunked import ingest_streaming
+from .extract import list_zip_members
+from .normalize import compute_session_metrics, normalize_files
+from .parquet_store import ParquetStore
+
+
+def ingest_archive(
+    zip_path: Path,
+    session_id: str,
+    track: str,
+    store: ParquetStore,
+    *,
+    batch_rows: int = 0,
+    workers: int = 1,
+    spill_dir: Path | None = None,
+) -> dict:
+    """Normalize ``zip_path``, replace the session in ``store`` and return its metrics.
+
+    With ``batch_rows > 0`` the archive is normalized out of core (spilling to
+    ``spill_dir`` if given); otherwise in memory with ``workers`` parser
+    processes. Running it again for the same session replaces the previous data,
+    so an interrupted ingest can simply be restarted.
+    """
+
+    members = list_zip_members(zip_path)
+    if batch_rows > 0:
+        result = ingest_streaming(
+            members,
+            session_id=session_id,
+            track=track,
+            store=store,
+            batch_rows=batch_rows,
+            spill_dir=spill_dir,
+        )
+        return result.metrics
+    normalized = normalize_files(members, session_id=session_id, track=track, workers=workers)
+    store.write_session(normalized)
+    return compute_session_metrics(normalized)
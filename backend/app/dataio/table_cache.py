@@ -0,0 +1,88 @@
+"""In-process LRU cache of decoded Arrow tables for hot sessions."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Hashable
+
+import pyarrow as pa
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class TableCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class TableCache:
+    """Least-recently-used cache of Arrow tables bounded by their decoded size.
+
+    Keys start with the session id so every entry of a session can be dropped
+    when it is rewritten. Tables larger than the whole budget are not cached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, pa.Table] = OrderedDict()
+        self._bytes = 0
+        self._stats = TableCacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> pa.Table | None:
+        with self._lock:
+            table = self._entries.get(key)
+            if table is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return table
+
+    def put(self, key: tuple[Hashable, ...], table: pa.Table) -> None:
+        size = table.nbytes
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = table
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._stats.evictions += 1
+
+    def invalidate(self, session_id: str) -> int:
+        """Drop every entry of ``session_id``; return how many were removed."""
+
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == session_id]
+            for key in stale:
+                self._bytes -= self._entries.pop(key).nbytes
+            self._stats.invalidations += len(stale)
+        if stale:
+            logger.info("table_cache.invalidate", session_id=session_id, entries=len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
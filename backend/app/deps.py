@@ -2,31 +2,75 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import AsyncIterator
 
-import redis.asyncio as aioredis
-from fastapi import Depends
+from fastapi import Request
+from fastapi.requests import HTTPConnection
 
+from .broadcast import SessionBroadcaster
+from .cache import RedisCache
+from .coalesce import RequestCoalescer
 from .config import Settings, get_settings
 from .dataio.parquet_store import ParquetStore
+from .dataio.table_cache import TableCache
+from .execution import ExecutionLayer
+from .jobs import JobManager
 
 
 @lru_cache(maxsize=1)
 def _get_parquet_store() -> ParquetStore:
     settings = get_settings()
-    return ParquetStore(root=settings.data_dir / "parquet", partition_cols=settings.parquet_partition_cols)
+    table_cache = TableCache(settings.table_cache_bytes) if settings.table_cache_bytes > 0 else None
+    return ParquetStore(
+        root=settings.data_dir / "parquet",
+        partition_cols=settings.parquet_partition_cols,
+        table_cache=table_cache,
+    )
 
 
 def get_parquet_store() -> ParquetStore:
     return _get_parquet_store()
 
 
-async def get_redis(settings: Settings = Depends(get_settings)) -> AsyncIterator[aioredis.Redis]:
-    client = aioredis.from_url(settings.redis_url, decode_responses=True)
-    try:
-        yield client
-    finally:
-        await client.close()
+@lru_cache(maxsize=1)
+def _get_executor() -> ExecutionLayer:
+    settings = get_settings()
+    return ExecutionLayer(
+        io_workers=settings.io_workers,
+        cpu_workers=settings.cpu_workers,
+        io_queue_limit=settings.io_queue_limit,
+        cpu_queue_limit=settings.cpu_queue_limit,
+        retry_after_s=settings.overload_retry_after_seconds,
+    )
+
+
+def get_executor() -> ExecutionLayer:
+    return _get_executor()
+
+
+def shutdown_executor() -> None:
+    if _get_executor.cache_info().currsize:
+        _get_executor().shutdown()
+        _get_executor.cache_clear()
+
+
+def get_redis(request: Request) -> RedisCache:
+    """The application's shared :class:`RedisCache`, opened in the lifespan."""
+
+    return request.app.state.redis
+
+
+def get_coalescer(request: Request) -> RequestCoalescer:
+    return request.app.state.coalescer
+
+
+def get_broadcaster(connection: HTTPConnection) -> SessionBroadcaster:
+    """Works for WebSocket routes too, which cannot depend on ``Request``."""
+
+    return connection.app.state.broadcaster
+
+
+def get_jobs(request: Request) -> JobManager:
+    return request.app.state.jobs
 
 
 def get_settings_dependency() -> Settings:
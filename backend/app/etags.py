@@ -0,0 +1,41 @@
+"""Strong ETags and ``If-None-Match`` handling for session read endpoints.
+
+A response is fully determined by its cache key (endpoint, parameters, media
+type and the session's data generation, see :func:`~backend.app.cache.session_key`),
+so the ETag is a digest of that key. Endpoints can answer a matching
+``If-None-Match`` with 304 after looking up the generation, without reading or
+encoding any data.
+"""
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response
+from starlette import status
+
+# Let clients store responses but revalidate them on every use.
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(key: str) -> str:
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether ``If-None-Match`` lists ``etag`` (weak comparison, as RFC 9110 requires)."""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(",")
+    )
+
+
+def etag_headers(etag: str, **extra: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL, **extra}
+
+
+def not_modified(etag: str, **extra: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag, **extra))
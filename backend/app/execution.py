@@ -0,0 +1,178 @@
+"""Run blocking work off the event loop, with admission control.
+
+Route handlers are ``async def`` so that health checks and WebSocket streams keep
+flowing while other requests wait. Blocking store I/O (pyarrow reads, Parquet
+writes, the pandas aggregations that follow them) goes to a thread pool through
+:meth:`ExecutionLayer.io`; model fits and DTW, which hold the GIL, go to a
+process pool through :meth:`ExecutionLayer.cpu`.
+
+Each pool is a :class:`Lane` with a fixed number of slots (workers plus a
+bounded queue). A call that finds no free slot raises :class:`Overloaded`
+straight away instead of queueing without limit; the API turns it into a 503
+with ``Retry-After``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class Overloaded(RuntimeError):
+    """Raised when a lane has no free slot for another call."""
+
+    def __init__(self, lane: str, retry_after_s: int) -> None:
+        super().__init__(f"{lane} workers are busy, retry in {retry_after_s}s")
+        self.lane = lane
+        self.retry_after_s = retry_after_s
+
+
+class Lane:
+    """A worker pool plus the slot accounting that bounds its queue.
+
+    A slot is held until the submitted call finishes, even if the awaiting
+    request was cancelled, so the limit reflects work actually queued on the pool.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Executor],
+        workers: int,
+        queue_limit: int,
+        retry_after_s: int,
+    ) -> None:
+        self.name = name
+        self.workers = workers
+        self.limit = workers + queue_limit
+        self.retry_after_s = retry_after_s
+        self._factory = factory
+        self._pool: Executor | None = None
+        self._in_flight = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> Executor:
+        # Created on first use so idle lanes (and spawned processes) cost nothing.
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._factory()
+            return self._pool
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight >= self.limit:
+                self._rejected += 1
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, *_: object) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def submit(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        if not self.try_acquire():
+            logger.warning("execution.overloaded", lane=self.name, limit=self.limit)
+            raise Overloaded(self.name, self.retry_after_s)
+        try:
+            future = self.pool.submit(func, *args, **kwargs)
+        except BaseException:
+            self.release()
+            raise
+        future.add_done_callback(self.release)
+        return future
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ExecutionLayer:
+    """Thread lane for blocking I/O and process lane for CPU-bound model work.
+
+    With ``cpu_workers=0`` CPU work shares the thread lane, which avoids spawning
+    processes on small deployments at the cost of holding the GIL.
+    """
+
+    def __init__(
+        self,
+        io_workers: int = 8,
+        cpu_workers: int = 2,
+        io_queue_limit: int = 32,
+        cpu_queue_limit: int = 8,
+        retry_after_s: int = 5,
+    ) -> None:
+        self.io_lane = Lane(
+            "io",
+            lambda: ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="gr-io"),
+            io_workers,
+            io_queue_limit,
+            retry_after_s,
+        )
+        self.cpu_lane = self.io_lane
+        if cpu_workers > 0:
+            # Spawned workers avoid inheriting locks held by the API server's threads.
+            self.cpu_lane = Lane(
+                "cpu",
+                lambda: ProcessPoolExecutor(
+                    max_workers=cpu_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ),
+                cpu_workers,
+                cpu_queue_limit,
+                retry_after_s,
+            )
+
+    async def io(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run blocking ``func`` on the thread lane, in a copy of the current context."""
+
+        context = contextvars.copy_context()
+        return await self.io_lane.run(context.run, functools.partial(func, *args, **kwargs))
+
+    async def cpu(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run CPU-bound ``func`` on the process lane.
+
+        ``func`` and its arguments must be picklable, so pass module-level
+        functions or methods of picklable objects.
+        """
+
+        if self.cpu_lane is self.io_lane:
+            return await self.io(func, *args, **kwargs)
+        return await self.cpu_lane.run(func, *args, **kwargs)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        lanes = {"io": self.io_lane.stats()}
+        if self.cpu_lane is not self.io_lane:
+            lanes["cpu"] = self.cpu_lane.stats()
+        return lanes
+
+    def shutdown(self) -> None:
+        self.io_lane.shutdown()
+        if self.cpu_lane is not self.io_lane:
+            self.cpu_lane.shutdown()
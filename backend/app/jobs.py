@@ -0,0 +1,373 @@
+"""Background ingest jobs with persisted status.
+
+``POST /api/sessions/{id}/ingest`` only records an :class:`IngestJob` and
+returns; a :class:`JobManager` runs queued jobs in the background. Each job is a
+JSON file under ``<DATA_DIR>/jobs``, rewritten as it progresses, so any API
+worker can answer status polls.
+
+So that concurrent ingests cannot saturate the disk, a job only runs while it
+holds one of ``workers`` slot files in that directory, shared by every API
+worker, and the lock file of its session, so two ingests of one session never
+race. A manager also holds a lock file per job it has queued or is running.
+
+Lock files are published complete with a hard link and name their owner. The
+owner renews their mtime every third of ``lease_s``; a lock whose mtime is
+older than the lease belongs to a dead process and is taken over. Liveness is
+judged by this heartbeat rather than by PID, because containers sharing
+``DATA_DIR`` all run the API as PID 1.
+
+Ingest replaces the session atomically, so a job interrupted by a crash is
+resumed by running it again from the start. On startup, and on every heartbeat,
+a manager adopts unfinished jobs whose lock has lapsed, up to ``max_attempts``
+runs per job.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import quote
+
+import orjson
+import structlog
+
+from .config import Settings
+from .dataio import ingest_archive
+from .dataio.parquet_store import ParquetStore
+from .execution import Overloaded
+from .profiling import IngestProfiler, StageStats
+
+logger = structlog.get_logger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+UNFINISHED = (QUEUED, RUNNING)
+
+# Minimum seconds between progress writes while a job runs.
+_PROGRESS_INTERVAL_S = 0.5
+# Seconds between attempts to take a lock held by another job.
+_LOCK_POLL_S = 0.2
+# Seconds without a heartbeat after which a lock's owner is presumed dead.
+LEASE_S = 30.0
+
+
+@dataclass
+class IngestJob:
+    job_id: str
+    session_id: str
+    track: str
+    zip_path: str
+    status: str = QUEUED
+    stage: str | None = None
+    rows_processed: int = 0
+    attempts: int = 0
+    owner_pid: int | None = None
+    owner_boot: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    metrics: dict[str, Any] | None = None
+    profile: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "IngestJob":
+        known = {item.name for item in fields(cls)}
+        return cls(**{key: value for key, value in payload.items() if key in known})
+
+
+class JobManager:
+    """Queue and run ingest jobs, at most ``workers`` at a time across all processes.
+
+    At most ``queue_limit`` submitted jobs may wait for a thread; further
+    submissions raise :class:`~backend.app.execution.Overloaded`. The store is
+    looked up through ``store_provider`` when a job runs.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        store_provider: Callable[[], ParquetStore],
+        settings: Settings,
+        workers: int = 1,
+        queue_limit: int = 8,
+        max_attempts: int = 3,
+        retry_after_s: int = 5,
+        lease_s: float = LEASE_S,
+    ) -> None:
+        self.directory = directory
+        self.store_provider = store_provider
+        self.settings = settings
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.max_attempts = max_attempts
+        self.retry_after_s = retry_after_s
+        self.lease_s = lease_s
+        self.boot_id = uuid.uuid4().hex
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._queue: asyncio.Queue[IngestJob] | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._held: set[Path] = set()
+        self._waiting = 0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    async def start(self) -> None:
+        self._stopping.clear()
+        self._queue = asyncio.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="gr-ingest")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        for job in self._adopt_orphans():
+            self._enqueue(job)
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            # A running ingest finishes in the background; if the process exits
+            # first, the job is resumed by the next manager.
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def submit(self, session_id: str, track: str, zip_path: Path) -> IngestJob:
+        if self._queue is None:
+            raise RuntimeError("JobManager.start() has not been called")
+        if self._waiting >= self.queue_limit:
+            logger.warning("ingest_job.rejected", session_id=session_id, waiting=self._waiting)
+            raise Overloaded("ingest", self.retry_after_s)
+        job = IngestJob(
+            job_id=uuid.uuid4().hex,
+            session_id=session_id,
+            track=track,
+            zip_path=str(zip_path),
+            owner_pid=os.getpid(),
+            owner_boot=self.boot_id,
+        )
+        # Locked before it is visible, so no other manager adopts it meanwhile.
+        self._try_lock(self._job_lock(job))
+        self._save(job)
+        self._enqueue(job)
+        logger.info("ingest_job.queued", job_id=job.job_id, session_id=session_id)
+        return job
+
+    def get(self, job_id: str) -> IngestJob | None:
+        """Load a job from disk, so jobs run by other workers are visible too."""
+
+        if not job_id.isalnum():
+            return None
+        try:
+            return IngestJob.from_dict(orjson.loads(self._path(job_id).read_bytes()))
+        except FileNotFoundError:
+            return None
+
+    def _enqueue(self, job: IngestJob) -> None:
+        assert self._queue is not None
+        self._waiting += 1
+        self._queue.put_nowait(job)
+
+    async def _heartbeat(self) -> None:
+        """Renew this manager's locks and adopt jobs orphaned by other workers."""
+
+        while True:
+            await asyncio.sleep(self.lease_s / 3)
+            orphans = await asyncio.to_thread(self._renew_and_adopt)
+            for job in orphans:
+                self._enqueue(job)
+
+    def _renew_and_adopt(self) -> list[IngestJob]:
+        for path in list(self._held):
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                self._held.discard(path)
+        return self._adopt_orphans()
+
+    def _adopt_orphans(self) -> list[IngestJob]:
+        """Lock unfinished jobs whose owner has died and return those to re-run."""
+
+        orphans = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                job = IngestJob.from_dict(orjson.loads(path.read_bytes()))
+            except (OSError, orjson.JSONDecodeError, TypeError):
+                continue
+            if job.status not in UNFINISHED or self._job_lock(job) in self._held:
+                continue
+            if not self._try_lock(self._job_lock(job)):
+                continue
+            # Re-read: the job may have finished while its lock was being taken.
+            current = self.get(job.job_id)
+            if current is None or current.status not in UNFINISHED:
+                self._unlock(self._job_lock(job))
+                continue
+            job = current
+            job.owner_pid = os.getpid()
+            job.owner_boot = self.boot_id
+            if job.attempts >= self.max_attempts:
+                job.status = FAILED
+                job.error = f"Interrupted {job.attempts} times; giving up"
+                job.finished_at = time.time()
+                self._save(job)
+                self._unlock(self._job_lock(job))
+                continue
+            job.status = QUEUED
+            self._save(job)
+            orphans.append(job)
+            logger.info("ingest_job.resumed", job_id=job.job_id, attempts=job.attempts)
+        return orphans
+
+    def _lock_expired(self, path: Path) -> bool:
+        """Whether the lock file ``path`` is gone or its owner stopped renewing it."""
+
+        try:
+            mtime = path.stat().st_mtime
+            owner = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return True
+        except orjson.JSONDecodeError:
+            # Written by an older version or damaged; only its age tells.
+            owner = {}
+        if isinstance(owner, dict) and owner.get("boot") == self.boot_id:
+            return path not in self._held
+        return time.time() - mtime > self.lease_s
+
+    def _try_lock(self, path: Path) -> bool:
+        """Create the lock file ``path`` for this manager, taking it over once expired.
+
+        The owner record is written to a private file and hard-linked into place,
+        which fails if ``path`` exists, so a lock is never seen half-written.
+        """
+
+        tmp_path = path.with_name(f".{path.name}.{self.boot_id}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps({"pid": os.getpid(), "boot": self.boot_id}))
+        try:
+            for _ in range(2):
+                try:
+                    os.link(tmp_path, path)
+                except FileExistsError:
+                    if not self._lock_expired(path):
+                        return False
+                    logger.info("ingest_job.lock_expired", lock=path.name)
+                    path.unlink(missing_ok=True)
+                    continue
+                self._held.add(path)
+                return True
+            return False
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _unlock(self, path: Path) -> None:
+        self._held.discard(path)
+        path.unlink(missing_ok=True)
+
+    def _wait_for_lock(self, candidates: list[Path]) -> Path | None:
+        """Take the first free lock among ``candidates``; ``None`` if the manager stops first."""
+
+        while not self._stopping.is_set():
+            for path in candidates:
+                if self._try_lock(path):
+                    return path
+            self._stopping.wait(_LOCK_POLL_S)
+        return None
+
+    def _acquire_locks(self, job: IngestJob) -> list[Path] | None:
+        session_lock = self._wait_for_lock(
+            [self.directory / f"session-{quote(job.session_id, safe='')}.lock"]
+        )
+        if session_lock is None:
+            return None
+        slot = self._wait_for_lock(
+            [self.directory / f"slot-{index}.lock" for index in range(self.workers)]
+        )
+        if slot is None:
+            self._unlock(session_lock)
+            return None
+        return [session_lock, slot]
+
+    def _job_lock(self, job: IngestJob) -> Path:
+        return self.directory / f"job-{job.job_id}.lock"
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            self._waiting -= 1
+            try:
+                await loop.run_in_executor(self._pool, self._run, job)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job: IngestJob) -> None:
+        locks = self._acquire_locks(job)
+        if locks is None:
+            # Stopping: the job stays queued and is resumed by the next manager.
+            return
+        try:
+            self._execute(job)
+        finally:
+            for path in locks:
+                self._unlock(path)
+
+    def _execute(self, job: IngestJob) -> None:
+        job.status = RUNNING
+        job.attempts += 1
+        job.started_at = time.time()
+        job.owner_pid = os.getpid()
+        job.owner_boot = self.boot_id
+        self._save(job)
+        last_write = 0.0
+
+        def on_stage(stats: StageStats) -> None:
+            nonlocal last_write
+            job.stage = stats.stage
+            rows = stats.rows_out if stats.rows_out is not None else stats.rows_in
+            job.rows_processed = max(job.rows_processed, rows or 0)
+            if time.monotonic() - last_write >= _PROGRESS_INTERVAL_S:
+                last_write = time.monotonic()
+                self._save(job)
+
+        try:
+            with IngestProfiler(on_stage=on_stage, session_id=job.session_id, job_id=job.job_id) as profiler:
+                job.metrics = ingest_archive(
+                    Path(job.zip_path),
+                    job.session_id,
+                    job.track,
+                    self.store_provider(),
+                    batch_rows=self.settings.ingest_batch_rows,
+                    workers=self.settings.normalize_workers,
+                    spill_dir=self.settings.data_dir / "staging",
+                )
+            job.status = SUCCEEDED
+            job.profile = profiler.report()
+        except Exception as exc:  # noqa: BLE001
+            job.status = FAILED
+            job.error = str(exc) or type(exc).__name__
+            logger.exception("ingest_job.failed", job_id=job.job_id)
+        job.finished_at = time.time()
+        self._save(job)
+        self._unlock(self._job_lock(job))
+        logger.info("ingest_job.finished", job_id=job.job_id, status=job.status)
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def _save(self, job: IngestJob) -> None:
+        path = self._path(job.job_id)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            tmp_path.write_bytes(orjson.dumps(asdict(job)))
+            os.replace(tmp_path, path)
@@ -1,15 +1,25 @@
 """FastAPI application entry-point."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import structlog
 from structlog.stdlib import BoundLogger, LoggerFactory
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
+from starlette import status
 
+from .broadcast import SessionBroadcaster
+from .cache import RedisCache
+from .coalesce import RequestCoalescer
 from .config import get_settings
+from .deps import get_parquet_store, shutdown_executor
+from .execution import Overloaded
+from .jobs import JobManager
 from .routes import api_router
 
 
@@ -29,10 +39,56 @@ def configure_logging() -> None:
 settings = get_settings()
 configure_logging()
 
+
+async def _compaction_loop(interval_s: int) -> None:
+    """Periodically merge small files so re-ingested sessions stay cheap to scan."""
+
+    logger = structlog.get_logger(__name__)
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            await asyncio.to_thread(get_parquet_store().compact)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("parquet.compact_failed", error=str(exc))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    compaction_task = None
+    if settings.compaction_interval_seconds > 0:
+        compaction_task = asyncio.create_task(
+            _compaction_loop(settings.compaction_interval_seconds)
+        )
+    app.state.redis = RedisCache.from_settings(settings)
+    app.state.coalescer = RequestCoalescer(lock_ttl_s=settings.coalesce_lock_ttl_seconds)
+    app.state.broadcaster = SessionBroadcaster(
+        buffer_size=settings.ws_send_buffer, slow_consumer=settings.ws_slow_consumer
+    )
+    app.state.jobs = JobManager(
+        settings.data_dir / "jobs",
+        get_parquet_store,
+        settings,
+        workers=settings.ingest_workers,
+        queue_limit=settings.ingest_queue_limit,
+        max_attempts=settings.ingest_max_attempts,
+        retry_after_s=settings.overload_retry_after_seconds,
+    )
+    await app.state.jobs.start()
+    try:
+        yield
+    finally:
+        await app.state.jobs.stop()
+        if compaction_task is not None:
+            compaction_task.cancel()
+        shutdown_executor()
+        await app.state.redis.close()
+
+
 app = FastAPI(
     title="GR-Experience API",
     version="0.1.0",
     default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -44,3 +100,12 @@ app.add_middleware(
 )
 
 app.include_router(api_router)
+
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded) -> ORJSONResponse:
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after_s)},
+    )
@@ -1,6 +1,13 @@
 """Model package exports."""
 from .degradation_model import DegradationModel, DegradationResult
-from .features import FeatureSet, build_lap_features, compute_dtw_alignment
+from .features import (
+    DTW_METRICS,
+    LAP_FEATURE_COLUMNS,
+    FeatureSet,
+    build_lap_features,
+    compute_dtw_alignment,
+    dtw_columns,
+)
 from .lap_time_model import LapTimeModel
 from .strategy_engine import StrategyContext, StrategyEngine
 
@@ -10,6 +17,9 @@ __all__ = [
     "FeatureSet",
     "build_lap_features",
     "compute_dtw_alignment",
+    "dtw_columns",
+    "DTW_METRICS",
+    "LAP_FEATURE_COLUMNS",
     "LapTimeModel",
     "StrategyContext",
     "StrategyEngine",
@@ -6,6 +6,27 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from ..dataio.normalize import CANONICAL_DTYPES, SORT_KEYS, derive_lap_timing
+
+
+# Columns read by build_lap_features.
+LAP_FEATURE_COLUMNS = [
+    "track",
+    "car_id",
+    "lap",
+    "sector",
+    "t_ms",
+    "lap_time_s",
+    "speed_kph",
+    "throttle",
+    "brake",
+    "gear",
+    "tire_set",
+    "track_temp_c",
+    "air_temp_c",
+    "flag_state",
+]
+
 
 @dataclass
 class FeatureSet:
@@ -16,15 +37,15 @@ class FeatureSet:
 def build_lap_features(df: pd.DataFrame) -> FeatureSet:
     """Construct lap-level features for modeling."""
 
-    df = df.sort_values(["car_id", "lap", "sector", "t_ms"]).copy()
-    df["stint_id"] = df.groupby(["car_id", "tire_set"]).ngroup()
+    df = df.sort_values(SORT_KEYS).copy()
+    df["stint_id"] = df.groupby(["car_id", "tire_set"], observed=True).ngroup()
     df["stint_lap"] = (
-        df.groupby(["car_id", "tire_set"])["lap"].rank(method="dense").astype(int)
+        df.groupby(["car_id", "tire_set"], observed=True)["lap"].rank(method="dense").astype(int)
     )
-    df["prev_lap_time"] = df.groupby("car_id")["lap_time_s"].shift(1)
+    df["prev_lap_time"] = df.groupby("car_id", observed=True)["lap_time_s"].shift(1)
     df["prev_lap_time"].fillna(df["lap_time_s"], inplace=True)
 
-    stint_avg = df.groupby(["car_id", "tire_set"])["lap_time_s"].transform("mean")
+    stint_avg = df.groupby(["car_id", "tire_set"], observed=True)["lap_time_s"].transform("mean")
     df["avg_stint_pace"] = stint_avg
     df["tire_age"] = df["stint_lap"] - 1
     df["is_under_flag"] = df["flag_state"].isin({"yellow", "sc"}).astype(int)
@@ -53,18 +74,33 @@ def build_lap_features(df: pd.DataFrame) -> FeatureSet:
 
 
 def _derive_sector_metrics(df: pd.DataFrame) -> pd.DataFrame:
+    """Expects ``df`` sorted by ``SORT_KEYS``, as :func:`build_lap_features` leaves it."""
+
     df = df.copy()
-    df["t_ms"] = pd.to_numeric(df["t_ms"], errors="coerce")
     df["lap_time_s"] = pd.to_numeric(df["lap_time_s"], errors="coerce")
 
-    df["sector_time_s"] = (
-        df.groupby(["car_id", "lap"])["t_ms"].diff().fillna(df["lap_time_s"])
-    ) / 1000.0
-    global_sector = df.groupby(["track", "sector"])['sector_time_s'].transform('median')
+    timing = derive_lap_timing(df)
+    df["sector_time_s"] = timing["sector_time_ms"].fillna(df["lap_time_s"]) / 1000.0
+    global_sector = df.groupby(["track", "sector"], observed=True)['sector_time_s'].transform('median')
     df["sector_delta_s"] = df["sector_time_s"] - global_sector
     return df
 
 
+# Metrics compute_dtw_alignment can align: numeric telemetry, not the keys laps
+# are ordered by.
+DTW_METRICS = frozenset(
+    column
+    for column, dtype in CANONICAL_DTYPES.items()
+    if dtype != "category" and column not in SORT_KEYS
+)
+
+
+def dtw_columns(value_column: str) -> list[str]:
+    """Columns :func:`compute_dtw_alignment` reads from each lap."""
+
+    return list(dict.fromkeys(["t_ms", value_column]))
+
+
 def compute_dtw_alignment(
     ideal_lap: pd.DataFrame,
     reference_lap: pd.DataFrame,
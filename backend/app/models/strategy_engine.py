@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 
 from .degradation_model import DegradationModel
+from .features import LAP_FEATURE_COLUMNS
 from .lap_time_model import LapTimeModel
 
 
@@ -18,6 +19,9 @@ class StrategyContext:
 
 
 class StrategyEngine:
+    #: Telemetry columns :meth:`simulate` needs from the session.
+    required_columns = LAP_FEATURE_COLUMNS
+
     def __init__(
         self,
         lap_model: LapTimeModel | None = None,
@@ -0,0 +1,241 @@
+"""Per-stage profiling for the ingest pipeline.
+
+Pipeline stages are wrapped with :func:`profiled_stage` (or the
+:func:`profile_stage` context manager). They only record anything while an
+:class:`IngestProfiler` is active in the current context, so the helpers can be
+called directly, from benchmarks or from worker processes, at no cost.
+"""
+from __future__ import annotations
+
+import functools
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ACTIVE: ContextVar["IngestProfiler | None"] = ContextVar("ingest_profiler", default=None)
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT / 1e6
+
+
+def _row_count(value: Any) -> int | None:
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, (list, tuple)) and value and all(
+        isinstance(item, pd.DataFrame) for item in value
+    ):
+        return sum(len(item) for item in value)
+    return None
+
+
+@dataclass
+class StageStats:
+    """Accumulated cost of one pipeline stage.
+
+    ``peak_rss_mb`` is the process high-water mark when the stage finished, so
+    the stage where it jumps is the one that allocated the memory.
+    """
+
+    stage: str
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    peak_rss_mb: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["wall_s"] = round(self.wall_s, 6)
+        payload["cpu_s"] = round(self.cpu_s, 6)
+        payload["peak_rss_mb"] = round(self.peak_rss_mb, 1)
+        return payload
+
+
+class StageRecord:
+    """Handle yielded by :func:`profile_stage` so callers can report row counts."""
+
+    __slots__ = ("rows_in", "rows_out")
+
+    def __init__(self, rows_in: int | None = None) -> None:
+        self.rows_in = rows_in
+        self.rows_out: int | None = None
+
+
+class IngestProfiler:
+    """Collect per-stage wall time, CPU time, row counts and peak memory.
+
+    Use as a context manager around an ingest; stages that run more than once
+    (for example per car in streaming mode) are aggregated under one name.
+    ``on_stage`` is called with the updated totals each time a stage finishes.
+    """
+
+    def __init__(
+        self, on_stage: Callable[[StageStats], None] | None = None, **context: Any
+    ) -> None:
+        self.context = context
+        self.stages: dict[str, StageStats] = {}
+        self.on_stage = on_stage
+        self._token: Token[IngestProfiler | None] | None = None
+        # Stages currently open, and the time spent in outermost ones; nested
+        # stages (for example normalize.clean inside stream.spill) are already
+        # part of their parent's time.
+        self._depth = 0
+        self._total_wall_s = 0.0
+        self._total_cpu_s = 0.0
+
+    def __enter__(self) -> "IngestProfiler":
+        self._token = _ACTIVE.set(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            _ACTIVE.reset(self._token)
+            self._token = None
+
+    def record(
+        self,
+        stage: str,
+        wall_s: float,
+        cpu_s: float,
+        rows_in: int | None,
+        rows_out: int | None,
+        nested: bool = False,
+    ) -> None:
+        if not nested:
+            self._total_wall_s += wall_s
+            self._total_cpu_s += cpu_s
+        stats = self.stages.setdefault(stage, StageStats(stage=stage))
+        stats.calls += 1
+        stats.wall_s += wall_s
+        stats.cpu_s += cpu_s
+        if rows_in is not None:
+            stats.rows_in = (stats.rows_in or 0) + rows_in
+        if rows_out is not None:
+            stats.rows_out = (stats.rows_out or 0) + rows_out
+        stats.peak_rss_mb = max(stats.peak_rss_mb, _peak_rss_mb())
+        logger.info(
+            "ingest.stage",
+            stage=stage,
+            wall_s=round(wall_s, 6),
+            cpu_s=round(cpu_s, 6),
+            rows_in=rows_in,
+            rows_out=rows_out,
+            peak_rss_mb=round(stats.peak_rss_mb, 1),
+            **self.context,
+        )
+        if self.on_stage is not None:
+            self.on_stage(stats)
+
+    def merge(self, stages: Iterable[StageStats]) -> None:
+        """Fold stages recorded by another process's profiler into this one.
+
+        They ran while one of this profiler's stages was open (for example
+        ``normalize.read`` around a process pool), so they count as nested.
+        """
+
+        for other in stages:
+            stats = self.stages.setdefault(other.stage, StageStats(stage=other.stage))
+            stats.calls += other.calls
+            stats.wall_s += other.wall_s
+            stats.cpu_s += other.cpu_s
+            if other.rows_in is not None:
+                stats.rows_in = (stats.rows_in or 0) + other.rows_in
+            if other.rows_out is not None:
+                stats.rows_out = (stats.rows_out or 0) + other.rows_out
+            stats.peak_rss_mb = max(stats.peak_rss_mb, other.peak_rss_mb)
+            if self.on_stage is not None:
+                self.on_stage(stats)
+
+    def report(self) -> list[dict[str, Any]]:
+        return [stats.as_dict() for stats in self.stages.values()]
+
+    def format_table(self) -> str:
+        lines = [
+            f"{'stage':<26} {'calls':>5} {'wall s':>9} {'cpu s':>9} "
+            f"{'rows in':>11} {'rows out':>11} {'peak MB':>9}"
+        ]
+        for stats in self.stages.values():
+            rows_in = "-" if stats.rows_in is None else f"{stats.rows_in:,}"
+            rows_out = "-" if stats.rows_out is None else f"{stats.rows_out:,}"
+            lines.append(
+                f"{stats.stage:<26} {stats.calls:>5} {stats.wall_s:>9.3f} {stats.cpu_s:>9.3f} "
+                f"{rows_in:>11} {rows_out:>11} {stats.peak_rss_mb:>9.1f}"
+            )
+        lines.append(
+            f"{'total':<26} {'':>5} {self._total_wall_s:>9.3f} {self._total_cpu_s:>9.3f}"
+        )
+        return "\n".join(lines)
+
+
+def active_profiler() -> IngestProfiler | None:
+    """Return the profiler collecting stages in the current context, if any."""
+
+    return _ACTIVE.get()
+
+
+@contextmanager
+def profile_stage(stage: str, rows_in: int | None = None) -> Iterator[StageRecord]:
+    """Time the enclosed block as ``stage`` if a profiler is active."""
+
+    record = StageRecord(rows_in)
+    profiler = _ACTIVE.get()
+    if profiler is None:
+        yield record
+        return
+    nested = profiler._depth > 0
+    profiler._depth += 1
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    try:
+        yield record
+    finally:
+        profiler._depth -= 1
+    profiler.record(
+        stage,
+        wall_s=time.perf_counter() - wall_started,
+        cpu_s=time.process_time() - cpu_started,
+        rows_in=record.rows_in,
+        rows_out=record.rows_out,
+        nested=nested,
+    )
+
+
+def profiled_stage(stage: str) -> Callable[[F], F]:
+    """Decorate a pipeline step so calls are recorded as ``stage``.
+
+    Rows in are taken from the first DataFrame argument, rows out from the
+    returned DataFrame (or list of DataFrames).
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _ACTIVE.get() is None:
+                return func(*args, **kwargs)
+            rows_in = next(
+                (count for count in map(_row_count, args) if count is not None), None
+            )
+            with profile_stage(stage, rows_in=rows_in) as record:
+                result = func(*args, **kwargs)
+                record.rows_out = _row_count(result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -2,10 +2,11 @@
 from fastapi import APIRouter
 
 from ..api.routes import router as analytics_router
-from . import sessions, strategy, telemetry, ws
+from . import jobs, sessions, strategy, telemetry, ws
 
 api_router = APIRouter()
 api_router.include_router(sessions.router)
+api_router.include_router(jobs.router)
 api_router.include_router(telemetry.router)
 api_router.include_router(strategy.router)
 api_router.include_router(ws.router)
@@ -0,0 +1,20 @@
+"""Status of background ingest jobs."""
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+
+from .. import schemas
+from ..deps import get_jobs
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+@router.get("/{job_id}", response_model=schemas.IngestJobResponse)
+async def get_job(job_id: str, jobs=Depends(get_jobs)) -> schemas.IngestJobResponse:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return schemas.IngestJobResponse(**asdict(job))
@@ -1,78 +1,131 @@
 """Session ingestion and telemetry routes."""
 from __future__ import annotations
 
+from dataclasses import asdict
 from pathlib import Path
 
-import orjson
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from starlette import status
 
 from .. import schemas
+from ..cache import session_key
 from ..config import Settings
-from ..dataio import compute_session_metrics, extract_zip, normalize_files
-from ..deps import get_parquet_store, get_redis, get_settings_dependency
+from ..dataio.parquet_store import LapCursor
+from ..deps import (
+    get_executor,
+    get_jobs,
+    get_parquet_store,
+    get_redis,
+    get_settings_dependency,
+)
+from ..etags import etag_headers, etag_matches, make_etag, not_modified
+from ..serialization import MEDIA_TYPES, encode_lap_page, negotiate
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
+# Columns of a laps page: the frame fields plus the track it belongs to.
+LAP_COLUMNS = [*schemas.TelemetryFrame.__fields__, "track"]
 
-@router.post("/{session_id}/ingest", response_model=schemas.SessionIngestResponse)
+
+@router.post(
+    "/{session_id}/ingest",
+    response_model=schemas.IngestJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def ingest_session(
     session_id: str,
     payload: schemas.IngestRequest,
+    response: Response,
     settings: Settings = Depends(get_settings_dependency),
-    store=Depends(get_parquet_store),
-    redis=Depends(get_redis),
-) -> schemas.SessionIngestResponse:
+    jobs=Depends(get_jobs),
+) -> schemas.IngestJobResponse:
+    """Queue the archive for ingestion; poll ``Location`` for progress and metrics."""
+
     zip_path = _resolve_zip_path(payload.zip_path, settings)
-    staging_dir = settings.data_dir / "staging" / session_id
-    extracted_files = extract_zip(zip_path, staging_dir)
-    track = _infer_track(zip_path)
-    normalized = normalize_files(extracted_files, session_id=session_id, track=track)
-    store.write_session(normalized)
-    metrics = compute_session_metrics(normalized)
-    cache_key = f"session:{session_id}:metrics"
-    await redis.set(
-        cache_key,
-        orjson.dumps(metrics).decode("utf-8"),
-        ex=settings.redis_cache_ttl_seconds,
-    )
-    return schemas.SessionIngestResponse(session_id=session_id, track=track, metrics=metrics)
+    if not zip_path.is_file():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Archive not found")
+    job = jobs.submit(session_id, _infer_track(zip_path), zip_path)
+    response.headers["Location"] = f"/api/jobs/{job.job_id}"
+    return schemas.IngestJobResponse(**asdict(job))
 
 
-@router.get("/{session_id}/laps", response_model=schemas.LapResponse)
+@router.get(
+    "/{session_id}/laps",
+    response_model=schemas.LapResponse,
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in MEDIA_TYPES[1:]},
+            "description": "Telemetry page as row JSON, columnar JSON or an Arrow IPC stream",
+        }
+    },
+)
 async def get_laps(
     session_id: str,
     car_id: str | None = Query(None),
     offset: int = Query(0, ge=0),
     limit: int = Query(500, ge=1, le=5000),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    accept: str | None = Header(None),
+    if_none_match: str | None = Header(None),
     settings: Settings = Depends(get_settings_dependency),
     store=Depends(get_parquet_store),
     redis=Depends(get_redis),
-) -> schemas.LapResponse:
-    cache_key = f"session:{session_id}:laps:{car_id}:{offset}:{limit}"
+    executor=Depends(get_executor),
+) -> Response:
+    after = None
+    if cursor:
+        try:
+            after = LapCursor.decode(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        offset = 0
+    media_type = negotiate(accept)
+    if media_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"Supported media types: {', '.join(MEDIA_TYPES)}",
+        )
+    generation = store.session_generation(session_id)
+    if not generation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No telemetry data found")
+    position = cursor or offset
+    cache_key = session_key(
+        session_id, generation, "laps", car_id, position, limit, media_type
+    )
+    etag = make_etag(cache_key)
+    headers = etag_headers(etag, Vary="Accept")
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, Vary="Accept")
     cached = await redis.get(cache_key)
     if cached:
-        payload = orjson.loads(cached)
-        return schemas.LapResponse(**payload)
+        # Stored already encoded; served without parsing or re-validating.
+        return Response(content=cached, media_type=media_type, headers=headers)
 
-    df = store.scan_laps(session_id=session_id, car_id=car_id, offset=offset, limit=limit)
+    # One extra row tells whether another page follows.
+    df = await executor.io(
+        store.scan_laps,
+        session_id=session_id,
+        car_id=car_id,
+        offset=offset,
+        limit=limit + 1,
+        after=after,
+        columns=LAP_COLUMNS,
+    )
     if df.empty:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No telemetry data found")
-    track = df["track"].iloc[0]
-    frames = []
-    for row in df.to_dict("records"):
-        payload = {field: row[field] for field in schemas.TelemetryFrame.__fields__ if field in row}
-        frames.append(schemas.TelemetryFrame(**payload))
-    response = schemas.LapResponse(
+    has_more = len(df) > limit
+    df = df.iloc[:limit]
+    body = encode_lap_page(
+        df,
         session_id=session_id,
-        track=track,
-        data=frames,
-        total=len(df),
+        track=str(df["track"].iloc[0]),
         offset=offset,
         limit=limit,
+        next_cursor=LapCursor.after_page(df, after).encode() if has_more else None,
+        media_type=media_type,
     )
-    await redis.set(cache_key, response.json(), ex=settings.redis_cache_ttl_seconds)
-    return response
+    await redis.set(cache_key, body, ex=settings.redis_cache_ttl_seconds)
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 def _resolve_zip_path(path_str: str, settings: Settings) -> Path:
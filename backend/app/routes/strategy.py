@@ -1,11 +1,20 @@
 """Race strategy endpoints."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from starlette import status
 
 from .. import schemas
-from ..deps import get_parquet_store
+from ..cache import session_key
+from ..config import Settings
+from ..deps import (
+    get_coalescer,
+    get_executor,
+    get_parquet_store,
+    get_redis,
+    get_settings_dependency,
+)
 from ..models import StrategyContext, StrategyEngine
 
 router = APIRouter(prefix="/api/strategy", tags=["strategy"])
@@ -15,16 +24,33 @@ router = APIRouter(prefix="/api/strategy", tags=["strategy"])
 async def simulate_strategy(
     payload: schemas.StrategyRequest,
     store=Depends(get_parquet_store),
-) -> schemas.StrategyResponse:
-    df = store.read_session(payload.session_id)
-    if df.empty:
+    redis=Depends(get_redis),
+    settings: Settings = Depends(get_settings_dependency),
+    executor=Depends(get_executor),
+    coalescer=Depends(get_coalescer),
+) -> Response:
+    generation = store.session_generation(payload.session_id)
+    if not generation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    engine = StrategyEngine()
-    context = StrategyContext(
-        session_id=payload.session_id,
-        target_position=payload.target_position,
-        data=df,
+
+    async def compute() -> bytes:
+        engine = StrategyEngine()
+        df = await executor.io(store.read_session, payload.session_id, columns=engine.required_columns)
+        if df.empty:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+        context = StrategyContext(
+            session_id=payload.session_id,
+            target_position=payload.target_position,
+            data=df,
+        )
+        result = await executor.cpu(engine.simulate, context)
+        result["expected_gain_s"] = float(max(min(result["expected_gain_s"], 60.0), -60.0))
+        return orjson.dumps(schemas.StrategyResponse(**result).dict())
+
+    body = await coalescer.get_or_compute(
+        redis,
+        session_key(payload.session_id, generation, "strategy", payload.target_position),
+        compute,
+        ttl_s=settings.redis_cache_ttl_seconds,
     )
-    result = engine.simulate(context)
-    result["expected_gain_s"] = float(max(min(result["expected_gain_s"], 60.0), -60.0))
-    return schemas.StrategyResponse(**result)
+    return Response(content=body, media_type="application/json")
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 import orjson
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from starlette import status
 
 from .. import schemas
+from ..cache import session_key
 from ..config import Settings
-from ..dataio import compute_session_metrics
-from ..deps import get_parquet_store, get_redis, get_settings_dependency
-from ..models import compute_dtw_alignment
+from ..dataio import SESSION_METRICS_COLUMNS, compute_session_metrics
+from ..deps import (
+    get_coalescer,
+    get_executor,
+    get_parquet_store,
+    get_redis,
+    get_settings_dependency,
+)
+from ..etags import etag_headers, etag_matches, make_etag, not_modified
+from ..models import DTW_METRICS, compute_dtw_alignment, dtw_columns
 
 router = APIRouter(prefix="/api", tags=["telemetry"])
 
@@ -20,33 +28,56 @@ async def get_session_summary(
     store=Depends(get_parquet_store),
     redis=Depends(get_redis),
     settings: Settings = Depends(get_settings_dependency),
-):
-    cache_key = f"session:{session_id}:metrics"
-    cached = await redis.get(cache_key)
-    if cached:
-        return orjson.loads(cached)
-
-    df = store.read_session(session_id=session_id)
-    if df.empty:
+    executor=Depends(get_executor),
+    coalescer=Depends(get_coalescer),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    generation = store.session_generation(session_id)
+    if not generation:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    metrics = compute_session_metrics(df)
-    await redis.set(
-        cache_key,
-        orjson.dumps(metrics).decode("utf-8"),
-        ex=settings.redis_cache_ttl_seconds,
+    cache_key = session_key(session_id, generation, "metrics")
+    etag = make_etag(cache_key)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    async def compute() -> bytes:
+        df = await executor.io(store.read_session, session_id=session_id, columns=SESSION_METRICS_COLUMNS)
+        if df.empty:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+        return orjson.dumps(await executor.io(compute_session_metrics, df))
+
+    body = await coalescer.get_or_compute(
+        redis, cache_key, compute, ttl_s=settings.redis_cache_ttl_seconds
     )
-    return metrics
+    return Response(content=body, media_type="application/json", headers=etag_headers(etag))
 
 
 @router.post("/training/compare-lap", response_model=schemas.TrainingComparisonResponse)
 async def compare_lap(
     payload: schemas.TrainingComparisonRequest,
     store=Depends(get_parquet_store),
+    executor=Depends(get_executor),
 ) -> schemas.TrainingComparisonResponse:
+    if payload.metric not in DTW_METRICS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Metric {payload.metric!r} cannot be aligned; use one of {sorted(DTW_METRICS)}",
+        )
+    columns = dtw_columns(payload.metric)
     filters = [("lap", "eq", payload.lap)]
-    ideal_df = store.read_session(payload.session_id, filters=filters + [("car_id", "eq", payload.ideal_car_id)])
-    ref_df = store.read_session(payload.session_id, filters=filters + [("car_id", "eq", payload.reference_car_id)])
+    ideal_df = await executor.io(
+        store.read_session,
+        payload.session_id,
+        columns=columns,
+        filters=filters + [("car_id", "eq", payload.ideal_car_id)],
+    )
+    ref_df = await executor.io(
+        store.read_session,
+        payload.session_id,
+        columns=columns,
+        filters=filters + [("car_id", "eq", payload.reference_car_id)],
+    )
     if ideal_df.empty or ref_df.empty:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lap data unavailable for comparison")
-    dtw_result = compute_dtw_alignment(ideal_df, ref_df, value_column=payload.metric)
+    dtw_result = await executor.cpu(compute_dtw_alignment, ideal_df, ref_df, value_column=payload.metric)
     return schemas.TrainingComparisonResponse(**dtw_result)
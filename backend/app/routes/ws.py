@@ -1,40 +1,63 @@
 """WebSocket streaming for live telemetry."""
 from __future__ import annotations
 
-import asyncio
+from typing import AsyncIterator, Iterator
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
 
-from ..deps import get_parquet_store
-from ..schemas import WebSocketFrame
+from ..broadcast import StreamError
+from ..dataio.parquet_store import ParquetStore
+from ..deps import get_broadcaster, get_executor, get_parquet_store
+from ..execution import Overloaded
+from ..serialization import encode_stream_frames
 
 router = APIRouter()
 
+# Columns needed to build a WebSocketFrame.
+WS_COLUMNS = ["t_ms", "car_id", "lap", "lap_time_s", "flag_state"]
+
 
 @router.websocket("/ws/{session_id}")
 async def session_stream(
     websocket: WebSocket,
     session_id: str,
+    start_ms: int = Query(0, ge=0, description="Replay from this session time on"),
     store=Depends(get_parquet_store),
+    executor=Depends(get_executor),
+    broadcaster=Depends(get_broadcaster),
 ) -> None:
     await websocket.accept()
+
+    async def load() -> AsyncIterator[list[str]]:
+        try:
+            chunks = await executor.io(_load_frames, store, session_id, start_ms)
+            # Each chunk is encoded on the I/O lane too, keeping the event loop free.
+            while (chunk := await executor.io(next, chunks, None)) is not None:
+                yield chunk
+        except Overloaded as exc:
+            raise StreamError(
+                str(exc), status.WS_1013_TRY_AGAIN_LATER, retry_after_s=exc.retry_after_s
+            ) from exc
+
+    key = (session_id, start_ms)
+    subscriber = broadcaster.subscribe(key, load)
     try:
-        df = store.read_session(session_id)
-        if df.empty:
-            await websocket.send_json({"error": "session not found"})
-            await websocket.close()
-            return
-        df = df.sort_values(["t_ms"])
-        best_lap = df.groupby("car_id")["lap_time_s"].min().to_dict()
-        for _, row in df.iterrows():
-            frame = WebSocketFrame(
-                t_ms=int(row["t_ms"]),
-                car_id=str(row["car_id"]),
-                lap=int(row["lap"]),
-                delta_s=float(row["lap_time_s"] - best_lap[str(row["car_id"])]) if row["car_id"] in best_lap else 0.0,
-                flag=str(row.get("flag_state", "green")),
-            )
-            await websocket.send_json(frame.dict(by_alias=True))
-            await asyncio.sleep(0.01)
+        while (frame := await subscriber.queue.get()) is not None:
+            await websocket.send_text(frame)
+        if subscriber.error is not None:
+            await websocket.send_json(subscriber.error)
+        await websocket.close(code=subscriber.close_code or status.WS_1000_NORMAL_CLOSURE)
     except WebSocketDisconnect:
         return
+    finally:
+        broadcaster.unsubscribe(subscriber)
+
+
+def _load_frames(store: ParquetStore, session_id: str, start_ms: int) -> Iterator[list[str]]:
+    filters: list[tuple[str, str, object]] | None = (
+        [("t_ms", "ge", start_ms)] if start_ms else None
+    )
+    df = store.read_session(session_id, columns=WS_COLUMNS, filters=filters)
+    if df.empty:
+        raise StreamError("session not found", status.WS_1000_NORMAL_CLOSURE)
+    return encode_stream_frames(df)
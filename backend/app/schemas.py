@@ -51,6 +51,9 @@ class LapResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the following page; absent on the last page"
+    )
 
 
 class TrainingComparisonRequest(BaseModel):
@@ -67,10 +70,30 @@ class TrainingComparisonResponse(BaseModel):
     recommendations: List[str]
 
 
-class SessionIngestResponse(BaseModel):
+class StageProfile(BaseModel):
+    stage: str
+    calls: int
+    wall_s: float
+    cpu_s: float
+    rows_in: int | None = None
+    rows_out: int | None = None
+    peak_rss_mb: float
+
+
+class IngestJobResponse(BaseModel):
+    job_id: str
     session_id: str
     track: str
-    metrics: Dict[str, Any]
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    stage: str | None = Field(None, description="Last pipeline stage that finished")
+    rows_processed: int = 0
+    attempts: int = 0
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    metrics: Dict[str, Any] | None = None
+    profile: List[StageProfile] = []
 
 
 class WebSocketFrame(BaseModel):
@@ -0,0 +1,164 @@
+"""Encode telemetry DataFrames into API payloads without per-row models.
+
+Building a :class:`~backend.app.schemas.TelemetryFrame` per row and serialising
+through pydantic dominates the cost of large pages. These helpers pull each
+column out once as Python scalars and let orjson write the rows, producing the
+same JSON as the pydantic models (missing values become ``null``).
+
+Telemetry pages come in three media types, picked from the ``Accept`` header by
+:func:`negotiate`:
+
+- ``application/json``: the :class:`~backend.app.schemas.LapResponse` layout,
+  one object per row.
+- ``application/vnd.gr.columns+json``: the same envelope with ``columns``, one
+  array per field, instead of ``data``.
+- ``application/vnd.apache.arrow.stream``: an Arrow IPC stream of the rows; the
+  envelope fields are stored as schema metadata.
+
+:func:`encode_stream_frames` encodes the ``/ws/{session_id}`` replay the same
+way, once per stream rather than once per viewer, a chunk of rows at a time.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+
+from . import schemas
+
+LAP_FRAME_FIELDS = list(schemas.TelemetryFrame.__fields__)
+WS_FRAME_FIELDS = [
+    field.alias for field in schemas.WebSocketFrame.__fields__.values()
+]
+
+JSON = "application/json"
+COLUMNS_JSON = "application/vnd.gr.columns+json"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+MEDIA_TYPES = (JSON, COLUMNS_JSON, ARROW_STREAM)
+
+# Rows encoded at a time for a WebSocket replay.
+STREAM_CHUNK_ROWS = 1024
+
+
+def negotiate(accept: str | None) -> str | None:
+    """The media type to answer ``accept`` with, or ``None`` if none is acceptable.
+
+    Ranges are ranked by their ``q`` value; ties keep header order. Wildcards
+    fall back to plain JSON.
+    """
+
+    if not accept:
+        return JSON
+    ranked: list[tuple[float, int, str]] = []
+    for position, item in enumerate(accept.split(",")):
+        media_range, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            ranked.append((-quality, position, media_range.lower()))
+    for _, _, media_range in sorted(ranked):
+        if media_range in MEDIA_TYPES:
+            return media_range
+        if media_range in ("*/*", "application/*"):
+            return JSON
+    return None
+
+
+def column_values(series: pd.Series) -> list[Any]:
+    """``series`` as a list of JSON-ready Python scalars, with ``None`` for missing values."""
+
+    if series.hasnans:
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+
+def frame_records(df: pd.DataFrame, fields: list[str]) -> list[dict[str, Any]]:
+    """Row dicts of ``fields`` present in ``df``, built column by column."""
+
+    present = [field for field in fields if field in df.columns]
+    columns = [column_values(df[field]) for field in present]
+    return [dict(zip(present, row)) for row in zip(*columns)]
+
+
+def encode_arrow_stream(df: pd.DataFrame, metadata: dict[str, Any]) -> bytes:
+    """``df`` as an Arrow IPC stream, with ``metadata`` JSON-encoded into the schema."""
+
+    table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(
+        {key: orjson.dumps(value) for key, value in metadata.items()}
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_lap_page(
+    df: pd.DataFrame,
+    *,
+    session_id: str,
+    track: str,
+    offset: int,
+    limit: int,
+    next_cursor: str | None,
+    media_type: str = JSON,
+) -> bytes:
+    """Body of a laps page for the rows of ``df`` in ``media_type``.
+
+    JSON matches :class:`~backend.app.schemas.LapResponse`.
+    """
+
+    envelope = {
+        "session_id": session_id,
+        "track": track,
+        "total": len(df),
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": next_cursor,
+    }
+    present = [field for field in LAP_FRAME_FIELDS if field in df.columns]
+    if media_type == ARROW_STREAM:
+        return encode_arrow_stream(df[present], envelope)
+    if media_type == COLUMNS_JSON:
+        columns = {field: column_values(df[field]) for field in present}
+        return orjson.dumps({**envelope, "columns": columns})
+    return orjson.dumps({**envelope, "data": frame_records(df, LAP_FRAME_FIELDS)})
+
+
+def encode_stream_frames(
+    df: pd.DataFrame, chunk_rows: int = STREAM_CHUNK_ROWS
+) -> Iterator[list[str]]:
+    """WebSocket text messages for the rows of ``df`` in time order, ``chunk_rows`` at a time.
+
+    Each message matches :class:`~backend.app.schemas.WebSocketFrame`;
+    ``delta_s`` is the row's lap time against its car's best lap. Best laps are
+    computed here over the whole session; the messages themselves are only
+    encoded as the returned iterator advances.
+    """
+
+    df = df.sort_values("t_ms", kind="stable")
+    best_lap = df.groupby("car_id", observed=True)["lap_time_s"].transform("min")
+    flag = df["flag_state"] if "flag_state" in df.columns else pd.Series("green", index=df.index)
+    frames = pd.DataFrame(
+        {
+            "t_ms": df["t_ms"],
+            "car_id": df["car_id"].astype(str),
+            "lap": df["lap"],
+            "delta_s": (df["lap_time_s"] - best_lap).fillna(0.0),
+            "flag": flag.astype(object).fillna("green").astype(str),
+        }
+    )
+    return _encode_frame_chunks(frames, chunk_rows)
+
+
+def _encode_frame_chunks(frames: pd.DataFrame, chunk_rows: int) -> Iterator[list[str]]:
+    for start in range(0, len(frames), chunk_rows):
+        chunk = frames.iloc[start : start + chunk_rows]
+        yield [orjson.dumps(record).decode() for record in frame_records(chunk, WS_FRAME_FIELDS)]
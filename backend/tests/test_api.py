@@ -1,16 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import time
 import zipfile
 from pathlib import Path
+from typing import AsyncIterator
 
-import fakeredis.aioredis
+import anyio
+import fakeredis
+import orjson
+import pyarrow as pa
 import pytest
+import redis.asyncio as aioredis
+from fakeredis.aioredis import FakeConnection
 from fastapi.testclient import TestClient
 
+from backend.app import schemas
+from backend.app.api.routes import EVENT_ANALYTICS_COLUMNS
+from backend.app.broadcast import DISCONNECT, DROP, SessionBroadcaster
+from backend.app.cache import RedisCache
+from backend.app.coalesce import RequestCoalescer
 from backend.app.config import Settings
+from backend.app.dataio import SESSION_METRICS_COLUMNS, normalize_files
 from backend.app.dataio.parquet_store import ParquetStore
-from backend.app.deps import get_parquet_store, get_redis, get_settings_dependency
+from backend.app.dataio.table_cache import TableCache
+from backend.app.deps import (
+    get_broadcaster,
+    get_executor,
+    get_jobs,
+    get_parquet_store,
+    get_redis,
+    get_settings_dependency,
+)
+from backend.app.execution import ExecutionLayer
+from backend.app.jobs import IngestJob, JobManager
 from backend.app.main import app
+from backend.app.models import dtw_columns
+from backend.app.routes.sessions import LAP_COLUMNS
+from backend.app.serialization import (
+    ARROW_STREAM,
+    COLUMNS_JSON,
+    JSON,
+    LAP_FRAME_FIELDS,
+    encode_lap_page,
+    encode_stream_frames,
+)
 
 
 @pytest.fixture()
@@ -32,34 +67,75 @@ def client(tmp_path: Path) -> TestClient:
         model_dir=data_dir / "models",
     )
 
-    store = ParquetStore(root=data_dir / "parquet", partition_cols=["session_id", "track"])
+    store = ParquetStore(
+        root=data_dir / "parquet",
+        partition_cols=["session_id", "track"],
+        table_cache=TableCache(64 * 1024 * 1024),
+    )
 
-    async def _redis_override():
-        client = fakeredis.aioredis.FakeRedis()
-        try:
-            yield client
-        finally:
-            await client.close()
+    pool = aioredis.BlockingConnectionPool(
+        connection_class=FakeConnection,
+        server=fakeredis.FakeServer(),
+        max_connections=4,
+        timeout=0.1,
+    )
+    redis_cache = RedisCache(pool, retry_interval_s=60)
 
     app.dependency_overrides[get_settings_dependency] = lambda: settings
     app.dependency_overrides[get_parquet_store] = lambda: store
-    app.dependency_overrides[get_redis] = _redis_override
+    app.dependency_overrides[get_redis] = lambda: redis_cache
 
     with TestClient(app) as test_client:
+        jobs = JobManager(data_dir / "jobs", lambda: store, settings, queue_limit=2)
+        test_client.portal.call(jobs.start)
+        app.dependency_overrides[get_jobs] = lambda: jobs
         yield test_client
+        test_client.portal.call(jobs.stop)
 
     app.dependency_overrides.clear()
+    anyio.run(redis_cache.close)
 
 
-def test_ingest_and_query(client: TestClient) -> None:
+def _ingest(client: TestClient, session_id: str) -> dict:
+    """Queue an ingest of the sample archive and poll its job until it finishes."""
+
     response = client.post(
-        "/api/sessions/test_session/ingest",
+        f"/api/sessions/{session_id}/ingest",
         json={"zip_path": "input/barber-motorsports-park.zip"},
     )
-    assert response.status_code == 200
-    payload = response.json()
+    assert response.status_code == 202
+    assert response.headers["Location"] == f"/api/jobs/{response.json()['job_id']}"
+    return _wait_for_job(client, response.headers["Location"])
+
+
+def _wait_for_job(client: TestClient, location: str) -> dict:
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        job = client.get(location).json()
+        if job["status"] not in ("queued", "running"):
+            assert job["status"] == "succeeded", job["error"]
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"{location} did not finish")
+
+
+def test_ingest_and_query(client: TestClient) -> None:
+    payload = _ingest(client, "test_session")
     assert payload["session_id"] == "test_session"
+    assert payload["stage"] == "metrics" and payload["rows_processed"] > 0
     assert "fastest_lap" in payload["metrics"]
+    stages = {stage["stage"]: stage for stage in payload["profile"]}
+    assert {
+        "normalize.read",
+        "normalize.read_file",
+        "normalize.timestamp",
+        "normalize.coerce",
+        "normalize.interpolate",
+        "parquet.write",
+        "metrics",
+    } <= set(stages)
+    assert stages["normalize.interpolate"]["rows_in"] == stages["normalize.interpolate"]["rows_out"]
+    assert all(stage["wall_s"] >= 0 and stage["peak_rss_mb"] > 0 for stage in stages.values())
 
     laps = client.get(
         "/api/sessions/test_session/laps",
@@ -69,6 +145,36 @@ def test_ingest_and_query(client: TestClient) -> None:
     data = laps.json()
     assert data["data"]
 
+    first = client.get("/api/sessions/test_session/laps", params={"limit": 5}).json()
+    assert first["next_cursor"]
+    second = client.get(
+        "/api/sessions/test_session/laps", params={"limit": 5, "cursor": first["next_cursor"]}
+    ).json()
+    both = client.get("/api/sessions/test_session/laps", params={"limit": 10}).json()
+    assert first["data"] + second["data"] == both["data"]
+    bad = client.get("/api/sessions/test_session/laps", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+    columnar = client.get(
+        "/api/sessions/test_session/laps",
+        params={"limit": 10},
+        headers={"Accept": f"{COLUMNS_JSON}, application/json;q=0.5"},
+    )
+    assert columnar.headers["content-type"] == COLUMNS_JSON
+    columns = columnar.json()["columns"]
+    assert [dict(zip(columns, row)) for row in zip(*columns.values())] == both["data"]
+    for _ in range(2):  # miss, then the cached bytes
+        arrow = client.get(
+            "/api/sessions/test_session/laps",
+            params={"limit": 10},
+            headers={"Accept": ARROW_STREAM},
+        )
+        table = pa.ipc.open_stream(arrow.content).read_all()
+        assert table.to_pylist() == both["data"]
+        assert orjson.loads(table.schema.metadata[b"next_cursor"]) == both["next_cursor"]
+    unacceptable = client.get("/api/sessions/test_session/laps", headers={"Accept": "text/csv"})
+    assert unacceptable.status_code == 406
+
     summary = client.get("/api/sessions/test_session/summary")
     assert summary.status_code == 200
     strategy = client.post("/api/strategy/simulate", json={"session_id": "test_session"})
@@ -89,6 +195,464 @@ def test_ingest_and_query(client: TestClient) -> None:
     assert training.status_code == 200
     assert "recommendations" in training.json()
 
+    analytics = client.get("/api/events/test_session/analytics")
+    assert analytics.status_code == 200
+    assert analytics.json()["summary"]["fastest_lap"]
+    comparison = client.get(
+        "/api/events/test_session/drivers/GR21/lap-comparison",
+        params={"lap": 1, "reference_driver_id": "GR22"},
+    )
+    assert comparison.status_code == 200
+    assert comparison.json()["metric"] == "speed_kph"
+    unknown_metric = client.get(
+        "/api/events/test_session/drivers/GR21/lap-comparison",
+        params={"lap": 1, "reference_driver_id": "GR22", "metric": "rpm"},
+    )
+    assert unknown_metric.status_code == 400
+    missing_event = client.get(
+        "/api/events/nope/drivers/GR21/lap-comparison",
+        params={"lap": 1, "reference_driver_id": "GR22"},
+    )
+    assert missing_event.status_code == 404
+
+    cache = client.get("/api/cache/stats").json()
+    assert cache["enabled"] and cache["hits"] > 0 and cache["bytes"] <= cache["max_bytes"]
+
     with client.websocket_connect("/ws/test_session") as ws:
         frame = ws.receive_json()
         assert "car_id" in frame
+
+
+def test_routes_read_only_the_columns_they_need(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _ingest(client, "projected")
+    store = app.dependency_overrides[get_parquet_store]()
+    reads: list[tuple[str, list[str] | None]] = []
+    for name in ("read_session", "scan_laps"):
+
+        def spy(*args, _method=getattr(store, name), _name=name, **kwargs):
+            reads.append((_name, kwargs.get("columns")))
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(store, name, spy)
+
+    def projections(method: str, path: str, **kwargs) -> list[tuple[str, list[str] | None]]:
+        reads.clear()
+        assert client.request(method, path, **kwargs).status_code == 200
+        return list(reads)
+
+    assert projections("GET", "/api/sessions/projected/laps", params={"limit": 5}) == [
+        ("scan_laps", LAP_COLUMNS)
+    ]
+    assert projections("GET", "/api/sessions/projected/summary") == [
+        ("read_session", SESSION_METRICS_COLUMNS)
+    ]
+    assert projections("GET", "/api/events/projected/analytics") == [
+        ("read_session", EVENT_ANALYTICS_COLUMNS)
+    ]
+    comparison = "/api/events/projected/drivers/GR21/lap-comparison"
+    params = {"lap": 1, "reference_driver_id": "GR22"}
+    assert projections("GET", comparison, params={**params, "metric": "throttle"}) == [
+        ("read_session", ["car_id", "t_ms", "throttle"])
+    ]
+    payload = {
+        "session_id": "projected",
+        "ideal_car_id": "GR21",
+        "reference_car_id": "GR22",
+        "lap": 1,
+        "metric": "brake",
+    }
+    assert projections("POST", "/api/training/compare-lap", json=payload) == [
+        ("read_session", ["t_ms", "brake"])
+    ] * 2
+
+    # Keys and categorical columns cannot be aligned and never reach the store.
+    assert dtw_columns("t_ms") == ["t_ms"]
+    reads.clear()
+    for metric in ("t_ms", "car_id", "lap", "flag_state", "rpm"):
+        rejected = client.get(comparison, params={**params, "metric": metric})
+        assert rejected.status_code == 400, metric
+        rejected = client.post("/api/training/compare-lap", json={**payload, "metric": metric})
+        assert rejected.status_code == 400, metric
+    assert reads == []
+
+
+def test_lap_pages_negotiate_media_types(client: TestClient) -> None:
+    _ingest(client, "formats")
+    redis = app.dependency_overrides[get_redis]()
+    path, params = "/api/sessions/formats/laps", {"limit": 10}
+    bodies, etags = {}, {}
+    hits = redis.stats()["hits"]
+    for media_type in (JSON, COLUMNS_JSON, ARROW_STREAM):
+        headers = {"Accept": media_type}
+        first, cached = (client.get(path, params=params, headers=headers) for _ in range(2))
+        for response in (first, cached):
+            assert response.status_code == 200
+            assert response.headers["content-type"] == media_type
+            assert response.headers["Vary"] == "Accept"
+        assert cached.content == first.content
+        assert cached.headers["ETag"] == first.headers["ETag"]
+        bodies[media_type], etags[media_type] = first.content, first.headers["ETag"]
+        revalidated = client.get(
+            path, params=params, headers={**headers, "If-None-Match": etags[media_type]}
+        )
+        assert revalidated.status_code == 304
+    # Each representation has its own cache entry and validator.
+    assert redis.stats()["hits"] - hits == 3
+    keys = client.portal.call(redis.client.keys, "session:formats:*:laps:*")
+    assert sorted(key.decode().rsplit(":", 1)[1] for key in keys) == sorted(etags)
+    assert len(set(etags.values())) == 3
+
+    page = orjson.loads(bodies[JSON])
+    envelope = {key: value for key, value in page.items() if key != "data"}
+    columnar = orjson.loads(bodies[COLUMNS_JSON])
+    columns = columnar.pop("columns")
+    assert columnar == envelope
+    assert [dict(zip(columns, row)) for row in zip(*columns.values())] == page["data"]
+    table = pa.ipc.open_stream(bodies[ARROW_STREAM]).read_all()
+    assert table.to_pylist() == page["data"]
+    metadata = {key.decode(): orjson.loads(value) for key, value in table.schema.metadata.items()}
+    assert {key: metadata[key] for key in envelope} == envelope
+
+    preferred = {
+        f"{JSON};q=0.5, {ARROW_STREAM}": ARROW_STREAM,
+        "text/csv, */*;q=0.1": JSON,
+        "application/*": JSON,
+    }
+    for accept, media_type in preferred.items():
+        response = client.get(path, params=params, headers={"Accept": accept})
+        assert response.headers["content-type"] == media_type, accept
+    for accept in ("text/csv", f"{ARROW_STREAM};q=0"):
+        assert client.get(path, params=params, headers={"Accept": accept}).status_code == 406
+
+
+def test_heavy_endpoints_shed_load_when_pools_are_full(client: TestClient) -> None:
+    executor = ExecutionLayer(io_workers=2, cpu_workers=1, cpu_queue_limit=0, retry_after_s=7)
+    app.dependency_overrides[get_executor] = lambda: executor
+    try:
+        _ingest(client, "busy")
+
+        assert executor.cpu_lane.try_acquire()
+        shed = client.post("/api/strategy/simulate", json={"session_id": "busy"})
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "7"
+        assert client.get("/api/health").status_code == 200
+        assert client.get("/api/sessions/busy/laps", params={"limit": 5}).status_code == 200
+        assert executor.stats()["cpu"]["rejected"] == 1
+
+        executor.cpu_lane.release()
+        assert client.post("/api/strategy/simulate", json={"session_id": "busy"}).status_code == 200
+        assert executor.stats()["cpu"]["in_flight"] == 0
+    finally:
+        executor.shutdown()
+
+
+def test_cache_pool_is_shared_and_falls_back_when_redis_is_down(client: TestClient) -> None:
+    _ingest(client, "pooled")
+    for _ in range(3):
+        assert client.get("/api/sessions/pooled/summary").status_code == 200
+    stats = client.get("/api/redis/stats").json()
+    assert stats["hits"] == 2 and stats["errors"] == 0
+    assert stats["connections_in_use"] == 0 and stats["connections_idle"] == 1
+
+    redis_cache = app.dependency_overrides[get_redis]()
+    redis_cache.pool.connection_kwargs["server"].connected = False
+    summary = client.get("/api/sessions/pooled/summary")
+    laps = client.get("/api/sessions/pooled/laps", params={"limit": 5})
+    assert summary.status_code == 200 and laps.status_code == 200
+    stats = client.get("/api/redis/stats").json()
+    assert stats["available"] is False
+    assert stats["errors"] == 1 and stats["skipped"] >= 2
+
+
+def test_lap_page_encoding_matches_pydantic_models() -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    df = normalize_files([csv_path], session_id="s1", track="Barber")
+    df["lap_time_s"] = df["lap_time_s"].where(df.index % 3 > 0)
+    frames = [
+        schemas.TelemetryFrame(**{key: row[key] for key in LAP_FRAME_FIELDS})
+        for row in df.to_dict("records")
+    ]
+    expected = schemas.LapResponse(
+        session_id="s1", track="Barber", data=frames, total=len(df), offset=0, limit=50
+    )
+    encoded = encode_lap_page(
+        df, session_id="s1", track="Barber", offset=0, limit=50, next_cursor=None
+    )
+    # pydantic writes missing floats as NaN, which is not valid JSON.
+    assert orjson.loads(encoded) == orjson.loads(expected.json().replace("NaN", "null"))
+    assert orjson.loads(encoded)["data"][0]["lap_time_s"] is None
+
+
+def test_rewritten_session_is_not_served_from_stale_cache(client: TestClient) -> None:
+    response = _ingest(client, "versioned")
+    params = {"limit": 5}
+    first = client.get("/api/sessions/versioned/laps", params=params).json()
+    assert client.get("/api/sessions/versioned/laps", params=params).json() == first
+    assert client.get("/api/sessions/versioned/summary").status_code == 200
+
+    store = app.dependency_overrides[get_parquet_store]()
+    generation = store.session_generation("versioned")
+    df = store.read_session("versioned")
+    store.write_session(df.assign(speed_kph=1.0, lap_time_s=df["lap_time_s"] + 10))
+    assert store.session_generation("versioned") > generation
+
+    fresh = client.get("/api/sessions/versioned/laps", params=params).json()
+    assert [frame["speed_kph"] for frame in fresh["data"]] == [1.0] * 5
+    summary = client.get("/api/sessions/versioned/summary").json()
+    assert min(summary["fastest_lap"].values()) > min(response["metrics"]["fastest_lap"].values())
+
+
+def test_coalescer_computes_concurrent_identical_requests_once() -> None:
+    server = fakeredis.FakeServer()
+
+    def worker_cache() -> RedisCache:
+        pool = aioredis.BlockingConnectionPool(
+            connection_class=FakeConnection, server=server, max_connections=8
+        )
+        return RedisCache(pool)
+
+    calls: list[str] = []
+
+    async def compute() -> bytes:
+        calls.append("computed")
+        await asyncio.sleep(0.2)
+        return b'{"ok": true}'
+
+    async def main() -> None:
+        # Two workers, each with its own cache client and in-flight table.
+        workers = [(RequestCoalescer(poll_interval_s=0.01), worker_cache()) for _ in range(2)]
+        requests = [
+            coalescer.get_or_compute(cache, "session:s1:g1:metrics", compute, ttl_s=60)
+            for coalescer, cache in workers
+            for _ in range(10)
+        ]
+        assert set(await asyncio.gather(*requests)) == {b'{"ok": true}'}
+        assert len(calls) == 1
+        stats = [coalescer.stats() for coalescer, _ in workers]
+        assert sum(item["joined"] for item in stats) == 18
+        assert sum(item["remote_hits"] for item in stats) == 1
+        assert not await workers[0][1].exists("lock:session:s1:g1:metrics")
+        for _, cache in workers:
+            await cache.close()
+
+    asyncio.run(main())
+
+
+def test_read_endpoints_answer_conditional_requests(client: TestClient) -> None:
+    _ingest(client, "etag")
+    requests = [
+        ("/api/sessions/etag/summary", {}),
+        ("/api/sessions/etag/laps", {"limit": 5}),
+        ("/api/events/etag/analytics", {}),
+        ("/api/events/etag/drivers/GR21/lap-comparison", {"lap": 1, "reference_driver_id": "GR22"}),
+    ]
+    etags = {}
+    for path, params in requests:
+        first = client.get(path, params=params)
+        assert first.status_code == 200
+        etag = etags[path] = first.headers["ETag"]
+        assert etag.startswith('"') and first.headers["Cache-Control"] == "no-cache"
+        revalidated = client.get(path, params=params, headers={"If-None-Match": f'"other", {etag}'})
+        assert revalidated.status_code == 304 and not revalidated.content
+        assert revalidated.headers["ETag"] == etag
+
+    # With the I/O lane full, revalidations and cached pages are still answered.
+    executor = ExecutionLayer(io_workers=1, cpu_workers=0, io_queue_limit=0)
+    app.dependency_overrides[get_executor] = lambda: executor
+    assert executor.io_lane.try_acquire()
+    try:
+        for path, params in requests:
+            headers = {"If-None-Match": etags[path]}
+            assert client.get(path, params=params, headers=headers).status_code == 304
+        assert client.get("/api/sessions/etag/laps", params={"limit": 5}).status_code == 200
+        assert client.get("/api/sessions/etag/laps", params={"limit": 7}).status_code == 503
+    finally:
+        executor.io_lane.release()
+        del app.dependency_overrides[get_executor]
+        executor.shutdown()
+
+    columnar = client.get(
+        "/api/sessions/etag/laps", params={"limit": 5}, headers={"Accept": COLUMNS_JSON}
+    )
+    assert columnar.headers["ETag"] != etags["/api/sessions/etag/laps"]
+    other_page = client.get("/api/sessions/etag/laps", params={"limit": 6})
+    assert other_page.headers["ETag"] != etags["/api/sessions/etag/laps"]
+
+    store = app.dependency_overrides[get_parquet_store]()
+    store.write_session(store.read_session("etag").assign(speed_kph=1.0))
+    for path, params in requests:
+        refreshed = client.get(path, params=params, headers={"If-None-Match": etags[path]})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["ETag"] != etags[path]
+
+
+def test_ingest_jobs_are_bounded_and_reported(client: TestClient) -> None:
+    assert client.get("/api/jobs/unknown").status_code == 404
+    missing = client.post("/api/sessions/none/ingest", json={"zip_path": "input/missing.zip"})
+    assert missing.status_code == 404
+
+    jobs = app.dependency_overrides[get_jobs]()
+    jobs._waiting = jobs.queue_limit
+    try:
+        shed = client.post(
+            "/api/sessions/full/ingest", json={"zip_path": "input/barber-motorsports-park.zip"}
+        )
+        assert shed.status_code == 503 and "Retry-After" in shed.headers
+    finally:
+        jobs._waiting = 0
+
+    # The only slot is held by another live API worker, so the job waits for it.
+    slot = jobs.directory / "slot-0.lock"
+    slot.write_bytes(orjson.dumps({"pid": 1, "boot": "other-worker"}))
+    response = client.post(
+        "/api/sessions/slotted/ingest", json={"zip_path": "input/barber-motorsports-park.zip"}
+    )
+    time.sleep(0.5)
+    assert client.get(response.headers["Location"]).json()["status"] == "queued"
+    # That worker died before its lock was complete and stopped renewing it.
+    slot.write_bytes(b"")
+    stale = time.time() - jobs.lease_s - 1
+    os.utime(slot, (stale, stale))
+    _wait_for_job(client, response.headers["Location"])
+    assert not list(jobs.directory.glob("*.lock"))
+
+
+def _write_job(directory: Path, job: IngestJob, lock_age_s: float | None = None) -> None:
+    """Persist ``job`` as another worker would, with a lock last renewed ``lock_age_s`` ago."""
+
+    (directory / f"{job.job_id}.json").write_bytes(orjson.dumps(vars(job)))
+    if lock_age_s is not None:
+        lock = directory / f"job-{job.job_id}.lock"
+        lock.write_bytes(orjson.dumps({"pid": job.owner_pid, "boot": "previous"}))
+        renewed = time.time() - lock_age_s
+        os.utime(lock, (renewed, renewed))
+
+
+def test_interrupted_ingest_job_is_resumed(client: TestClient, tmp_path: Path) -> None:
+    jobs = app.dependency_overrides[get_jobs]()
+    # Jobs left running by a worker process that no longer exists.
+    crashed = IngestJob(
+        job_id="crashed",
+        session_id="resumed",
+        track="Barber Motorsports Park",
+        zip_path=str(tmp_path / "input" / "barber-motorsports-park.zip"),
+        status="running",
+        stage="normalize.read",
+        attempts=1,
+        owner_pid=1,
+    )
+    exhausted = IngestJob(**{**vars(crashed), "job_id": "exhausted", "attempts": 3})
+    _write_job(jobs.directory, crashed)
+    _write_job(jobs.directory, exhausted)
+    # Left by the previous container, which also ran the API as PID 1.
+    restarted = IngestJob(**{**vars(crashed), "job_id": "restarted", "session_id": "restarted"})
+    _write_job(jobs.directory, restarted, lock_age_s=60)
+    # Running in another live container: its lock is being renewed.
+    elsewhere = IngestJob(**{**vars(crashed), "job_id": "elsewhere", "session_id": "elsewhere"})
+    _write_job(jobs.directory, elsewhere, lock_age_s=0)
+
+    resumer = JobManager(
+        jobs.directory, jobs.store_provider, jobs.settings, max_attempts=3, lease_s=30
+    )
+    client.portal.call(resumer.start)
+    try:
+        job = _wait_for_job(client, "/api/jobs/crashed")
+        assert _wait_for_job(client, "/api/jobs/restarted")["attempts"] == 2
+        assert client.get("/api/jobs/elsewhere").json()["status"] == "running"
+    finally:
+        client.portal.call(resumer.stop)
+    assert job["attempts"] == 2 and job["metrics"]["fastest_lap"]
+    assert client.get("/api/jobs/exhausted").json()["status"] == "failed"
+    assert client.get("/api/sessions/resumed/laps", params={"limit": 5}).status_code == 200
+    assert [path.name for path in jobs.directory.glob("*.lock")] == ["job-elsewhere.lock"]
+
+    # A worker that dies while the others keep running: its job is adopted on a
+    # heartbeat of a manager that is already up.
+    os.utime(jobs.directory / "job-elsewhere.lock")
+    survivor = JobManager(jobs.directory, jobs.store_provider, jobs.settings, lease_s=1)
+    client.portal.call(survivor.start)
+    try:
+        assert client.get("/api/jobs/elsewhere").json()["status"] == "running"
+        assert _wait_for_job(client, "/api/jobs/elsewhere")["attempts"] == 2
+    finally:
+        client.portal.call(survivor.stop)
+
+
+def test_session_stream_is_produced_once_for_all_viewers(client: TestClient) -> None:
+    _ingest(client, "shared")
+    broadcaster = SessionBroadcaster(frame_interval_s=0.02)
+    app.dependency_overrides[get_broadcaster] = lambda: broadcaster
+
+    with client.websocket_connect("/ws/shared") as first:
+        frame = first.receive_json()
+        assert schemas.WebSocketFrame(**frame)
+        # The first stream is under way, so this viewer gets its own from the start.
+        with client.websocket_connect("/ws/shared") as second:
+            assert second.receive_json() == frame
+            stats = client.get("/api/ws/stats").json()
+            assert stats["streams"] == 2 and stats["subscribers"] == 2
+    with client.websocket_connect("/ws/shared", params={"start_ms": 10**9}) as late:
+        assert late.receive_json() == {"error": "session not found"}
+    stats = client.get("/api/ws/stats").json()
+    assert stats["streams_started"] == 3
+    assert stats["streams"] == 0 and stats["subscribers"] == 0
+
+    # Frames are encoded lazily in bounded chunks, with best laps over the whole session.
+    df = normalize_files(
+        [Path("data/samples/barber-motorsports-park.csv").resolve()], session_id="s1", track="T"
+    )
+    chunks = list(encode_stream_frames(df, chunk_rows=5))
+    assert max(len(chunk) for chunk in chunks) == 5
+    assert sum(chunks, []) == next(encode_stream_frames(df, chunk_rows=len(df)))
+
+
+def test_slow_stream_viewers_are_dropped_or_disconnected() -> None:
+    frames = [f'{{"t_ms": {index}}}' for index in range(20)]
+    loads: list[int] = []
+
+    async def load() -> AsyncIterator[list[str]]:
+        loads.append(1)
+        for start in range(0, len(frames), 7):
+            yield frames[start : start + 7]
+
+    async def drain(subscriber) -> list[str]:
+        received = []
+        while (frame := await subscriber.queue.get()) is not None:
+            received.append(frame)
+        return received
+
+    async def main() -> None:
+        for policy in (DROP, DISCONNECT):
+            broadcaster = SessionBroadcaster(buffer_size=4, slow_consumer=policy, frame_interval_s=0)
+            # Both join before the first frame, so they share one producer.
+            fast = broadcaster.subscribe(("s1", 0), load)
+            slow = broadcaster.subscribe(("s1", 0), load)
+            assert await drain(fast) == frames and fast.dropped == 0
+            if policy == DROP:
+                assert slow.dropped > 0 and slow.error is None
+                assert slow.queue.qsize() == 4
+            else:
+                assert slow.close_code == 1008 and slow.error["error"] == "client too slow"
+                assert broadcaster.stats()["slow_disconnects"] == 1
+            assert broadcaster.stats()["streams"] == 0
+
+        # The producer stops as soon as the last viewer leaves.
+        broadcaster = SessionBroadcaster(frame_interval_s=1)
+        viewer = broadcaster.subscribe(("s1", 0), load)
+        await viewer.queue.get()
+        broadcaster.unsubscribe(viewer)
+        await asyncio.sleep(0)
+        assert broadcaster.stats()["streams"] == 0 and viewer.queue.empty()
+
+        # A viewer arriving after the first frame still replays from its position.
+        broadcaster = SessionBroadcaster(frame_interval_s=0)
+        early = broadcaster.subscribe(("s1", 0), load)
+        assert await early.queue.get() == frames[0]
+        late = broadcaster.subscribe(("s1", 0), load)
+        assert await drain(late) == frames
+        assert broadcaster.stats()["streams_started"] == 2
+
+    asyncio.run(main())
+    assert len(loads) == 5
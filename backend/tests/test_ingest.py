@@ -3,8 +3,33 @@ from __future__ import annotations
 import zipfile
 from pathlib import Path
 
-from backend.app.dataio import compute_session_metrics, extract_zip, normalize_files
-from backend.app.dataio.parquet_store import ParquetStore
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+from backend.app.dataio import (
+    compute_session_metrics,
+    extract_zip,
+    list_zip_members,
+    normalize_files,
+)
+from backend.app.dataio.chunked import _iter_raw_batches, ingest_streaming
+from backend.app.dataio.normalize import (
+    CANONICAL_DTYPES,
+    INTERPOLATED_COLUMNS,
+    SORT_KEYS,
+    _derive_missing_lap_times,
+    _interpolate_numeric,
+    _read_raw_file,
+    derive_lap_timing,
+)
+from backend.app.dataio.parquet_store import LapCursor, ParquetStore
+from backend.app.dataio.table_cache import TableCache
+from backend.app.profiling import IngestProfiler, profile_stage
 
 
 def test_ingestion_pipeline(tmp_path: Path) -> None:
@@ -34,3 +59,476 @@ def test_ingestion_pipeline(tmp_path: Path) -> None:
     reloaded = store.read_session("unit_session")
     assert not reloaded.empty
     assert reloaded["car_id"].nunique() == df["car_id"].nunique()
+    for frame in (df, reloaded):
+        for column, dtype in CANONICAL_DTYPES.items():
+            assert frame[column].dtype == dtype, column
+
+
+def test_canonical_dtypes_survive_the_store(tmp_path: Path) -> None:
+    sample = pd.read_csv("data/samples/barber-motorsports-park.csv")
+    # Cars arrive out of lexical order, so Arrow dictionaries list them unsorted.
+    csv_path = tmp_path / "cars.csv"
+    pd.concat([sample.assign(car=car) for car in ("GR9", "GR100", "GR10")]).to_csv(
+        csv_path, index=False
+    )
+    df = normalize_files([csv_path], session_id="typed", track="Barber")
+    store = ParquetStore(root=tmp_path / "parquet", partition_cols=["session_id", "track"])
+    store.write_session(df)
+
+    frames = {
+        "read_session": store.read_session("typed"),
+        "scan_laps": store.scan_laps("typed", limit=len(df)),
+        "filtered": store.read_session(
+            "typed", columns=["car_id", "lap", "speed_kph"], filters=[("car_id", "eq", "GR9")]
+        ),
+    }
+    for name, frame in frames.items():
+        for column in set(frame.columns).intersection(CANONICAL_DTYPES):
+            assert frame[column].dtype == CANONICAL_DTYPES[column], (name, column)
+        categories = list(frame["car_id"].cat.categories)
+        assert categories == sorted(categories), name
+        by_car = frame.sort_values("car_id", kind="stable")["car_id"].astype(str).tolist()
+        assert by_car == sorted(by_car), name
+    assert frames["scan_laps"]["car_id"].astype(str).unique().tolist() == ["GR10", "GR100", "GR9"]
+
+
+def test_extract_zip_parallel_and_crc_check(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    zip_path = tmp_path / "multi.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for idx in range(4):
+            zf.write(csv_path, arcname=f"car_{idx}/telemetry.csv")
+    files = extract_zip(zip_path, tmp_path / "staging", workers=4)
+    assert [path.parent.name for path in files] == [f"car_{idx}" for idx in range(4)]
+    assert all(path.read_bytes() == csv_path.read_bytes() for path in files)
+
+    # Flip a byte inside the first stored member's payload to break its CRC.
+    with zipfile.ZipFile(zip_path) as zf:
+        info = zf.infolist()[0]
+    raw = bytearray(zip_path.read_bytes())
+    name_len = int.from_bytes(raw[info.header_offset + 26 : info.header_offset + 28], "little")
+    extra_len = int.from_bytes(raw[info.header_offset + 28 : info.header_offset + 30], "little")
+    raw[info.header_offset + 30 + name_len + extra_len] ^= 0xFF
+    zip_path.write_bytes(bytes(raw))
+    with pytest.raises(ValueError, match="CRC mismatch"):
+        extract_zip(zip_path, tmp_path / "staging")
+    assert not (tmp_path / "staging").exists()
+
+
+def test_normalize_directly_from_archive(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    zip_path = tmp_path / "barber-motorsports-park.zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.write(csv_path, arcname="telemetry.csv")
+
+    members = list_zip_members(zip_path)
+    assert [member.name for member in members] == ["telemetry.csv"]
+    from_archive = normalize_files(members, session_id="s", track="Barber")
+    from_disk = normalize_files(extract_zip(zip_path, tmp_path / "staging"), session_id="s", track="Barber")
+    pd.testing.assert_frame_equal(from_archive, from_disk)
+
+
+def test_millisecond_columns_convert_to_canonical_units(tmp_path: Path) -> None:
+    sample = pd.read_csv("data/samples/barber-motorsports-park.csv")
+    raw = sample[sample["car"] == sample["car"].iloc[0]].head(6)
+
+    def normalize(name: str, frame: pd.DataFrame) -> pd.DataFrame:
+        path = tmp_path / f"{name}.csv"
+        frame.to_csv(path, index=False)
+        return normalize_files([path], session_id="s", track="Barber")
+
+    expected_lap_time_s = (raw["lap_time_ms"] / 1000.0).tolist()
+    for name, column in (("lap_time_ms", "lap_time_ms"), ("delta_ms", "delta_ms")):
+        df = normalize(name, raw.rename(columns={"lap_time_ms": column}))
+        assert df["lap_time_s"].tolist() == pytest.approx(expected_lap_time_s)
+
+    # A millisecond timestamp column is taken as t_ms verbatim.
+    for column in ("timestamp_ms", "time_ms"):
+        df = normalize(column, raw.rename(columns={"timestamp_ms": column}))
+        assert df["t_ms"].tolist() == raw["timestamp_ms"].tolist()
+
+    # Without one, t_ms is accumulated from the lap times instead.
+    seconds = raw.drop(columns=["timestamp_ms", "lap_time_ms"]).assign(lap_time_s=expected_lap_time_s)
+    df = normalize("lap_time_s", seconds)
+    assert df["t_ms"].tolist() == [round(sum(expected_lap_time_s[: i + 1]) * 1000) for i in range(len(raw))]
+
+
+def test_interpolate_numeric_matches_per_car_interpolation() -> None:
+    rng = np.random.default_rng(7)
+    rows = 2_000
+    df = pd.DataFrame(
+        {
+            "car_id": rng.choice([f"GR{idx}" for idx in range(12)], size=rows),
+            "lap": pd.array(rng.integers(1, 20, size=rows), dtype="Int64"),
+            "sector": pd.array(rng.integers(1, 4, size=rows), dtype="Int64"),
+            "t_ms": pd.array(rng.permutation(rows), dtype="Int64"),
+        }
+    )
+    for column in INTERPOLATED_COLUMNS:
+        values = rng.normal(100, 10, size=rows)
+        values[rng.random(rows) < 0.3] = np.nan
+        df[column] = values
+    df.loc[df["car_id"] == "GR3", "speed_kph"] = np.nan
+
+    expected = df.sort_values(["car_id", "lap", "sector", "t_ms"])
+    expected[INTERPOLATED_COLUMNS] = expected.groupby("car_id")[INTERPOLATED_COLUMNS].transform(
+        lambda s: s.interpolate(limit_direction="both").bfill().ffill()
+    )
+    result = _interpolate_numeric(df.copy())
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_lap_timing_matches_grouped_reference() -> None:
+    rng = np.random.default_rng(11)
+    rows = 3_000
+    df = pd.DataFrame(
+        {
+            "car_id": pd.Categorical(rng.choice([f"GR{idx}" for idx in range(8)], size=rows)),
+            "lap": pd.array(rng.integers(1, 15, size=rows), dtype="Int64"),
+            "sector": pd.array(rng.integers(1, 4, size=rows), dtype="Int64"),
+            "t_ms": pd.array(rng.integers(0, 10_000_000, size=rows), dtype="Int64"),
+            "lap_time_s": np.nan,
+        }
+    )
+    df.loc[rng.random(rows) < 0.05, "t_ms"] = pd.NA
+    df = df.sort_values(SORT_KEYS, ignore_index=True)
+
+    timing = derive_lap_timing(df)
+    laps = df.groupby(["car_id", "lap"], observed=True)["t_ms"]
+    np.testing.assert_allclose(timing["lap_start_ms"], laps.transform("min").astype(float))
+    np.testing.assert_allclose(timing["lap_end_ms"], laps.transform("max").astype(float))
+    np.testing.assert_allclose(timing["sector_time_ms"], laps.diff().astype(float))
+
+    derived = _derive_missing_lap_times(df.copy())
+    expected = laps.transform(lambda s: (s - s.min()) / 1000.0).astype(float)
+    np.testing.assert_allclose(derived["lap_time_s"], expected)
+
+
+def test_read_raw_file_applies_canonical_types(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    raw = _read_raw_file(csv_path)
+    assert raw["car"].dtype == object
+    assert raw["lap_number"].dtype == pd.Int64Dtype()
+    assert raw["speed"].dtype == np.float64
+
+    records = pd.read_csv(csv_path).to_dict("records")
+    ndjson_path = tmp_path / "telemetry.json"
+    ndjson_path.write_bytes(b"\n".join(orjson.dumps(record) for record in records))
+    array_path = tmp_path / "telemetry_array.json"
+    array_path.write_bytes(orjson.dumps(records))
+    for path in (ndjson_path, array_path):
+        df = normalize_files([path], session_id="s", track="Barber")
+        assert len(df) == len(records)
+        assert df["lap_time_s"].between(20, 300).all()
+
+
+def test_read_raw_file_tolerates_dirty_values(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    source = pd.read_csv(csv_path)
+    dirty = source.astype({"gear_idx": object, "timestamp_ms": float, "speed": object})
+    dirty.loc[1, "gear_idx"] = "N"
+    dirty.loc[2, "timestamp_ms"] = 59521.5
+    dirty.loc[3, "speed"] = "--"
+    dirty.columns = [f" {column} " if column == "gear_idx" else column for column in dirty]
+    dirty_path = tmp_path / "dirty.csv"
+    dirty.to_csv(dirty_path, index=False)
+
+    # Columns read as text by each parse of a CSV file.
+    text_reads: list[set[str]] = []
+    read_csv = pa_csv.read_csv
+
+    def counting_read_csv(*args, convert_options, **kwargs):
+        types = convert_options.column_types
+        text_reads.append({name for name, dtype in types.items() if dtype == pa.string()})
+        return read_csv(*args, convert_options=convert_options, **kwargs)
+
+    monkeypatch.setattr(pa_csv, "read_csv", counting_read_csv)
+    raw = _read_raw_file(dirty_path)
+    # Null placeholders and fractional integers are handled by the typed parse.
+    assert len(text_reads) == 1
+    assert raw["gear_idx"].dtype == pd.Int64Dtype() and raw["gear_idx"].isna().sum() == 1
+    assert raw["timestamp_ms"].dtype == pd.Int64Dtype() and raw.loc[2, "timestamp_ms"] == 59522
+    assert raw["speed"].isna().sum() == 1
+    streamed = pd.concat(_iter_raw_batches(dirty_path, batch_rows=5), ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, raw)
+    # A bad value several blocks into a streamed file.
+    long_path = tmp_path / "long.csv"
+    long = pd.concat([source] * 400, ignore_index=True).astype({"gear_idx": object})
+    long.loc[len(long) - 10, "gear_idx"] = "N"
+    long.to_csv(long_path, index=False)
+    streamed = pd.concat(_iter_raw_batches(long_path, batch_rows=1_000), ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, _read_raw_file(long_path))
+    assert streamed["gear_idx"].isna().sum() == 1
+    assert len(normalize_files([dirty_path], session_id="s", track="Barber")) == len(source)
+    # Any other token makes just its column be re-read as text.
+    odd_path = tmp_path / "odd.csv"
+    odd = source.astype({"speed": object})
+    odd.loc[4, "speed"] = "fast"
+    odd.to_csv(odd_path, index=False)
+    text_reads.clear()
+    odd = _read_raw_file(odd_path)
+    assert odd["speed"].isna().sum() == 1 and odd["speed"].dtype == np.float64
+    text_columns = set(source.select_dtypes(object).columns)
+    assert [reads - text_columns for reads in text_reads] == [set(), {"speed"}]
+    streamed = pd.concat(_iter_raw_batches(odd_path, batch_rows=5), ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, odd)
+
+    ndjson_path = tmp_path / "dirty.json"
+    records = source.to_dict("records")
+    records[1]["gear_idx"] = "N"
+    ndjson_path.write_bytes(b"\n".join(orjson.dumps(record) for record in records))
+    assert _read_raw_file(ndjson_path)["gear_idx"].isna().sum() == 1
+    # Typed straight from the schema, including known fields that appear late.
+    records = source.to_dict("records")
+    records[5]["brake"] = 12
+    ndjson_path.write_bytes(b"\n".join(orjson.dumps(record) for record in records))
+    raw = _read_raw_file(ndjson_path)
+    assert raw["gear_idx"].dtype == pd.Int64Dtype() and raw["speed"].dtype == np.float64
+    assert raw["brake"].dtype == np.float64 and raw["brake"].count() == 1
+    assert "throttle" not in raw.columns
+
+    # pandas' default to_json is a single-line, column-oriented document.
+    columns_path = tmp_path / "columns.json"
+    source.to_json(columns_path)
+    df = normalize_files([columns_path], session_id="s", track="Barber")
+    assert len(df) == len(source)
+
+
+def test_streaming_ingest_matches_in_memory(tmp_path: Path) -> None:
+    sample = pd.read_csv("data/samples/barber-motorsports-park.csv")
+    sample.loc[[1, 4, 9, 17], "speed"] = np.nan
+    sample.loc[[2, 11], "air_temp"] = np.nan
+    zip_path = tmp_path / "endurance.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for car_id, car_df in sample.groupby("car"):
+            zf.writestr(f"{car_id}.csv", car_df.to_csv(index=False))
+        zf.writestr("mixed.csv", sample.assign(car="GR99").to_csv(index=False))
+
+    members = list_zip_members(zip_path)
+    expected = normalize_files(members, session_id="endurance", track="Barber")
+
+    store = ParquetStore(root=tmp_path / "parquet", partition_cols=["session_id", "track"])
+    result = ingest_streaming(
+        members, session_id="endurance", track="Barber", store=store, batch_rows=5
+    )
+    assert result.rows == len(expected)
+    assert result.metrics == compute_session_metrics(expected)
+
+    files = list((tmp_path / "parquet").rglob("*.parquet"))
+    assert len(files) == 1
+    assert pq.ParquetFile(files[0]).metadata.num_row_groups > 1
+    stored = store.read_session("endurance").drop(columns=["session_id", "track"])
+    expected = expected.drop(columns=["session_id", "track"])
+    pd.testing.assert_frame_equal(stored, expected, check_dtype=False)
+
+
+def test_parallel_normalization_matches_serial(tmp_path: Path) -> None:
+    sample = pd.read_csv("data/samples/barber-motorsports-park.csv")
+    zip_path = tmp_path / "per-car.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for car_id, car_df in sample.groupby("car"):
+            zf.writestr(f"{car_id}.csv", car_df.to_csv(index=False))
+    members = list_zip_members(zip_path)
+    serial = normalize_files(members, session_id="s", track="Barber")
+    with IngestProfiler() as profiler:
+        parallel = normalize_files(members, session_id="s", track="Barber", workers=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+    # Per-file stages run in the worker processes and are merged back.
+    for stage in ("normalize.read_file", "normalize.timestamp", "normalize.coerce"):
+        assert profiler.stages[stage].calls == len(members)
+    assert profiler.stages["normalize.coerce"].rows_out == len(sample)
+
+
+def test_store_manifest_tracks_writes_and_external_changes(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    df = normalize_files([csv_path], session_id="s1", track="Barber")
+    root = tmp_path / "parquet"
+    store = ParquetStore(root=root, partition_cols=["session_id", "track"])
+    assert store.read_session("s1").empty
+
+    store.write_session(df)
+    assert len(store.read_session("s1")) == len(df)
+    assert (root / "_meta" / "manifest.json").exists()
+
+    # Another process copies a session in; only that session's directories are re-listed.
+    external = root / "session_id=s2" / "track=Barber"
+    external.mkdir(parents=True)
+    source = next((root / "session_id=s1" / "track=Barber").glob("*.parquet"))
+    (external / "copy.parquet").write_bytes(source.read_bytes())
+    assert len(store.read_session("s2")) == len(df)
+
+    reopened = ParquetStore(root=root, partition_cols=["session_id", "track"])
+    assert sorted(reopened.manifest.all_files()) == sorted(store.manifest.all_files())
+    assert len(reopened.read_session("s2", track="Barber")) == len(df)
+
+
+def test_session_reads_span_tracks_and_skip_other_sessions(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    store = ParquetStore(root=tmp_path / "parquet", partition_cols=["session_id", "track"])
+    for session_id, track in [("s1", "Barber"), ("s1", "Sonoma"), ("s2", "Barber")]:
+        store.write_session(normalize_files([csv_path], session_id=session_id, track=track))
+
+    both_tracks = store.read_session("s1")
+    assert set(both_tracks["track"]) == {"Barber", "Sonoma"}
+    assert set(both_tracks["session_id"]) == {"s1"}
+    assert set(store.read_session("s1", track="Sonoma")["track"]) == {"Sonoma"}
+
+    # Reading s1 must not depend on s2's files being readable.
+    for path in (tmp_path / "parquet" / "session_id=s2").rglob("*.parquet"):
+        path.write_bytes(b"not parquet")
+    assert len(store.read_session("s1")) == len(both_tracks)
+
+
+def test_scan_laps_pages_sorted_row_groups(tmp_path: Path) -> None:
+    sample = pd.read_csv("data/samples/barber-motorsports-park.csv")
+    frames = [sample.assign(car=f"GR{idx}", lap_number=sample["lap_number"] + idx) for idx in range(6)]
+    raw_path = tmp_path / "telemetry.csv"
+    pd.concat(frames).sample(frac=1, random_state=3).to_csv(raw_path, index=False)
+    df = normalize_files([raw_path], session_id="s1", track="Barber")
+
+    store = ParquetStore(
+        root=tmp_path / "parquet", partition_cols=["session_id", "track"], row_group_size=7
+    )
+    store.write_session(df)
+    files = store.manifest.files(session_id="s1")
+    assert len(files) == 1
+    assert pq.ParquetFile(files[0]).metadata.num_row_groups > 10
+
+    full = store.read_session("s1").sort_values(SORT_KEYS, ignore_index=True)
+    for car_id in (None, "GR0", "GR3", "GR5", "GR9"):
+        expected = full if car_id is None else full[full["car_id"] == car_id]
+        expected = expected.reset_index(drop=True)
+        for offset, limit in [(0, 5), (3, 11), (20, 50), (len(full) - 2, 10)]:
+            page = store.scan_laps("s1", car_id=car_id, offset=offset, limit=limit)
+            window = expected.iloc[offset : offset + limit].reset_index(drop=True)
+            if window.empty:
+                assert page.empty
+                continue
+            pd.testing.assert_frame_equal(
+                page.reset_index(drop=True)[window.columns], window, check_categorical=False
+            )
+
+    columns = ["track", "t_ms", "speed_kph"]
+    page = store.scan_laps("s1", car_id="GR3", offset=3, limit=11, columns=columns)
+    assert list(page.columns) == columns
+    expected = full[full["car_id"] == "GR3"].iloc[3:14][columns].reset_index(drop=True)
+    pd.testing.assert_frame_equal(page.reset_index(drop=True), expected, check_categorical=False)
+
+
+def test_scan_laps_cursor_walks_every_row_once(tmp_path: Path) -> None:
+    sample = pd.read_csv("data/samples/barber-motorsports-park.csv")
+    # GR0 is duplicated so several rows share the same sort key.
+    frames = [sample.assign(car=f"GR{idx}") for idx in range(4)] + [sample.assign(car="GR0")]
+    raw_path = tmp_path / "telemetry.csv"
+    pd.concat(frames).to_csv(raw_path, index=False)
+    store = ParquetStore(
+        root=tmp_path / "parquet", partition_cols=["session_id", "track"], row_group_size=7
+    )
+    store.write_session(normalize_files([raw_path], session_id="single", track="Barber"))
+    for track in ("Barber", "Sonoma"):
+        store.write_session(normalize_files([raw_path], session_id="multi", track=track))
+
+    for session_id in ("single", "multi"):
+        for car_id in (None, "GR0", "GR2"):
+            expected = store.scan_laps(session_id, car_id=car_id, limit=10_000)
+            pages, after = [], None
+            while True:
+                page = store.scan_laps(session_id, car_id=car_id, limit=5, after=after)
+                if page.empty:
+                    break
+                pages.append(page)
+                after = LapCursor.after_page(page, after)
+                after = LapCursor.decode(after.encode())
+            walked = pd.concat(pages, ignore_index=True)
+            columns = SORT_KEYS + ["track", "speed_kph"]
+            pd.testing.assert_frame_equal(
+                walked[columns].astype(str), expected[columns].astype(str)
+            )
+
+
+def test_reingest_replaces_partition_and_compaction_merges_files(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    df = normalize_files([csv_path], session_id="s1", track="Barber")
+    store = ParquetStore(root=tmp_path / "parquet", partition_cols=["session_id", "track"])
+    partition_dir = store.partition_dir({"session_id": "s1", "track": "Barber"})
+    for _ in range(3):
+        store.write_session(df)
+        assert len(list(partition_dir.glob("*.parquet"))) == 1
+        assert len(store.read_session("s1")) == len(df)
+
+    # Legacy layout: several unsorted files written straight into the partition.
+    legacy_dir = store.partition_dir({"session_id": "s2", "track": "Barber"})
+    legacy_dir.mkdir(parents=True)
+    shuffled = df.drop(columns=["session_id", "track"]).sample(frac=1, random_state=0)
+    for idx, start in enumerate(range(0, len(shuffled), 10)):
+        chunk = pa.Table.from_pandas(shuffled.iloc[start : start + 10], preserve_index=False)
+        pq.write_table(chunk, legacy_dir / f"{idx}.parquet")
+    assert len(store.read_session("s2")) == len(df)
+
+    assert store.compact() == 1
+    files = list(legacy_dir.glob("*.parquet"))
+    assert len(files) == 1
+    assert pq.ParquetFile(files[0]).metadata.row_group(0).sorting_columns
+    compacted = store.read_session("s2").drop(columns=["session_id", "track"])
+    expected = df.drop(columns=["session_id", "track"])
+    pd.testing.assert_frame_equal(compacted, expected, check_dtype=False)
+    assert store.compact() == 0
+    assert store._locks == {}
+
+    # A compaction racing a newer write must not publish over it.
+    stale = store.manifest.files(session_id="s1")
+    store.write_session(df)
+    with store.partition_writer(
+        {"session_id": "s1", "track": "Barber"}, replaces=[path.name for path in stale]
+    ) as writer:
+        writer.write(df.iloc[:3])
+    assert writer.path is None
+    assert len(store.read_session("s1")) == len(df)
+
+
+def test_table_cache_serves_reads_within_budget(tmp_path: Path) -> None:
+    csv_path = Path("data/samples/barber-motorsports-park.csv").resolve()
+    df = normalize_files([csv_path], session_id="s1", track="Barber")
+    cache = TableCache(max_bytes=1 << 20)
+    store = ParquetStore(
+        root=tmp_path / "parquet", partition_cols=["session_id", "track"], table_cache=cache
+    )
+    store.write_session(df)
+    store.write_session(df.assign(session_id="s2"))
+
+    uncached = ParquetStore(root=tmp_path / "parquet", partition_cols=["session_id", "track"])
+    filters = [("car_id", "eq", "GR21"), ("lap", "ge", 2)]
+    for columns in (None, ["t_ms", "speed_kph"]):
+        expected = uncached.read_session("s1", columns=columns, filters=filters)
+        for _ in range(2):
+            cached = store.read_session("s1", columns=columns, filters=filters)
+            pd.testing.assert_frame_equal(cached, expected, check_categorical=False)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 2, 2)
+
+    store.write_session(df.assign(speed_kph=1.0))
+    assert cache.stats()["entries"] == 0
+    assert (store.read_session("s1")["speed_kph"] == 1.0).all()
+
+    small = TableCache(max_bytes=1 << 20)
+    store.table_cache = small
+    store.read_session("s1", columns=["t_ms"])
+    small.max_bytes = small.stats()["bytes"] * 5 // 2
+    store.read_session("s2", columns=["t_ms"])
+    store.read_session("s1", columns=["t_ms", "lap"])
+    assert small.stats()["evictions"] >= 1
+    assert small.stats()["bytes"] <= small.max_bytes
+
+
+def test_profile_total_counts_nested_stages_once() -> None:
+    with IngestProfiler() as profiler:
+        with profile_stage("outer"):
+            with profile_stage("inner"):
+                sum(range(200_000))
+    stages = {stats.stage: stats for stats in profiler.stages.values()}
+    total_wall = float(profiler.format_table().splitlines()[-1].split()[1])
+    assert total_wall == pytest.approx(stages["outer"].wall_s, abs=1e-3)
+    assert total_wall < stages["outer"].wall_s + stages["inner"].wall_s
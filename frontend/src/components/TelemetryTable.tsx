@@ -6,9 +6,17 @@ interface TelemetryTableProps {
   laps: LapResponse | undefined;
   selectedCar: string | undefined;
   onCarChange: (carId: string | undefined) => void;
+  onLoadMore?: () => void;
+  loadingMore?: boolean;
 }
 
-const TelemetryTable = ({ laps, selectedCar, onCarChange }: TelemetryTableProps) => {
+const TelemetryTable = ({
+  laps,
+  selectedCar,
+  onCarChange,
+  onLoadMore,
+  loadingMore = false
+}: TelemetryTableProps) => {
   const cars = useMemo(() => {
     if (!laps) {
       return [];
@@ -69,6 +77,16 @@ const TelemetryTable = ({ laps, selectedCar, onCarChange }: TelemetryTableProps)
           </tbody>
         </table>
       </div>
+      {onLoadMore && (
+        <button
+          type="button"
+          onClick={onLoadMore}
+          disabled={loadingMore}
+          style={{ marginTop: '1rem', padding: '0.4rem 0.8rem', borderRadius: '0.4rem' }}
+        >
+          {loadingMore ? 'Loading…' : 'Load more frames'}
+        </button>
+      )}
     </section>
   );
 };
@@ -1,8 +1,8 @@
 import axios from 'axios';
 
 import {
+  IngestJob,
   LapResponse,
-  SessionIngestResponse,
   SessionSummary,
   StrategyResponse,
   TrainingComparisonRequest,
@@ -16,23 +16,29 @@ const api = axios.create({
 export const ingestSession = async (
   sessionId: string,
   zipPath: string
-): Promise<SessionIngestResponse> => {
-  const { data } = await api.post<SessionIngestResponse>(
-    `/api/sessions/${sessionId}/ingest`,
-    { zip_path: zipPath }
-  );
+): Promise<IngestJob> => {
+  const { data } = await api.post<IngestJob>(`/api/sessions/${sessionId}/ingest`, {
+    zip_path: zipPath
+  });
+  return data;
+};
+
+export const fetchIngestJob = async (jobId: string): Promise<IngestJob> => {
+  const { data } = await api.get<IngestJob>(`/api/jobs/${jobId}`);
   return data;
 };
 
 export const fetchLapData = async (
   sessionId: string,
   carId?: string,
-  limit = 500
+  limit = 500,
+  cursor?: string
 ): Promise<LapResponse> => {
   const { data } = await api.get<LapResponse>(`/api/sessions/${sessionId}/laps`, {
     params: {
       car_id: carId,
-      limit
+      limit,
+      cursor
     }
   });
   return data;
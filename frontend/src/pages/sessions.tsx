@@ -1,5 +1,5 @@
-import { useQuery } from '@tanstack/react-query';
-import { useState } from 'react';
+import { useInfiniteQuery, useQuery } from '@tanstack/react-query';
+import { useMemo, useState } from 'react';
 
 import Charts from '@/components/Charts';
 import StrategyPanel from '@/components/StrategyPanel';
@@ -17,12 +17,25 @@ const SessionsPage = () => {
     enabled: Boolean(sessionId)
   });
 
-  const lapsQuery = useQuery<LapResponse, Error>({
+  const lapsQuery = useInfiniteQuery({
     queryKey: ['laps', sessionId, selectedCar],
-    queryFn: () => fetchLapData(sessionId, selectedCar),
+    queryFn: ({ pageParam }) => fetchLapData(sessionId, selectedCar, 500, pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage: LapResponse) => lastPage.next_cursor ?? undefined,
     enabled: Boolean(sessionId)
   });
 
+  // Pages are fetched by cursor, so scrolling deeper never re-reads earlier rows.
+  const laps = useMemo<LapResponse | undefined>(() => {
+    const pages = lapsQuery.data?.pages;
+    if (!pages || !pages.length) {
+      return undefined;
+    }
+    const data = pages.flatMap((page) => page.data);
+    const last = pages[pages.length - 1];
+    return { ...last, data, total: data.length, offset: 0 };
+  }, [lapsQuery.data]);
+
   return (
     <div style={{ display: 'grid', gap: '1.5rem' }}>
       <section style={{ display: 'flex', gap: '1rem', flexWrap: 'wrap', alignItems: 'center' }}>
@@ -42,17 +55,19 @@ const SessionsPage = () => {
           />
         </label>
         <span style={{ color: 'var(--muted)' }}>
-          {lapsQuery.isFetching ? 'Loading telemetry…' : lapsQuery.data ? `${lapsQuery.data.total} frames loaded` : ''}
+          {lapsQuery.isFetching ? 'Loading telemetry…' : laps ? `${laps.total} frames loaded` : ''}
         </span>
       </section>
 
       <TelemetryTable
-        laps={lapsQuery.data}
+        laps={laps}
         selectedCar={selectedCar}
         onCarChange={setSelectedCar}
+        onLoadMore={lapsQuery.hasNextPage ? () => lapsQuery.fetchNextPage() : undefined}
+        loadingMore={lapsQuery.isFetchingNextPage}
       />
 
-      <Charts laps={lapsQuery.data} summary={summaryQuery.data} />
+      <Charts laps={laps} summary={summaryQuery.data} />
 
       {sessionId && <StrategyPanel sessionId={sessionId} />}
     </div>
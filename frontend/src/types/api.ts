@@ -20,6 +20,7 @@ export interface LapResponse {
   total: number;
   offset: number;
   limit: number;
+  next_cursor?: string | null;
 }
 
 export interface SessionSummary {
@@ -34,10 +35,19 @@ export interface SessionSummary {
   }>;
 }
 
-export interface SessionIngestResponse {
+export interface IngestJob {
+  job_id: string;
   session_id: string;
   track: string;
-  metrics: SessionSummary;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  stage: string | null;
+  rows_processed: number;
+  attempts: number;
+  created_at: number;
+  started_at: number | null;
+  finished_at: number | null;
+  error: string | null;
+  metrics: SessionSummary | null;
 }
 
 export interface StrategyResponse {
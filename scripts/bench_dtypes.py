@@ -0,0 +1,87 @@
+"""Benchmark memory and Parquet footprint of the compact telemetry schema.
+
+Builds a synthetic normalized session with the legacy dtypes (object strings,
+Int64 and float64 everywhere) and compares it with the same data cast through
+``apply_canonical_dtypes``. Run from the repository root::
+
+    python -m scripts.bench_dtypes --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import io
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from backend.app.dataio.normalize import CANONICAL_COLUMNS, apply_canonical_dtypes
+
+
+def build_legacy_frame(rows: int, cars: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    car_ids = np.array([f"GR{idx:02d}" for idx in range(cars)])
+    df = pd.DataFrame(
+        {
+            "session_id": "endurance_24h",
+            "track": "Barber Motorsports Park",
+            "event_date": date(2025, 4, 20),
+            "car_id": car_ids[rng.integers(0, cars, size=rows)],
+            "lap": pd.array(rng.integers(1, 800, size=rows), dtype="Int64"),
+            "sector": pd.array(rng.integers(1, 4, size=rows), dtype="Int64"),
+            "t_ms": pd.array(np.arange(rows, dtype=np.int64) * 20, dtype="Int64"),
+            "lap_time_s": rng.uniform(85, 95, size=rows),
+            "speed_kph": rng.uniform(60, 220, size=rows),
+            "throttle": rng.uniform(0, 100, size=rows),
+            "brake": rng.uniform(0, 100, size=rows),
+            "gear": pd.array(rng.integers(1, 7, size=rows), dtype="Int64"),
+            "tire_set": rng.choice(["S1", "S2", "S3", "S4"], size=rows),
+            "track_temp_c": rng.uniform(30, 40, size=rows),
+            "air_temp_c": rng.uniform(20, 30, size=rows),
+            "flag_state": rng.choice(["green", "yellow", "sc"], size=rows, p=[0.9, 0.08, 0.02]),
+        }
+    )
+    return df[CANONICAL_COLUMNS]
+
+
+def parquet_bytes(df: pd.DataFrame) -> int:
+    buffer = io.BytesIO()
+    # session_id/track live in the partition path, not in the files.
+    table = pa.Table.from_pandas(df.drop(columns=["session_id", "track"]), preserve_index=False)
+    pq.write_table(table, buffer)
+    return buffer.getbuffer().nbytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cars", type=int, default=40)
+    args = parser.parse_args()
+
+    legacy = build_legacy_frame(args.rows, args.cars)
+    compact = apply_canonical_dtypes(legacy.copy())
+
+    legacy_mem = legacy.memory_usage(deep=True, index=False)
+    compact_mem = compact.memory_usage(deep=True, index=False)
+    print(f"{'column':>14} {'legacy MB':>10} {'compact MB':>11} {'dtype':>10}")
+    for column in CANONICAL_COLUMNS:
+        print(
+            f"{column:>14} {legacy_mem[column] / 1e6:>10.1f} "
+            f"{compact_mem[column] / 1e6:>11.1f} {str(compact[column].dtype):>10}"
+        )
+    print(
+        f"{'in-memory':>14} {legacy_mem.sum() / 1e6:>10.1f} {compact_mem.sum() / 1e6:>11.1f}"
+        f"   {legacy_mem.sum() / compact_mem.sum():.1f}x smaller"
+    )
+    legacy_file = parquet_bytes(legacy)
+    compact_file = parquet_bytes(compact)
+    print(
+        f"{'parquet':>14} {legacy_file / 1e6:>10.1f} {compact_file / 1e6:>11.1f}"
+        f"   {legacy_file / compact_file:.1f}x smaller"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark encoding a laps page with pydantic models versus columnar orjson.
+
+Times the two sides of ``GET /api/sessions/{id}/laps`` on a synthetic page:
+a cache miss (build the response from a DataFrame) and a cache hit (turn the
+cached payload back into a response body). Run from the repository root::
+
+    python -m scripts.bench_lap_page --rows 5000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi import Response
+
+from backend.app import schemas
+from backend.app.dataio.normalize import CANONICAL_COLUMNS, apply_canonical_dtypes
+from backend.app.serialization import LAP_FRAME_FIELDS, encode_lap_page
+
+
+def build_page(rows: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "session_id": "bench",
+            "track": "Barber",
+            "event_date": pd.Timestamp("2025-04-20").date(),
+            "car_id": "GR21",
+            "lap": np.repeat(np.arange(1, rows // 30 + 2), 30)[:rows],
+            "sector": np.tile([1, 2, 3], rows // 3 + 1)[:rows],
+            "t_ms": np.arange(rows, dtype=np.int64) * 100,
+            "lap_time_s": rng.uniform(85, 95, size=rows),
+            "speed_kph": rng.uniform(60, 220, size=rows),
+            "throttle": rng.uniform(0, 100, size=rows),
+            "brake": rng.uniform(0, 100, size=rows),
+            "gear": rng.integers(1, 7, size=rows),
+            "tire_set": "S1",
+            "track_temp_c": 35.0,
+            "air_temp_c": 24.0,
+            "flag_state": "green",
+        }
+    )
+    return apply_canonical_dtypes(df[CANONICAL_COLUMNS])
+
+
+def pydantic_miss(df: pd.DataFrame) -> str:
+    frames = [
+        schemas.TelemetryFrame(**{field: row[field] for field in LAP_FRAME_FIELDS})
+        for row in df.to_dict("records")
+    ]
+    return schemas.LapResponse(
+        session_id="bench", track="Barber", data=frames, total=len(df), offset=0, limit=len(df)
+    ).json()
+
+
+def pydantic_hit(cached: str) -> bytes:
+    response = schemas.LapResponse(**orjson.loads(cached))
+    return response.json().encode()
+
+
+def bytes_hit(cached: bytes) -> Response:
+    return Response(content=cached, media_type="application/json")
+
+
+def columnar_miss(df: pd.DataFrame) -> bytes:
+    return encode_lap_page(
+        df, session_id="bench", track="Barber", offset=0, limit=len(df), next_cursor=None
+    )
+
+
+def best_ms(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5, help="Report the best of N runs")
+    args = parser.parse_args()
+
+    df = build_page(args.rows)
+    cached = columnar_miss(df)
+    results = [
+        (
+            "miss",
+            best_ms(lambda: pydantic_miss(df), args.repeat),
+            best_ms(lambda: columnar_miss(df), args.repeat),
+        ),
+        (
+            "hit",
+            best_ms(lambda: pydantic_hit(cached.decode()), args.repeat),
+            best_ms(lambda: bytes_hit(cached), args.repeat),
+        ),
+    ]
+    print(f"{'path':>5} {'pydantic ms':>12} {'new ms':>10} {'speedup':>8}   ({args.rows:,} rows)")
+    for path, before, after in results:
+        print(f"{path:>5} {before:>12.2f} {after:>10.3f} {before / max(after, 1e-6):>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark payload size and encode/decode time of the telemetry response formats.
+
+Encodes one synthetic session as row JSON, columnar JSON and an Arrow IPC
+stream with the same helpers the laps endpoint uses, and decodes each the way a
+client would. Run from the repository root::
+
+    python -m scripts.bench_response_formats --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+
+import orjson
+import pyarrow as pa
+
+from backend.app.serialization import ARROW_STREAM, COLUMNS_JSON, JSON, encode_lap_page
+
+from .bench_lap_page import best_ms, build_page
+
+DECODERS = {
+    JSON: orjson.loads,
+    COLUMNS_JSON: orjson.loads,
+    ARROW_STREAM: lambda body: pa.ipc.open_stream(body).read_all(),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3, help="Report the best of N runs")
+    args = parser.parse_args()
+
+    df = build_page(args.rows)
+    print(f"{'format':>36} {'MB':>8} {'encode ms':>10} {'decode ms':>10}   ({args.rows:,} rows)")
+    for media_type, decode in DECODERS.items():
+
+        def encode(media_type: str = media_type) -> bytes:
+            return encode_lap_page(
+                df,
+                session_id="bench",
+                track="Barber",
+                offset=0,
+                limit=len(df),
+                next_cursor=None,
+                media_type=media_type,
+            )
+
+        body = encode()
+        encode_ms = best_ms(encode, args.repeat)
+        decode_ms = best_ms(lambda: decode(body), args.repeat)
+        print(f"{media_type:>36} {len(body) / 1e6:>8.1f} {encode_ms:>10.1f} {decode_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
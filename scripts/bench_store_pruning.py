@@ -0,0 +1,97 @@
+"""Benchmark session read latency as the Parquet store fills up.
+
+Writes synthetic sessions into a temporary store and times
+``ParquetStore.read_session`` for one of them at several store sizes, next to a
+read through ``ds.dataset(root)`` that discovers and filters the whole tree.
+Run from the repository root::
+
+    python -m scripts.bench_store_pruning --sessions 10 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+
+from backend.app.dataio.normalize import CANONICAL_COLUMNS, apply_canonical_dtypes
+from backend.app.dataio.parquet_store import ParquetStore
+
+DEFAULT_SESSIONS = [10, 100, 1000]
+TRACKS = ["Barber", "Sonoma", "Road America"]
+
+
+def build_session(session_id: str, track: str, rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "session_id": session_id,
+            "track": track,
+            "event_date": pd.Timestamp("2025-04-20").date(),
+            "car_id": rng.choice(["GR21", "GR22", "GR86"], size=rows),
+            "lap": np.repeat(np.arange(1, rows // 30 + 2), 30)[:rows],
+            "sector": np.tile([1, 2, 3], rows // 3 + 1)[:rows],
+            "t_ms": np.arange(rows, dtype=np.int64) * 100,
+            "lap_time_s": rng.uniform(85, 95, size=rows),
+            "speed_kph": rng.uniform(60, 220, size=rows),
+            "throttle": rng.uniform(0, 100, size=rows),
+            "brake": rng.uniform(0, 100, size=rows),
+            "gear": rng.integers(1, 7, size=rows),
+            "tire_set": "S1",
+            "track_temp_c": 35.0,
+            "air_temp_c": 24.0,
+            "flag_state": "green",
+        }
+    )
+    return apply_canonical_dtypes(df[CANONICAL_COLUMNS])
+
+
+def _best(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=DEFAULT_SESSIONS)
+    parser.add_argument("--rows", type=int, default=600, help="Rows per synthetic session")
+    parser.add_argument("--repeat", type=int, default=5, help="Report the best of N reads")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    target = "session_00000"
+    print(f"{'sessions':>9} {'store ms':>10} {'full scan ms':>13} {'rows':>7}")
+    with tempfile.TemporaryDirectory(prefix="bench-store-") as tmp:
+        root = Path(tmp) / "parquet"
+        store = ParquetStore(root=root, partition_cols=["session_id", "track"])
+        written = 0
+        for sessions in sorted(args.sessions):
+            for idx in range(written, sessions):
+                session_id = f"session_{idx:05d}"
+                track = TRACKS[idx % len(TRACKS)]
+                with store.partition_writer({"session_id": session_id, "track": track}) as writer:
+                    writer.write(build_session(session_id, track, args.rows, rng))
+            written = sessions
+
+            # A fresh store per size so the timing includes loading the manifest.
+            reader = ParquetStore(root=root, partition_cols=["session_id", "track"])
+            rows = len(reader.read_session(target))
+            store_s = _best(lambda: reader.read_session(target), args.repeat)
+
+            def full_scan() -> None:
+                dataset = ds.dataset(root, format="parquet", partitioning=store.partitioning)
+                dataset.to_table(filter=ds.field("session_id") == target)
+
+            full_s = _best(full_scan, args.repeat)
+            print(f"{sessions:>9,} {store_s * 1e3:>10.2f} {full_s * 1e3:>13.2f} {rows:>7,}")
+
+
+if __name__ == "__main__":
+    main()